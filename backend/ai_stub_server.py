@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+로컬 AI 서비스 스텁 서버 (HTTP AI 제공자 테스트용)
+
+HTTPAIProvider 가 호출하는 POST /v1/analyze/batch 를 구현하며,
+결과는 내부 템플릿 분석과 동일하게 계산합니다. 지연/실패율을 주어
+타임아웃, 재시도, 회로 차단, 묶음 전송 동작을 확인할 수 있습니다.
+
+사용법:
+    python ai_stub_server.py --port 8001 --latency-ms 200
+    python ai_stub_server.py --port 8001 --fail-rate 0.3
+    AI_PROVIDER=http AI_SERVICE_URL=http://localhost:8001 uvicorn app.main:app
+"""
+import os
+import sys
+import asyncio
+import random
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+
+from app.services.ai_provider import TemplateAIProvider
+
+def create_stub_app(latency_ms: int = 0, fail_rate: float = 0.0) -> FastAPI:
+    """지연(호출당)과 실패율(503)을 가진 스텁 앱"""
+    app = FastAPI(title="Good Hands AI stub")
+    template = TemplateAIProvider()
+    app.state.stats = {"calls": 0, "sessions": 0, "failures": 0}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok", **app.state.stats}
+
+    @app.post("/v1/analyze/batch")
+    async def analyze_batch(request: Request):
+        body = await request.json()
+        app.state.stats["calls"] += 1
+
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        if fail_rate and random.random() < fail_rate:
+            app.state.stats["failures"] += 1
+            raise HTTPException(status_code=503, detail="stub failure")
+
+        requests = body["requests"]
+        app.state.stats["sessions"] += len(requests)
+        return {"results": [template.analyze_sync(item) for item in requests]}
+
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 AI 서비스 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=int, default=0, help="호출당 응답 지연")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    args = parser.parse_args()
+
+    uvicorn.run(create_stub_app(args.latency_ms, args.fail_rate), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
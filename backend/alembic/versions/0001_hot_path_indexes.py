@@ -0,0 +1,61 @@
+"""hot path composite indexes
+
+Revision ID: 0001_hot_path_indexes
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_hot_path_indexes'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼, unique)
+INDEXES = [
+    ("idx_care_sessions_caregiver_created", "care_sessions", ["caregiver_id", "created_at"], False),
+    ("idx_care_sessions_senior_start", "care_sessions", ["senior_id", "start_time"], False),
+    ("idx_ai_reports_session_id", "ai_reports", ["care_session_id"], False),
+    ("idx_notifications_receiver_unread", "notifications", ["receiver_id", "is_read", sa.text("created_at DESC")], False),
+    ("idx_checklist_responses_session_id", "checklist_responses", ["care_session_id"], False),
+    ("idx_care_notes_session_id", "care_notes", ["care_session_id"], False),
+    ("uq_weekly_scores_senior_week", "weekly_checklist_scores", ["senior_id", "week_start_date"], True),
+    ("idx_special_notes_senior_created", "special_notes", ["senior_id", "created_at"], False),
+    ("idx_seniors_caregiver_id", "seniors", ["caregiver_id"], False),
+    ("idx_seniors_guardian_id", "seniors", ["guardian_id"], False),
+]
+
+
+def _remove_duplicate_weekly_scores() -> None:
+    """유니크 인덱스 생성 전 (senior_id, week_start_date) 중복 행 정리 (최신 행만 유지)"""
+    op.execute(
+        "DELETE FROM weekly_checklist_scores WHERE id NOT IN ("
+        "SELECT MAX(id) FROM weekly_checklist_scores GROUP BY senior_id, week_start_date)"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _remove_duplicate_weekly_scores()
+
+    # PostgreSQL은 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    if is_postgresql:
+        with op.get_context().autocommit_block():
+            for name, table, columns, unique in INDEXES:
+                op.create_index(name, table, columns, unique=unique, if_not_exists=True, postgresql_concurrently=True)
+    else:
+        for name, table, columns, unique in INDEXES:
+            op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
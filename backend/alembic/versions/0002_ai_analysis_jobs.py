@@ -0,0 +1,44 @@
+"""ai analysis job queue table
+
+Revision ID: 0002_ai_analysis_jobs
+Revises: 0001_hot_path_indexes
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_ai_analysis_jobs'
+down_revision: Union[str, Sequence[str], None] = '0001_hot_path_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    if sa.inspect(op.get_bind()).has_table("ai_analysis_jobs"):
+        return
+
+    op.create_table(
+        "ai_analysis_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("care_session_id", sa.Integer(), sa.ForeignKey("care_sessions.id"), nullable=False),
+        sa.Column("status", sa.String(20)),
+        sa.Column("attempts", sa.Integer()),
+        sa.Column("error", sa.Text()),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index("ix_ai_analysis_jobs_id", "ai_analysis_jobs", ["id"])
+    op.create_index("idx_ai_analysis_jobs_status", "ai_analysis_jobs", ["status", "id"])
+    op.create_index("idx_ai_analysis_jobs_session_id", "ai_analysis_jobs", ["care_session_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("ai_analysis_jobs")
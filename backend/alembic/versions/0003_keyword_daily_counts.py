@@ -0,0 +1,46 @@
+"""keyword daily counter table
+
+Revision ID: 0003_keyword_daily_counts
+Revises: 0002_ai_analysis_jobs
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_keyword_daily_counts'
+down_revision: Union[str, Sequence[str], None] = '0002_ai_analysis_jobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    if sa.inspect(op.get_bind()).has_table("keyword_daily_counts"):
+        return
+
+    op.create_table(
+        "keyword_daily_counts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("nursing_home_id", sa.Integer(), nullable=False),
+        sa.Column("keyword", sa.String(50), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_keyword_daily_counts_id", "keyword_daily_counts", ["id"])
+    op.create_index(
+        "uq_keyword_daily_counts_day_home_keyword", "keyword_daily_counts",
+        ["day", "nursing_home_id", "keyword"], unique=True
+    )
+    op.create_index("idx_keyword_daily_counts_home_day", "keyword_daily_counts", ["nursing_home_id", "day"])
+    # 기존 리포트 키워드 집계는 python rebuild_keyword_counts.py 로 채움
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("keyword_daily_counts")
@@ -0,0 +1,35 @@
+"""ai report input fingerprint column
+
+Revision ID: 0004_ai_report_input_fingerprint
+Revises: 0003_keyword_daily_counts
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_ai_report_input_fingerprint'
+down_revision: Union[str, Sequence[str], None] = '0003_keyword_daily_counts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("ai_reports")}
+    if "input_fingerprint" in columns:
+        return
+
+    # 기존 리포트는 지문이 없으므로 다음 분석 시 한 번 재계산됨
+    op.add_column("ai_reports", sa.Column("input_fingerprint", sa.String(64)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("ai_reports") as batch_op:
+        batch_op.drop_column("input_fingerprint")
@@ -0,0 +1,54 @@
+"""trend running statistics table
+
+Revision ID: 0005_trend_statistics
+Revises: 0004_ai_report_input_fingerprint
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_trend_statistics'
+down_revision: Union[str, Sequence[str], None] = '0004_ai_report_input_fingerprint'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    if sa.inspect(op.get_bind()).has_table("trend_statistics"):
+        return
+
+    op.create_table(
+        "trend_statistics",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("senior_id", sa.Integer(), sa.ForeignKey("seniors.id"), nullable=False),
+        sa.Column("category", sa.String(20), nullable=False),
+        sa.Column("window_start", sa.Date(), nullable=False),
+        sa.Column("n", sa.Integer(), nullable=False),
+        sa.Column("sum_x", sa.Float(), nullable=False),
+        sa.Column("sum_y", sa.Float(), nullable=False),
+        sa.Column("sum_xy", sa.Float(), nullable=False),
+        sa.Column("sum_xx", sa.Float(), nullable=False),
+        sa.Column("first_value", sa.Float()),
+        sa.Column("last_week", sa.Date()),
+        sa.Column("last_value", sa.Float()),
+        sa.Column("ewma", sa.Float()),
+        sa.Column("ewma_prev", sa.Float()),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index("ix_trend_statistics_id", "trend_statistics", ["id"])
+    op.create_index(
+        "uq_trend_statistics_senior_category", "trend_statistics", ["senior_id", "category"], unique=True
+    )
+    # 통계는 첫 조회/주간 점수 갱신 시 주간 점수로부터 채워짐
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("trend_statistics")
@@ -0,0 +1,40 @@
+"""health trend analysis snapshot watermark
+
+Revision ID: 0006_health_trend_snapshot
+Revises: 0005_trend_statistics
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_health_trend_snapshot'
+down_revision: Union[str, Sequence[str], None] = '0005_trend_statistics'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    # create_all 로 이미 생성된 DB는 건너뜀
+    columns = {column["name"] for column in inspector.get_columns("health_trend_analysis")}
+    if "source_watermark" not in columns:
+        # 기존 행은 워터마크가 없으므로 다음 조회 시 한 번 재계산됨
+        op.add_column("health_trend_analysis", sa.Column("source_watermark", sa.String(100)))
+
+    indexes = {index["name"] for index in inspector.get_indexes("health_trend_analysis")}
+    if "idx_health_trend_senior_date" not in indexes:
+        op.create_index("idx_health_trend_senior_date", "health_trend_analysis", ["senior_id", "analysis_date"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_health_trend_senior_date", table_name="health_trend_analysis")
+    with op.batch_alter_table("health_trend_analysis") as batch_op:
+        batch_op.drop_column("source_watermark")
@@ -0,0 +1,44 @@
+"""one health trend analysis row per senior and day
+
+Revision ID: 0007_health_trend_unique_day
+Revises: 0006_health_trend_snapshot
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_health_trend_unique_day'
+down_revision: Union[str, Sequence[str], None] = '0006_health_trend_snapshot'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    indexes = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("health_trend_analysis")}
+
+    # create_all 로 이미 생성된 DB는 건너뜀
+    if "uq_health_trend_senior_date" not in indexes:
+        # 동시 조회로 같은 날 중복 생성된 행은 가장 최근 행만 남김
+        op.execute(
+            "DELETE FROM health_trend_analysis WHERE id NOT IN ("
+            "SELECT MAX(id) FROM health_trend_analysis GROUP BY senior_id, analysis_date)"
+        )
+        op.create_index(
+            "uq_health_trend_senior_date", "health_trend_analysis", ["senior_id", "analysis_date"], unique=True
+        )
+
+    # 0006 의 일반 인덱스는 고유 인덱스로 대체
+    if "idx_health_trend_senior_date" in indexes:
+        op.drop_index("idx_health_trend_senior_date", table_name="health_trend_analysis")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_health_trend_senior_date", table_name="health_trend_analysis")
+    op.create_index("idx_health_trend_senior_date", "health_trend_analysis", ["senior_id", "analysis_date"])
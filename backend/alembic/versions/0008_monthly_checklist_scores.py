@@ -0,0 +1,48 @@
+"""monthly checklist score pre-aggregates
+
+Revision ID: 0008_monthly_checklist_scores
+Revises: 0007_health_trend_unique_day
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_monthly_checklist_scores'
+down_revision: Union[str, Sequence[str], None] = '0007_health_trend_unique_day'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    if sa.inspect(op.get_bind()).has_table("monthly_checklist_scores"):
+        return
+
+    op.create_table(
+        "monthly_checklist_scores",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("senior_id", sa.Integer(), sa.ForeignKey("seniors.id"), nullable=False),
+        sa.Column("month_start", sa.Date(), nullable=False),
+        sa.Column("total_score", sa.Integer(), nullable=False),
+        sa.Column("max_possible_score", sa.Integer(), nullable=False),
+        sa.Column("score_percentage", sa.DECIMAL(5, 2), nullable=False),
+        sa.Column("checklist_count", sa.Integer(), nullable=False),
+        sa.Column("score_breakdown", sa.JSON()),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index("ix_monthly_checklist_scores_id", "monthly_checklist_scores", ["id"])
+    op.create_index(
+        "uq_monthly_scores_senior_month", "monthly_checklist_scores", ["senior_id", "month_start"], unique=True
+    )
+    # 기존 데이터는 rebuild_weekly_scores.py 로 기간 재집계 시 채워짐
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("monthly_checklist_scores")
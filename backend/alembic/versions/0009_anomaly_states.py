@@ -0,0 +1,50 @@
+"""session score anomaly detector state
+
+Revision ID: 0009_anomaly_states
+Revises: 0008_monthly_checklist_scores
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_anomaly_states'
+down_revision: Union[str, Sequence[str], None] = '0008_monthly_checklist_scores'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    if sa.inspect(op.get_bind()).has_table("anomaly_states"):
+        return
+
+    op.create_table(
+        "anomaly_states",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("senior_id", sa.Integer(), sa.ForeignKey("seniors.id"), nullable=False),
+        sa.Column("category", sa.String(20), nullable=False),
+        sa.Column("n", sa.Integer(), nullable=False),
+        sa.Column("mean", sa.Float(), nullable=False),
+        sa.Column("variance", sa.Float(), nullable=False),
+        sa.Column("prev_mean", sa.Float()),
+        sa.Column("prev_variance", sa.Float()),
+        sa.Column("last_session_id", sa.Integer()),
+        sa.Column("last_z", sa.Float()),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index("ix_anomaly_states_id", "anomaly_states", ["id"])
+    op.create_index(
+        "uq_anomaly_states_senior_category", "anomaly_states", ["senior_id", "category"], unique=True
+    )
+    # 상태는 이후 세션 분석부터 쌓이며 anomaly_min_observations 세션 이후 감지 시작
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("anomaly_states")
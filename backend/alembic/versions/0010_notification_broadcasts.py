@@ -0,0 +1,51 @@
+"""admin notification broadcast jobs
+
+Revision ID: 0010_notification_broadcasts
+Revises: 0009_anomaly_states
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010_notification_broadcasts'
+down_revision: Union[str, Sequence[str], None] = '0009_anomaly_states'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    if sa.inspect(op.get_bind()).has_table("notification_broadcasts"):
+        return
+
+    op.create_table(
+        "notification_broadcasts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("sender_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("user_type", sa.String(20)),
+        sa.Column("type", sa.String(50), nullable=False),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("data", sa.JSON()),
+        sa.Column("status", sa.String(20)),
+        sa.Column("total_count", sa.Integer()),
+        sa.Column("sent_count", sa.Integer()),
+        sa.Column("last_user_id", sa.Integer()),
+        sa.Column("error", sa.Text()),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("started_at", sa.DateTime()),
+        sa.Column("completed_at", sa.DateTime()),
+    )
+    op.create_index("ix_notification_broadcasts_id", "notification_broadcasts", ["id"])
+    op.create_index("idx_notification_broadcasts_status", "notification_broadcasts", ["status", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("notification_broadcasts")
@@ -0,0 +1,35 @@
+"""ai report regenerate fingerprint column
+
+Revision ID: 0011_ai_report_report_fingerprint
+Revises: 0010_notification_broadcasts
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011_ai_report_report_fingerprint'
+down_revision: Union[str, Sequence[str], None] = '0010_notification_broadcasts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("ai_reports")}
+    if "report_fingerprint" in columns:
+        return
+
+    # 리포트 재생성 지문은 분석 지문(input_fingerprint)과 별도 컬럼에 저장
+    op.add_column("ai_reports", sa.Column("report_fingerprint", sa.String(64)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("ai_reports") as batch_op:
+        batch_op.drop_column("report_fingerprint")
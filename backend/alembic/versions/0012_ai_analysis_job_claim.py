@@ -0,0 +1,37 @@
+"""ai analysis job claim columns
+
+Revision ID: 0012_ai_analysis_job_claim
+Revises: 0011_ai_report_report_fingerprint
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012_ai_analysis_job_claim'
+down_revision: Union[str, Sequence[str], None] = '0011_ai_report_report_fingerprint'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("ai_analysis_jobs")}
+    if "owner" in columns:
+        return
+
+    # 작업을 가져간 워커 프로세스와 시각 (여러 프로세스가 같은 작업을 중복 실행하지 않도록 조건부 UPDATE 로 선점)
+    op.add_column("ai_analysis_jobs", sa.Column("owner", sa.String(64)))
+    op.add_column("ai_analysis_jobs", sa.Column("claimed_at", sa.DateTime()))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("ai_analysis_jobs") as batch_op:
+        batch_op.drop_column("claimed_at")
+        batch_op.drop_column("owner")
@@ -0,0 +1,36 @@
+"""weekly checklist score updated_at
+
+Revision ID: 0013_weekly_score_updated_at
+Revises: 0012_ai_analysis_job_claim
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013_weekly_score_updated_at'
+down_revision: Union[str, Sequence[str], None] = '0012_ai_analysis_job_claim'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all 로 이미 생성된 DB는 건너뜀
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("weekly_checklist_scores")}
+    if "updated_at" in columns:
+        return
+
+    # 점수 반영/재집계 시각 - 추이 분석 워터마크가 합계가 같은 변경도 감지하도록
+    # (기존 행은 NULL 로 두고 다음 갱신 때 채워짐)
+    op.add_column("weekly_checklist_scores", sa.Column("updated_at", sa.DateTime()))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("weekly_checklist_scores") as batch_op:
+        batch_op.drop_column("updated_at")
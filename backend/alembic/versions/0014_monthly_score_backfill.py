@@ -0,0 +1,59 @@
+"""monthly checklist score backfill
+
+Revision ID: 0014_monthly_score_backfill
+Revises: 0013_weekly_score_updated_at
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models import CareSession, MonthlyChecklistScore
+from app.services.weekly_rebuild import (
+    aggregate_row_values, month_start_of, next_month_start, session_score_aggregate
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0014_monthly_score_backfill'
+down_revision: Union[str, Sequence[str], None] = '0013_weekly_score_updated_at'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 0008 은 빈 테이블만 만들어 월 버킷 조회(/trend-series 12주 이상)가 비어 있었고,
+    # 그 이후 달도 배포 전 세션이 빠져 있으므로 전체 기간 월간 점수를 응답 점수로 다시 집계
+    bind = op.get_bind()
+    first, last = bind.execute(sa.select(
+        sa.func.min(CareSession.start_time), sa.func.max(CareSession.start_time)
+    )).one()
+    if first is None:
+        return
+
+    table = MonthlyChecklistScore.__table__
+    bind.execute(table.delete())
+
+    query = session_score_aggregate(
+        bind.dialect.name, "month", month_start_of(first.date()), next_month_start(last.date())
+    )
+    result = bind.execute(query.execution_options(yield_per=CHUNK_SIZE))
+    for rows in result.partitions():
+        bind.execute(table.insert(), [_monthly_row(row) for row in rows])
+
+
+def _monthly_row(row) -> dict:
+    """집계 행 → monthly_checklist_scores 행 (WeeklyScoreRebuilder._to_monthly_row 와 같은 값)"""
+    values = aggregate_row_values(row)
+    return {"senior_id": row.senior_id, "month_start": values.pop("period_start"), **values}
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 데이터 채우기만 하므로 되돌릴 스키마 변경 없음
+    pass
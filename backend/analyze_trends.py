@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+전체 시니어 추이 분석 야간 배치
+
+구간 주간 점수를 한 번에 읽어 전체 시니어의 당일 추이 분석을 벡터 연산으로 계산하고
+health_trend_analysis 에 저장합니다. 이후 가디언 추이 조회는 저장된 결과 조회로 끝납니다.
+
+사용법:
+    python analyze_trends.py
+    python analyze_trends.py --date 2025-06-30 --chunk-size 10000
+
+스케줄 예시 (crontab, 매일 00:10):
+    10 0 * * * cd /app/backend && python analyze_trends.py >> trend_batch.log 2>&1
+"""
+import os
+import sys
+import asyncio
+import argparse
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.services.trend_batch import TrendBatchAnalyzer
+
+def print_progress(progress: dict):
+    print(f"[{progress['written']}/{progress['total']}] {progress['percent']}% 저장", flush=True)
+
+async def main():
+    parser = argparse.ArgumentParser(description="전체 시니어 추이 분석 일괄 계산")
+    parser.add_argument("--date", type=date.fromisoformat, help="분석 기준일 (YYYY-MM-DD, 기본값: 오늘)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="커밋 단위 시니어 수")
+    args = parser.parse_args()
+
+    analyzer = TrendBatchAnalyzer(AsyncSessionLocal, chunk_size=args.chunk_size, progress=print_progress)
+
+    try:
+        result = await analyzer.run(args.date)
+    finally:
+        await async_engine.dispose()
+
+    print(f"추이 분석 완료: {result['analysis_date']} (구간 시작 {result['window_start']})")
+    print(f"- 시니어 {result['seniors']}명 중 {result['analyzed']}명 저장, 데이터 부족 {result['insufficient_data']}명")
+    print(f"- 주간 점수 {result['weekly_rows']}행")
+    print(
+        f"- 소요 시간: {result['elapsed_seconds']}초 "
+        f"(조회 {result['load_seconds']}초, 계산 {result['compute_seconds']}초, 저장 {result['write_seconds']}초)"
+    )
+    print(f"- 처리량: {result['seniors_per_second']} 시니어/초")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -76,6 +76,10 @@ tags_metadata = [
     {
         "name": "admin",
         "description": "관리자 전용 API (사용자 관리, 시스템 설정)",
+    },
+    {
+        "name": "events",
+        "description": "실시간 이벤트 스트림 (알림, 리포트 생성)",
     }
 ]
 
@@ -1,16 +1,67 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from .pool_metrics import TimedQueuePool, TimedAsyncAdaptedQueuePool
 
-# SQLAlchemy 설정
-engine = create_engine(settings.database_url)
+# 동기 드라이버 URL을 비동기 드라이버 URL로 변환
+ASYNC_DRIVERS = {
+    "postgresql://": "postgresql+asyncpg://",
+    "postgresql+psycopg2://": "postgresql+asyncpg://",
+    "sqlite://": "sqlite+aiosqlite://",
+}
+
+def get_async_database_url(url: str) -> str:
+    """동기 DB URL에 대응하는 비동기 DB URL 반환"""
+    if settings.async_database_url:
+        return settings.async_database_url
+    for sync_prefix, async_prefix in ASYNC_DRIVERS.items():
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+def get_pool_options(url: str, pool_class) -> dict:
+    """커넥션 풀 옵션 (인메모리 SQLite는 단일 커넥션 풀을 그대로 사용)"""
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":")):
+        return {}
+    return {
+        "poolclass": pool_class,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+
+# SQLAlchemy 설정 (스크립트, Alembic, 배치 작업용 동기 엔진)
+engine = create_engine(
+    settings.database_url,
+    **get_pool_options(settings.database_url, TimedQueuePool)
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (API 요청 처리용 - 이벤트 루프를 블로킹하지 않음)
+ASYNC_DATABASE_URL = get_async_database_url(settings.database_url)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    **get_pool_options(ASYNC_DATABASE_URL, TimedAsyncAdaptedQueuePool)
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 # 데이터베이스 의존성
-def get_db():
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_sync_db():
     db = SessionLocal()
     try:
         yield db
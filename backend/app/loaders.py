@@ -0,0 +1,50 @@
+"""
+엔드포인트별 관계 로딩 정책 (N+1 쿼리 방지)
+
+비동기 세션에서는 지연 로딩이 불가능하므로, 응답에 필요한 관계는
+아래 헬퍼로 쿼리 시점에 함께 로드합니다.
+- 1:1, N:1 관계: joinedload (한 번의 JOIN)
+- 1:N 또는 여러 갈래의 관계: selectinload (IN 조회 1회)
+- 컬럼만 응답하는 목록: columns_only (관계 접근 시 즉시 예외)
+
+python check_strict_loading.py 로 정책이 적용된 엔드포인트가 strict_loading 에서도
+추가 로딩 없이 응답하는지 검사합니다.
+"""
+from sqlalchemy import event
+from sqlalchemy.orm import Session, selectinload, joinedload, raiseload
+
+from app.models import User, CareSession, AIReport
+
+def user_with_profiles():
+    """로그인, 인증: 사용자 + 타입별 프로필"""
+    return (
+        selectinload(User.caregiver_profile),
+        selectinload(User.guardian_profile),
+        selectinload(User.admin_profile),
+    )
+
+def columns_only():
+    """케어기버 홈 등 컬럼만 응답하는 목록: 관계를 로드하지 않음 (실수로 접근하면 예외)"""
+    return (raiseload("*"),)
+
+def report_with_session():
+    """리포트 상세: 리포트 + 세션 + 케어기버 + 시니어 (단일 SELECT)"""
+    care_session = joinedload(AIReport.care_session)
+    return (
+        care_session.joinedload(CareSession.caregiver),
+        care_session.joinedload(CareSession.senior),
+    )
+
+def _raise_on_lazy_load(orm_execute_state):
+    """명시되지 않은 관계 접근 시 예외를 발생시키도록 모든 ORM SELECT에 raiseload 적용"""
+    if orm_execute_state.is_select and not orm_execute_state.is_column_load:
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+def enable_strict_loading():
+    """테스트/CI용: 예상치 못한 지연 로딩을 즉시 실패시킴"""
+    if not event.contains(Session, "do_orm_execute", _raise_on_lazy_load):
+        event.listen(Session, "do_orm_execute", _raise_on_lazy_load)
+
+def disable_strict_loading():
+    if event.contains(Session, "do_orm_execute", _raise_on_lazy_load):
+        event.remove(Session, "do_orm_execute", _raise_on_lazy_load)
@@ -7,6 +7,8 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 from functools import wraps
 import time
+from app.config import settings
+from app.query_metrics import start_request_stats
 
 class StructuredFormatter(logging.Formatter):
     """구조화된 로그 포맷터"""
@@ -205,6 +207,9 @@ class LoggingMiddleware:
         if scope["type"] == "http":
             start_time = time.time()
             
+            # 요청 단위 SQL 통계 수집 시작
+            query_stats = start_request_stats()
+            
             # 요청 정보 추출
             method = scope["method"]
             path = scope["path"]
@@ -227,6 +232,7 @@ class LoggingMiddleware:
                 if message["type"] == "http.response.start":
                     status_code = message["status"]
                     execution_time = time.time() - start_time
+                    db_stats = query_stats.summary()
                     
                     # 응답 로깅
                     self.logger.info(
@@ -237,10 +243,26 @@ class LoggingMiddleware:
                                 'method': method,
                                 'path': path,
                                 'status_code': status_code,
-                                'client_ip': client_ip
+                                'client_ip': client_ip,
+                                'db': db_stats
                             }
                         }
                     )
+                    
+                    # 동일 쿼리 반복 실행 → N+1 의심
+                    if db_stats["most_repeated_count"] >= settings.n_plus_one_threshold:
+                        self.logger.warning(
+                            f"N+1 쿼리 의심: {method} {path} - 동일 쿼리 {db_stats['most_repeated_count']}회 실행",
+                            extra={
+                                'extra_data': {
+                                    'method': method,
+                                    'path': path,
+                                    'query_count': db_stats["query_count"],
+                                    'repeated_count': db_stats["most_repeated_count"],
+                                    'repeated_statement': db_stats["most_repeated_statement"]
+                                }
+                            }
+                        )
                 
                 await send(message)
             
@@ -1,13 +1,21 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
-from app.database import get_db
+from app.database import get_db, engine, async_engine
+from app.pool_metrics import describe_pool
+from app.loaders import enable_strict_loading
 from app.models import User, Caregiver, Guardian, Admin
 from app.schemas.user import UserLogin, UserCreate, UserResponse, Token
-from app.services.auth import authenticate_user, create_access_token, get_password_hash
+from app.services.auth import authenticate_user, create_access_token, get_password_hash_async, get_current_admin
+from app.services.analysis_queue import analysis_queue
+from app.services.notification_broadcast import notification_broadcaster
+from app.services.ai_provider import close_ai_providers
+from app.services.realtime import close_realtime_brokers
 
 # 새로 추가된 임포트
 from app.exceptions import http_exception_handler, general_exception_handler
@@ -16,13 +24,31 @@ from app.logging_config import LoggingMiddleware, setup_logging
 from app.api_docs import tags_metadata
 
 # 라우터 임포트
-from app.routers import caregiver, guardian, ai, admin
+from app.routers import caregiver, guardian, ai, admin, events
 
 # 로깅 설정
 setup_logging()
 
+# 테스트/CI 환경에서 N+1 지연 로딩 감지
+if settings.strict_loading:
+    enable_strict_loading()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """백그라운드 작업 워커 시작/종료"""
+    await analysis_queue.start()
+    await notification_broadcaster.start()
+    yield
+    await close_realtime_brokers()
+    await notification_broadcaster.stop()
+    await analysis_queue.stop()
+    await close_ai_providers()
+    # 워커/브로커가 모두 종료된 뒤 커넥션 풀 정리 (PostgreSQL 연결을 남기지 않도록 마지막에)
+    await async_engine.dispose()
+
 # FastAPI 앱 생성 (문서화 개선)
 app = FastAPI(
+    lifespan=lifespan,
     title="Good Hands Care Service API",
     description="""
 ## 재외동포 케어 서비스 API
@@ -68,6 +94,7 @@ app.include_router(caregiver.router, prefix="/api/caregiver", tags=["caregiver"]
 app.include_router(guardian.router, prefix="/api/guardian", tags=["guardian"])
 app.include_router(ai.router, prefix="/api/ai", tags=["ai"])
 app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
+app.include_router(events.router, prefix="/api/events", tags=["events"])
 
 @app.get("/")
 async def root():
@@ -77,11 +104,26 @@ async def root():
 async def health_check():
     return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
 
+@app.get("/health/db-pool", tags=["admin"])
+async def db_pool_status(current_user: User = Depends(get_current_admin)):
+    """DB 커넥션 풀 상태 (관리자 전용) - 풀 크기 조정용 실측 데이터"""
+    return {
+        "api_pool": describe_pool(async_engine.pool),
+        "sync_pool": describe_pool(engine.pool),
+        "settings": {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_timeout": settings.db_pool_timeout
+        }
+    }
+
 # 인증 관련 API
 @app.post("/api/auth/login", response_model=LoginResponse, tags=["auth"])
-async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(user_credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     """사용자 로그인 (개선된 응답)"""
-    user = authenticate_user(db, user_credentials.user_code, user_credentials.password)
+    user = await authenticate_user(db, user_credentials.user_code, user_credentials.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -119,10 +161,11 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     )
 
 @app.post("/api/auth/register", response_model=UserResponse)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """사용자 회원가입"""
     # 기존 사용자 확인
-    existing_user = db.query(User).filter(User.user_code == user_data.user_code).first()
+    result = await db.execute(select(User).where(User.user_code == user_data.user_code))
+    existing_user = result.scalars().first()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -130,7 +173,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     db_user = User(
         user_code=user_data.user_code,
         user_type=user_data.user_type,
@@ -138,8 +181,8 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         password_hash=hashed_password
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     # 사용자 타입별 추가 정보 생성
     if user_data.user_type == "caregiver":
@@ -165,7 +208,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
         db.add(admin)
     
-    db.commit()
+    await db.commit()
     return db_user
 
 if __name__ == "__main__":
@@ -1,13 +1,13 @@
 from .user import User, Caregiver, Guardian, Admin
 from .senior import Senior, SeniorDisease, NursingHome
 from .care import CareSession, AttendanceLog, ChecklistResponse, CareNote
-from .report import AIReport, Feedback, Notification
-from .enhanced_care import CareSchedule, WeeklyChecklistScore, HealthTrendAnalysis, SpecialNote
+from .report import AIReport, AIAnalysisJob, KeywordDailyCount, Feedback, Notification, NotificationBroadcast
+from .enhanced_care import CareSchedule, WeeklyChecklistScore, MonthlyChecklistScore, HealthTrendAnalysis, TrendStatistic, AnomalyState, SpecialNote
 
 __all__ = [
     "User", "Caregiver", "Guardian", "Admin",
     "Senior", "SeniorDisease", "NursingHome",
     "CareSession", "AttendanceLog", "ChecklistResponse", "CareNote",
-    "AIReport", "Feedback", "Notification",
-    "CareSchedule", "WeeklyChecklistScore", "HealthTrendAnalysis", "SpecialNote"
+    "AIReport", "AIAnalysisJob", "KeywordDailyCount", "Feedback", "Notification", "NotificationBroadcast",
+    "CareSchedule", "WeeklyChecklistScore", "MonthlyChecklistScore", "HealthTrendAnalysis", "TrendStatistic", "AnomalyState", "SpecialNote"
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float, DECIMAL
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float, DECIMAL, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -19,6 +19,11 @@ class CareSession(Base):
     end_photo = Column(String(255))
     created_at = Column(DateTime, server_default=func.now())
     
+    __table_args__ = (
+        Index("idx_care_sessions_caregiver_created", caregiver_id, created_at),
+        Index("idx_care_sessions_senior_start", senior_id, start_time),
+    )
+    
     # 관계 설정
     caregiver = relationship("Caregiver")
     senior = relationship("Senior")
@@ -52,6 +57,10 @@ class ChecklistResponse(Base):
     weight = Column(DECIMAL(3,2), default=1.0)  # 가중치
     created_at = Column(DateTime, server_default=func.now())
     
+    __table_args__ = (
+        Index("idx_checklist_responses_session_id", care_session_id),
+    )
+    
     # 관계 설정
     care_session = relationship("CareSession")
 
@@ -65,5 +74,9 @@ class CareNote(Base):
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     
+    __table_args__ = (
+        Index("idx_care_notes_session_id", care_session_id),
+    )
+    
     # 관계 설정
     care_session = relationship("CareSession")
@@ -1,7 +1,7 @@
 """
 AI 리포트 시스템 개선을 위한 추가 모델들
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float, Date, Time, DECIMAL
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float, Date, Time, DECIMAL, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -41,11 +41,36 @@ class WeeklyChecklistScore(Base):
     score_breakdown = Column(JSON)  # 카테고리별 점수
     trend_indicator = Column(String(20))  # 'improving', 'stable', 'declining'
     created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime)  # 마지막 점수 반영/재집계 시각 (추이 분석 워터마크)
+    
+    __table_args__ = (
+        # 시니어별 주간 점수는 한 주에 하나
+        Index("uq_weekly_scores_senior_week", senior_id, week_start_date, unique=True),
+    )
     
     # 관계 설정
     senior = relationship("Senior")
     caregiver = relationship("Caregiver")
 
+# 월간 체크리스트 점수 사전 집계 모델 (장기 구간 추이 조회용, 주간 점수와 함께 갱신)
+class MonthlyChecklistScore(Base):
+    __tablename__ = "monthly_checklist_scores"
+
+    id = Column(Integer, primary_key=True, index=True)
+    senior_id = Column(Integer, ForeignKey("seniors.id"), nullable=False)
+    month_start = Column(Date, nullable=False)  # 해당 달 1일
+    total_score = Column(Integer, nullable=False)
+    max_possible_score = Column(Integer, nullable=False)
+    score_percentage = Column(DECIMAL(5,2), nullable=False)
+    checklist_count = Column(Integer, nullable=False)
+    score_breakdown = Column(JSON)  # 카테고리별 점수
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # 시니어별 월간 점수는 한 달에 하나 (구간 조회 범위 스캔 겸 upsert 충돌 기준)
+        Index("uq_monthly_scores_senior_month", senior_id, month_start, unique=True),
+    )
+
 # 상태 변화 추이 분석 모델
 class HealthTrendAnalysis(Base):
     __tablename__ = "health_trend_analysis"
@@ -57,12 +82,62 @@ class HealthTrendAnalysis(Base):
     trend_summary = Column(JSON)
     key_indicators = Column(JSON)
     ai_insights = Column(Text)
+    source_watermark = Column(String(100))  # 분석 시점 주간 점수 워터마크 (같으면 저장된 결과 재사용)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
+    __table_args__ = (
+        # 시니어별 당일 분석 결과 조회 및 일괄 upsert 충돌 기준 (하루 한 행)
+        Index("uq_health_trend_senior_date", senior_id, analysis_date, unique=True),
+    )
+    
     # 관계 설정
     senior = relationship("Senior")
 
+# 추이 누적 통계 모델 (최근 주간 점수의 충분 통계량, 주간 점수 변경 시 갱신)
+class TrendStatistic(Base):
+    __tablename__ = "trend_statistics"
+
+    id = Column(Integer, primary_key=True, index=True)
+    senior_id = Column(Integer, ForeignKey("seniors.id"), nullable=False)
+    category = Column(String(20), nullable=False)  # 'overall' = 전체 점수율, 그 외 카테고리명
+    window_start = Column(Date, nullable=False)  # 집계 구간 첫 주 (x = 이 주로부터 지난 주 수)
+    n = Column(Integer, nullable=False, default=0)
+    sum_x = Column(Float, nullable=False, default=0)
+    sum_y = Column(Float, nullable=False, default=0)
+    sum_xy = Column(Float, nullable=False, default=0)
+    sum_xx = Column(Float, nullable=False, default=0)
+    first_value = Column(Float)
+    last_week = Column(Date)
+    last_value = Column(Float)
+    ewma = Column(Float)
+    ewma_prev = Column(Float)  # 마지막 주 값 반영 전 EWMA (같은 주 재갱신용)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("uq_trend_statistics_senior_category", senior_id, category, unique=True),
+    )
+
+# 카테고리 점수 이상 감지 상태 모델 (세션 점수의 EWMA 평균/분산, 세션 분석 시 갱신)
+class AnomalyState(Base):
+    __tablename__ = "anomaly_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+    senior_id = Column(Integer, ForeignKey("seniors.id"), nullable=False)
+    category = Column(String(20), nullable=False)  # 'overall' = 전체 점수율, 그 외 카테고리명
+    n = Column(Integer, nullable=False, default=0)  # 반영된 세션 수
+    mean = Column(Float, nullable=False, default=0)
+    variance = Column(Float, nullable=False, default=0)
+    prev_mean = Column(Float)  # 마지막 세션 반영 전 값 (같은 세션 재분석 시 되돌림용)
+    prev_variance = Column(Float)
+    last_session_id = Column(Integer)
+    last_z = Column(Float)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("uq_anomaly_states_senior_category", senior_id, category, unique=True),
+    )
+
 # 특이사항 관리 모델
 class SpecialNote(Base):
     __tablename__ = "special_notes"
@@ -79,6 +154,10 @@ class SpecialNote(Base):
     created_at = Column(DateTime, server_default=func.now())
     resolved_at = Column(DateTime)
     
+    __table_args__ = (
+        Index("idx_special_notes_senior_created", senior_id, created_at),
+    )
+    
     # 관계 설정
     senior = relationship("Senior")
     care_session = relationship("CareSession")
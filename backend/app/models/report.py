@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, DECIMAL
+from sqlalchemy import Column, Integer, String, DateTime, Date, Boolean, ForeignKey, Text, JSON, DECIMAL, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -21,12 +21,57 @@ class AIReport(Base):
     special_notes_summary = Column(Text)
     n8n_workflow_id = Column(String(100))
     ai_processing_status = Column(String(20), default="pending")  # pending, processing, completed, failed
+    input_fingerprint = Column(String(64))  # 분석 입력 지문 (같으면 재분석 생략)
+    report_fingerprint = Column(String(64))  # 리포트 재생성 입력 지문 (같으면 재생성 생략)
     
     created_at = Column(DateTime, server_default=func.now())
     
+    __table_args__ = (
+        Index("idx_ai_reports_session_id", care_session_id),
+    )
+    
+    # 관계 설정
+    care_session = relationship("CareSession")
+
+class AIAnalysisJob(Base):
+    """AI 분석 작업 큐 (ai_analysis_queue_backend=database 일 때 재시작 복구용)"""
+    __tablename__ = "ai_analysis_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    care_session_id = Column(Integer, ForeignKey("care_sessions.id"), nullable=False)
+    status = Column(String(20), default="pending")  # pending, processing, completed, failed
+    attempts = Column(Integer, default=0)
+    error = Column(Text)
+    owner = Column(String(64))  # 작업을 선점한 워커 프로세스 (host:pid:id)
+    claimed_at = Column(DateTime)  # 선점 시각 (ai_analysis_job_lease_seconds 가 지나면 다른 프로세스가 가져갈 수 있음)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        Index("idx_ai_analysis_jobs_status", status, id),
+        Index("idx_ai_analysis_jobs_session_id", care_session_id),
+    )
+    
     # 관계 설정
     care_session = relationship("CareSession")
 
+class KeywordDailyCount(Base):
+    """일자별 리포트 키워드 집계 (인기 키워드 조회용, 리포트 키워드 저장 시 증감)"""
+    __tablename__ = "keyword_daily_counts"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)  # 케어 세션 일자
+    nursing_home_id = Column(Integer, nullable=False, default=0)  # 0 = 요양원 미지정
+    keyword = Column(String(50), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        # 전체 기간 조회 (day 범위) 및 upsert 충돌 기준
+        Index("uq_keyword_daily_counts_day_home_keyword", day, nursing_home_id, keyword, unique=True),
+        # 요양원별 기간 조회
+        Index("idx_keyword_daily_counts_home_day", nursing_home_id, day),
+    )
+
 class Feedback(Base):
     __tablename__ = "feedbacks"
     
@@ -57,6 +102,35 @@ class Notification(Base):
     read_at = Column(DateTime)
     created_at = Column(DateTime, server_default=func.now())
     
+    __table_args__ = (
+        # 읽지 않은 알림 최신순 조회
+        Index("idx_notifications_receiver_unread", receiver_id, is_read, created_at.desc()),
+    )
+    
     # 관계 설정
     sender = relationship("User", foreign_keys=[sender_id])
     receiver = relationship("User", foreign_keys=[receiver_id])
+
+class NotificationBroadcast(Base):
+    """관리자 일괄 알림 작업 (백그라운드 청크 단위 전송, 진행 상황 조회/재시작 후 이어서 전송)"""
+    __tablename__ = "notification_broadcasts"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    sender_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_type = Column(String(20))  # 대상 사용자 유형 (없으면 전체 활성 사용자)
+    type = Column(String(50), nullable=False)
+    title = Column(String(200), nullable=False)
+    content = Column(Text, nullable=False)
+    data = Column(JSON)
+    status = Column(String(20), default="pending")  # pending, running, completed, failed
+    total_count = Column(Integer, default=0)  # 등록 시점 대상자 수
+    sent_count = Column(Integer, default=0)
+    last_user_id = Column(Integer, default=0)  # 마지막으로 전송한 청크의 최대 사용자 ID
+    error = Column(Text)
+    created_at = Column(DateTime, server_default=func.now())
+    started_at = Column(DateTime)
+    completed_at = Column(DateTime)
+    
+    __table_args__ = (
+        Index("idx_notification_broadcasts_status", status, id),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -17,6 +17,11 @@ class Senior(Base):
     guardian_id = Column(Integer, ForeignKey("guardians.id"))
     created_at = Column(DateTime, server_default=func.now())
     
+    __table_args__ = (
+        Index("idx_seniors_caregiver_id", caregiver_id),
+        Index("idx_seniors_guardian_id", guardian_id),
+    )
+    
     # 관계 설정
     caregiver = relationship("Caregiver")
     guardian = relationship("Guardian")
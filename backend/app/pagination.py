@@ -0,0 +1,81 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+
+(created_at, id) 내림차순 정렬 기준으로 마지막 항목 이후만 조회하므로
+이력이 늘어나도 페이지당 비용이 일정합니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+def clamp_page_size(size: Optional[int]) -> int:
+    """요청 페이지 크기를 1 ~ settings.max_page_size 범위로 제한"""
+    if not size:
+        return settings.default_page_size
+    return max(1, min(size, settings.max_page_size))
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """마지막 항목의 정렬 키를 불투명 커서 문자열로 인코딩"""
+    payload = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열을 (created_at, id)로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다."
+        )
+
+async def keyset_paginate(
+    db: AsyncSession,
+    query,
+    created_at_column,
+    id_column,
+    cursor: Optional[str] = None,
+    size: Optional[int] = None
+):
+    """
+    (created_at, id) 내림차순 키셋 페이지 조회
+
+    Returns:
+        (items, next_cursor, page_size) - 다음 페이지가 없으면 next_cursor는 None
+    """
+    page_size = clamp_page_size(size)
+
+    if cursor:
+        last_created_at, last_id = decode_cursor(cursor)
+        sort_key, last_sort_key = created_at_column, last_created_at
+        if db.get_bind().dialect.name == "sqlite":
+            # SQLite는 일시를 문자열로 저장하며 server_default 값에는 마이크로초가 없어
+            # 바인딩 값과 문자열 비교가 어긋나므로 julianday로 정규화하여 비교
+            sort_key, last_sort_key = func.julianday(created_at_column), func.julianday(last_created_at)
+        query = query.where(or_(
+            sort_key < last_sort_key,
+            and_(sort_key == last_sort_key, id_column < last_id)
+        ))
+
+    # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+    result = await db.execute(
+        query.order_by(created_at_column.desc(), id_column.desc()).limit(page_size + 1)
+    )
+    items = list(result.scalars().all())
+
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, created_at_column.key), getattr(last, id_column.key))
+
+    return items, next_cursor, page_size
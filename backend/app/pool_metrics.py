@@ -0,0 +1,96 @@
+"""
+데이터베이스 커넥션 풀 메트릭 수집
+"""
+import time
+import threading
+from typing import Dict, Any, List
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# 커넥션 대기 시간 히스토그램 버킷 (ms, 상한값)
+WAIT_TIME_BUCKETS_MS: List[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+
+class PoolMetrics:
+    """커넥션 체크아웃 대기 시간 및 타임아웃 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.bucket_counts = [0] * (len(WAIT_TIME_BUCKETS_MS) + 1)
+            self.checkout_count = 0
+            self.timeout_count = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+
+    def observe_wait(self, wait_ms: float):
+        with self._lock:
+            self.checkout_count += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            for index, upper_bound in enumerate(WAIT_TIME_BUCKETS_MS):
+                if wait_ms <= upper_bound:
+                    self.bucket_counts[index] += 1
+                    break
+            else:
+                self.bucket_counts[-1] += 1
+
+    def observe_timeout(self):
+        with self._lock:
+            self.timeout_count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            histogram = {
+                f"le_{int(upper_bound)}ms": count
+                for upper_bound, count in zip(WAIT_TIME_BUCKETS_MS, self.bucket_counts)
+            }
+            histogram["gt_5000ms"] = self.bucket_counts[-1]
+            return {
+                "checkouts": self.checkout_count,
+                "timeouts": self.timeout_count,
+                "avg_wait_ms": round(self.total_wait_ms / self.checkout_count, 3) if self.checkout_count else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+                "wait_time_histogram": histogram
+            }
+
+class _TimedPoolMixin:
+    """풀에서 커넥션을 얻기까지 걸린 시간을 측정하는 믹스인"""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.observe_timeout()
+            raise
+        self.metrics.observe_wait((time.perf_counter() - start) * 1000)
+        return connection
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    metrics = PoolMetrics()
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+def describe_pool(pool) -> Dict[str, Any]:
+    """풀 현재 상태 (사용 중, 유휴, 오버플로우) 및 대기 시간 메트릭"""
+    if not isinstance(pool, QueuePool):
+        return {"pool_class": type(pool).__name__, "status": pool.status()}
+
+    stats = {
+        "pool_class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeout_seconds": pool.timeout()
+    }
+    if isinstance(pool, _TimedPoolMixin):
+        stats.update(pool.metrics.snapshot())
+    return stats
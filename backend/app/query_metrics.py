@@ -0,0 +1,69 @@
+"""
+요청 단위 SQL 쿼리 메트릭 (쿼리 수, 총 DB 시간, 반복 쿼리 감지)
+"""
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, Any, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+class RequestQueryStats:
+    """하나의 HTTP 요청 동안 실행된 SQL 통계"""
+
+    def __init__(self):
+        self.query_count = 0
+        self.total_db_time = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, elapsed: float):
+        self.query_count += 1
+        self.total_db_time += elapsed
+        self.statements[statement] += 1
+
+    def most_repeated(self) -> Optional[tuple]:
+        if not self.statements:
+            return None
+        return self.statements.most_common(1)[0]
+
+    def summary(self, max_statement_length: int = 300) -> Dict[str, Any]:
+        most_repeated = self.most_repeated()
+        return {
+            "query_count": self.query_count,
+            "db_time_ms": round(self.total_db_time * 1000, 3),
+            "unique_statements": len(self.statements),
+            "most_repeated_statement": most_repeated[0][:max_statement_length] if most_repeated else None,
+            "most_repeated_count": most_repeated[1] if most_repeated else 0
+        }
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+def start_request_stats() -> RequestQueryStats:
+    """현재 요청 컨텍스트에 쿼리 통계 수집 시작"""
+    stats = RequestQueryStats()
+    _current_stats.set(stats)
+    return stats
+
+def get_request_stats() -> Optional[RequestQueryStats]:
+    return _current_stats.get()
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    stats.record(statement, time.perf_counter() - start_times.pop())
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
@@ -15,15 +15,16 @@ class APIResponse(BaseModel, Generic[T]):
     timestamp: datetime = datetime.now()
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """페이지네이션 응답 모델"""
+    """페이지네이션 응답 모델 (커서 방식은 total/page/total_pages 대신 next_cursor 사용)"""
     success: bool = True
     items: List[T]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
     has_next: bool
     has_previous: bool
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
     timestamp: datetime = datetime.now()
 
 class ErrorResponse(BaseModel):
@@ -65,6 +66,23 @@ def paginated_response(
         timestamp=datetime.now()
     )
 
+def cursor_paginated_response(
+    items: List[T],
+    size: int,
+    next_cursor: Optional[str] = None,
+    has_previous: bool = False
+) -> PaginatedResponse[T]:
+    """커서(키셋) 페이지네이션 응답 생성 - 전체 건수를 세지 않음"""
+    return PaginatedResponse(
+        success=True,
+        items=items,
+        size=size,
+        has_next=next_cursor is not None,
+        has_previous=has_previous,
+        next_cursor=next_cursor,
+        timestamp=datetime.now()
+    )
+
 def error_response(
     detail: str,
     error_code: str,
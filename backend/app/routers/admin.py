@@ -1,8 +1,9 @@
 """
 관리자 관련 라우터
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime, date
 
@@ -12,8 +13,10 @@ from ..schemas import (
     UserCreate, UserResponse, SeniorCreate, SeniorResponse, 
     NotificationCreate, NotificationResponse
 )
-from ..services.auth import get_current_user, get_password_hash
-from ..services.notification import NotificationService
+from ..services.auth import get_current_user, get_password_hash_async, invalidate_user_cache
+from ..services.notification_broadcast import broadcast_progress, notification_broadcaster
+from ..services.trending_keywords import TrendingKeywordService
+from ..services.weekly_rebuild import WeeklyScoreRebuilder
 
 router = APIRouter()
 
@@ -28,37 +31,38 @@ def verify_admin_permission(current_user: User):
 @router.get("/dashboard")
 async def get_admin_dashboard(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """관리자 대시보드 데이터 조회"""
     verify_admin_permission(current_user)
     
     try:
         # 전체 통계 조회
-        total_users = db.query(User).count()
-        total_caregivers = db.query(User).filter(User.user_type == "caregiver").count()
-        total_guardians = db.query(User).filter(User.user_type == "guardian").count()
-        total_seniors = db.query(Senior).count()
+        total_users = await db.scalar(select(func.count(User.id)))
+        total_caregivers = await db.scalar(select(func.count(User.id)).where(User.user_type == "caregiver"))
+        total_guardians = await db.scalar(select(func.count(User.id)).where(User.user_type == "guardian"))
+        total_seniors = await db.scalar(select(func.count(Senior.id)))
         
         # 오늘 활동 통계
         today = date.today()
-        today_sessions = db.query(CareSession).filter(
+        today_sessions = await db.scalar(select(func.count(CareSession.id)).where(
             CareSession.created_at >= today
-        ).count()
+        ))
         
-        today_reports = db.query(AIReport).filter(
+        today_reports = await db.scalar(select(func.count(AIReport.id)).where(
             AIReport.created_at >= today
-        ).count()
+        ))
         
         # 펜딩 피드백 수
-        pending_feedbacks = db.query(Feedback).filter(
+        pending_feedbacks = await db.scalar(select(func.count(Feedback.id)).where(
             Feedback.status == "pending"
-        ).count()
+        ))
         
         # 최근 활동 (최근 20개)
-        recent_activities = db.query(CareSession).order_by(
+        result = await db.execute(select(CareSession).order_by(
             CareSession.created_at.desc()
-        ).limit(20).all()
+        ).limit(20))
+        recent_activities = result.scalars().all()
         
         return {
             "statistics": {
@@ -83,20 +87,20 @@ async def get_admin_dashboard(
 async def get_users(
     user_type: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """사용자 목록 조회"""
     verify_admin_permission(current_user)
     
     try:
-        query = db.query(User)
+        query = select(User)
         
         if user_type:
-            query = query.filter(User.user_type == user_type)
+            query = query.where(User.user_type == user_type)
         
-        users = query.order_by(User.created_at.desc()).all()
+        result = await db.execute(query.order_by(User.created_at.desc()))
         
-        return users
+        return result.scalars().all()
         
     except Exception as e:
         raise HTTPException(
@@ -108,16 +112,17 @@ async def get_users(
 async def create_user(
     user_data: UserCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """새 사용자 생성"""
     verify_admin_permission(current_user)
     
     try:
         # 사용자 코드 중복 확인
-        existing_user = db.query(User).filter(
+        result = await db.execute(select(User).where(
             User.user_code == user_data.user_code
-        ).first()
+        ))
+        existing_user = result.scalars().first()
         
         if existing_user:
             raise HTTPException(
@@ -127,9 +132,10 @@ async def create_user(
         
         # 이메일 중복 확인
         if user_data.email:
-            existing_email = db.query(User).filter(
+            result = await db.execute(select(User).where(
                 User.email == user_data.email
-            ).first()
+            ))
+            existing_email = result.scalars().first()
             
             if existing_email:
                 raise HTTPException(
@@ -144,13 +150,13 @@ async def create_user(
             name=user_data.name,
             email=user_data.email,
             phone=user_data.phone,
-            password_hash=get_password_hash(user_data.password),
+            password_hash=await get_password_hash_async(user_data.password),
             is_active=True
         )
         
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
         
         return new_user
         
@@ -164,13 +170,13 @@ async def create_user(
 async def activate_user(
     user_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """사용자 활성화"""
     verify_admin_permission(current_user)
     
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         
         if not user:
             raise HTTPException(
@@ -179,7 +185,8 @@ async def activate_user(
             )
         
         user.is_active = True
-        db.commit()
+        await db.commit()
+        invalidate_user_cache(user_code=user.user_code, user_id=user.id)
         
         return {"message": "사용자가 활성화되었습니다."}
         
@@ -193,13 +200,13 @@ async def activate_user(
 async def deactivate_user(
     user_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """사용자 비활성화"""
     verify_admin_permission(current_user)
     
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         
         if not user:
             raise HTTPException(
@@ -208,7 +215,8 @@ async def deactivate_user(
             )
         
         user.is_active = False
-        db.commit()
+        await db.commit()
+        invalidate_user_cache(user_code=user.user_code, user_id=user.id)
         
         return {"message": "사용자가 비활성화되었습니다."}
         
@@ -221,15 +229,15 @@ async def deactivate_user(
 @router.get("/seniors", response_model=List[SeniorResponse])
 async def get_seniors(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """시니어 목록 조회"""
     verify_admin_permission(current_user)
     
     try:
-        seniors = db.query(Senior).order_by(Senior.created_at.desc()).all()
+        result = await db.execute(select(Senior).order_by(Senior.created_at.desc()))
         
-        return seniors
+        return result.scalars().all()
         
     except Exception as e:
         raise HTTPException(
@@ -241,17 +249,18 @@ async def get_seniors(
 async def create_senior(
     senior_data: SeniorCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """새 시니어 생성"""
     verify_admin_permission(current_user)
     
     try:
         # 케어기버 및 가디언 존재 확인
-        caregiver = db.query(User).filter(
+        result = await db.execute(select(User).where(
             User.id == senior_data.caregiver_id,
             User.user_type == "caregiver"
-        ).first()
+        ))
+        caregiver = result.scalars().first()
         
         if not caregiver:
             raise HTTPException(
@@ -259,10 +268,11 @@ async def create_senior(
                 detail="케어기버를 찾을 수 없습니다."
             )
         
-        guardian = db.query(User).filter(
+        result = await db.execute(select(User).where(
             User.id == senior_data.guardian_id,
             User.user_type == "guardian"
-        ).first()
+        ))
+        guardian = result.scalars().first()
         
         if not guardian:
             raise HTTPException(
@@ -284,8 +294,8 @@ async def create_senior(
         )
         
         db.add(new_senior)
-        db.commit()
-        db.refresh(new_senior)
+        await db.commit()
+        await db.refresh(new_senior)
         
         return new_senior
         
@@ -300,20 +310,21 @@ async def get_reports(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """리포트 목록 조회"""
     verify_admin_permission(current_user)
     
     try:
-        query = db.query(AIReport)
+        query = select(AIReport)
         
         if start_date:
-            query = query.filter(AIReport.created_at >= start_date)
+            query = query.where(AIReport.created_at >= start_date)
         if end_date:
-            query = query.filter(AIReport.created_at <= end_date)
+            query = query.where(AIReport.created_at <= end_date)
         
-        reports = query.order_by(AIReport.created_at.desc()).all()
+        result = await db.execute(query.order_by(AIReport.created_at.desc()))
+        reports = result.scalars().all()
         
         return {
             "reports": reports,
@@ -326,44 +337,91 @@ async def get_reports(
             detail=f"리포트 목록 조회 중 오류가 발생했습니다: {str(e)}"
         )
 
-@router.post("/notifications/broadcast")
+@router.post("/weekly-scores/rebuild")
+async def rebuild_weekly_scores(
+    start_date: date,
+    end_date: date,
+    senior_ids: Optional[List[int]] = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """기간(및 시니어) 단위 주간 체크리스트 점수 재집계"""
+    verify_admin_permission(current_user)
+    
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일은 종료일보다 이전이어야 합니다."
+        )
+    
+    try:
+        result = await WeeklyScoreRebuilder(db).rebuild(start_date, end_date, senior_ids)
+        
+        return {
+            "message": "주간 점수 재집계가 완료되었습니다.",
+            **result
+        }
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"주간 점수 재집계 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.post("/keywords/rebuild")
+async def rebuild_keyword_counts(
+    start_date: date,
+    end_date: date,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """기간 단위 인기 키워드 일자별 카운터 재집계"""
+    verify_admin_permission(current_user)
+    
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일은 종료일보다 이전이어야 합니다."
+        )
+    
+    try:
+        result = await TrendingKeywordService(db).rebuild(start_date, end_date)
+        
+        return {
+            "message": "키워드 카운터 재집계가 완료되었습니다.",
+            **result
+        }
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"키워드 카운터 재집계 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.post("/notifications/broadcast", status_code=status.HTTP_202_ACCEPTED)
 async def broadcast_notification(
     notification_data: NotificationCreate,
     user_type: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """전체 또는 특정 사용자 그룹에 알림 전송"""
+    """전체 또는 특정 사용자 그룹에 알림 전송 (백그라운드 전송 후 즉시 202 응답, 진행 상황은 broadcast_id 로 조회)"""
     verify_admin_permission(current_user)
     
     try:
-        # 대상 사용자 조회
-        query = db.query(User).filter(User.is_active == True)
-        
-        if user_type:
-            query = query.filter(User.user_type == user_type)
-        
-        target_users = query.all()
-        
-        # 알림 서비스 초기화
-        notification_service = NotificationService(db)
-        
-        # 각 사용자에게 알림 전송
-        sent_count = 0
-        for user in target_users:
-            await notification_service.send_notification(
-                sender_id=current_user.id,
-                receiver_id=user.id,
-                type=notification_data.type,
-                title=notification_data.title,
-                content=notification_data.content,
-                data=notification_data.data
-            )
-            sent_count += 1
+        broadcast = await notification_broadcaster.submit(
+            db,
+            sender_id=current_user.id,
+            type=notification_data.type,
+            title=notification_data.title,
+            content=notification_data.content,
+            data=notification_data.data,
+            user_type=user_type
+        )
         
         return {
-            "message": f"알림이 {sent_count}명에게 전송되었습니다.",
-            "sent_count": sent_count
+            "message": f"알림 {broadcast.total_count}건 전송을 시작했습니다.",
+            **broadcast_progress(broadcast)
         }
         
     except Exception as e:
@@ -372,22 +430,38 @@ async def broadcast_notification(
             detail=f"알림 전송 중 오류가 발생했습니다: {str(e)}"
         )
 
+@router.get("/notifications/broadcast/{broadcast_id}")
+async def get_broadcast_status(
+    broadcast_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """일괄 알림 전송 진행 상황 조회"""
+    verify_admin_permission(current_user)
+    
+    broadcast = await notification_broadcaster.get(db, broadcast_id)
+    if not broadcast:
+        raise HTTPException(status_code=404, detail="일괄 알림 작업을 찾을 수 없습니다")
+    
+    return broadcast_progress(broadcast)
+
 @router.get("/feedbacks")
 async def get_feedbacks(
     status: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """피드백 목록 조회"""
     verify_admin_permission(current_user)
     
     try:
-        query = db.query(Feedback)
+        query = select(Feedback)
         
         if status:
-            query = query.filter(Feedback.status == status)
+            query = query.where(Feedback.status == status)
         
-        feedbacks = query.order_by(Feedback.created_at.desc()).all()
+        result = await db.execute(query.order_by(Feedback.created_at.desc()))
+        feedbacks = result.scalars().all()
         
         return {
             "feedbacks": feedbacks,
@@ -405,13 +479,13 @@ async def update_feedback_status(
     feedback_id: int,
     status: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """피드백 상태 업데이트"""
     verify_admin_permission(current_user)
     
     try:
-        feedback = db.query(Feedback).filter(Feedback.id == feedback_id).first()
+        feedback = await db.get(Feedback, feedback_id)
         
         if not feedback:
             raise HTTPException(
@@ -422,7 +496,7 @@ async def update_feedback_status(
         feedback.status = status
         feedback.updated_at = datetime.utcnow()
         
-        db.commit()
+        await db.commit()
         
         return {"message": "피드백 상태가 업데이트되었습니다."}
         
@@ -1,8 +1,9 @@
 """
 AI 리포트 관련 라우터
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
 from ..database import get_db
@@ -11,21 +12,37 @@ from ..schemas import AIReportResponse, AIReportCreate
 from ..services.auth import get_current_user
 from ..services.ai_report import AIReportService
 from ..services.notification import NotificationService
+from ..services.guardian_home import invalidate_guardian_home_for_senior
+from ..services.trending_keywords import TrendingKeywordService
+from ..services.ai_trigger import analysis_fingerprint
 
 router = APIRouter()
 
+async def ensure_session_access(db: AsyncSession, current_user: User, care_session: CareSession):
+    """케어 세션 접근 권한 확인 (담당 케어기버, 시니어의 가디언, 관리자)"""
+    if current_user.user_type == "admin":
+        return
+    if current_user.caregiver_profile is not None and care_session.caregiver_id == current_user.caregiver_profile.id:
+        return
+    if current_user.guardian_profile is not None:
+        senior = await db.get(Senior, care_session.senior_id)
+        if senior is not None and senior.guardian_id == current_user.guardian_profile.id:
+            return
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="해당 케어 세션에 접근할 권한이 없습니다."
+    )
+
 @router.post("/generate-report")
 async def generate_ai_report(
     session_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """AI 리포트 생성"""
     try:
         # 돌봄 세션 확인
-        care_session = db.query(CareSession).filter(
-            CareSession.id == session_id
-        ).first()
+        care_session = await db.get(CareSession, session_id)
         
         if not care_session:
             raise HTTPException(
@@ -48,9 +65,10 @@ async def generate_ai_report(
             )
         
         # 이미 리포트가 생성되었는지 확인
-        existing_report = db.query(AIReport).filter(
-            AIReport.session_id == session_id
-        ).first()
+        result = await db.execute(select(AIReport).where(
+            AIReport.care_session_id == session_id
+        ))
+        existing_report = result.scalars().first()
         
         if existing_report:
             raise HTTPException(
@@ -59,19 +77,19 @@ async def generate_ai_report(
             )
         
         # 체크리스트 응답 조회
-        checklist_responses = db.query(ChecklistResponse).filter(
-            ChecklistResponse.session_id == session_id
-        ).all()
+        result = await db.execute(select(ChecklistResponse).where(
+            ChecklistResponse.care_session_id == session_id
+        ))
+        checklist_responses = result.scalars().all()
         
         # 돌봄노트 조회
-        care_notes = db.query(CareNote).filter(
-            CareNote.session_id == session_id
-        ).all()
+        result = await db.execute(select(CareNote).where(
+            CareNote.care_session_id == session_id
+        ))
+        care_notes = result.scalars().all()
         
         # 시니어 정보 조회
-        senior = db.query(Senior).filter(
-            Senior.id == care_session.senior_id
-        ).first()
+        senior = await db.get(Senior, care_session.senior_id)
         
         # AI 리포트 서비스 초기화
         ai_report_service = AIReportService(db)
@@ -86,7 +104,7 @@ async def generate_ai_report(
         
         # 리포트 저장
         ai_report = AIReport(
-            session_id=session_id,
+            care_session_id=session_id,
             keywords=report_data["keywords"],
             content=report_data["content"],
             ai_comment=report_data["ai_comment"],
@@ -94,8 +112,10 @@ async def generate_ai_report(
         )
         
         db.add(ai_report)
-        db.commit()
-        db.refresh(ai_report)
+        await TrendingKeywordService(db).record(session_id, report_data["keywords"])
+        await db.commit()
+        await db.refresh(ai_report)
+        await invalidate_guardian_home_for_senior(db, senior.id)
         
         # 가디언에게 알림 전송
         notification_service = NotificationService(db)
@@ -124,11 +144,11 @@ async def generate_ai_report(
 async def get_ai_report(
     report_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """AI 리포트 조회"""
     try:
-        report = db.query(AIReport).filter(AIReport.id == report_id).first()
+        report = await db.get(AIReport, report_id)
         
         if not report:
             raise HTTPException(
@@ -137,14 +157,10 @@ async def get_ai_report(
             )
         
         # 세션 정보 조회
-        session = db.query(CareSession).filter(
-            CareSession.id == report.session_id
-        ).first()
+        session = await db.get(CareSession, report.care_session_id)
         
         # 시니어 정보 조회
-        senior = db.query(Senior).filter(
-            Senior.id == session.senior_id
-        ).first()
+        senior = await db.get(Senior, session.senior_id)
         
         # 권한 확인 (케어기버 또는 가디언만 접근 가능)
         if (current_user.id != session.caregiver_id and 
@@ -166,7 +182,7 @@ async def get_ai_report(
 @router.get("/report-templates")
 async def get_report_templates(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """리포트 템플릿 조회"""
     try:
@@ -188,14 +204,12 @@ async def get_report_templates(
 async def analyze_checklist(
     session_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """체크리스트 분석"""
     try:
         # 돌봄 세션 확인
-        care_session = db.query(CareSession).filter(
-            CareSession.id == session_id
-        ).first()
+        care_session = await db.get(CareSession, session_id)
         
         if not care_session:
             raise HTTPException(
@@ -204,9 +218,7 @@ async def analyze_checklist(
             )
         
         # 권한 확인
-        senior = db.query(Senior).filter(
-            Senior.id == care_session.senior_id
-        ).first()
+        senior = await db.get(Senior, care_session.senior_id)
         
         if (current_user.id != care_session.caregiver_id and 
             current_user.id != senior.guardian_id and 
@@ -217,9 +229,10 @@ async def analyze_checklist(
             )
         
         # 체크리스트 응답 조회
-        checklist_responses = db.query(ChecklistResponse).filter(
-            ChecklistResponse.session_id == session_id
-        ).all()
+        result = await db.execute(select(ChecklistResponse).where(
+            ChecklistResponse.care_session_id == session_id
+        ))
+        checklist_responses = result.scalars().all()
         
         if not checklist_responses:
             raise HTTPException(
@@ -252,12 +265,12 @@ async def analyze_checklist(
 async def regenerate_ai_report(
     report_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """AI 리포트 재생성"""
     try:
         # 리포트 조회
-        report = db.query(AIReport).filter(AIReport.id == report_id).first()
+        report = await db.get(AIReport, report_id)
         
         if not report:
             raise HTTPException(
@@ -266,9 +279,7 @@ async def regenerate_ai_report(
             )
         
         # 세션 정보 조회
-        session = db.query(CareSession).filter(
-            CareSession.id == report.session_id
-        ).first()
+        session = await db.get(CareSession, report.care_session_id)
         
         # 권한 확인 (케어기버 또는 관리자만 재생성 가능)
         if (current_user.id != session.caregiver_id and 
@@ -279,17 +290,30 @@ async def regenerate_ai_report(
             )
         
         # 관련 데이터 조회
-        checklist_responses = db.query(ChecklistResponse).filter(
-            ChecklistResponse.session_id == report.session_id
-        ).all()
-        
-        care_notes = db.query(CareNote).filter(
-            CareNote.session_id == report.session_id
-        ).all()
-        
-        senior = db.query(Senior).filter(
-            Senior.id == session.senior_id
-        ).first()
+        result = await db.execute(select(ChecklistResponse).where(
+            ChecklistResponse.care_session_id == report.care_session_id
+        ))
+        checklist_responses = result.scalars().all()
+        
+        result = await db.execute(select(CareNote).where(
+            CareNote.care_session_id == report.care_session_id
+        ))
+        care_notes = result.scalars().all()
+        
+        senior = await db.get(Senior, session.senior_id)
+        
+        # 입력이 마지막 재생성과 같으면 기존 리포트 그대로 반환
+        fingerprint = analysis_fingerprint(
+            "report", checklist_responses, care_notes,
+            {"senior": senior.name, "start_time": session.start_time, "end_time": session.end_time}
+        )
+        if report.report_fingerprint == fingerprint:
+            return {
+                "message": "입력 변경이 없어 기존 리포트를 유지합니다.",
+                "report_id": report.id,
+                "session_id": report.care_session_id,
+                "cached": True
+            }
         
         # AI 리포트 서비스 초기화
         ai_report_service = AIReportService(db)
@@ -303,17 +327,21 @@ async def regenerate_ai_report(
         )
         
         # 기존 리포트 업데이트
+        await TrendingKeywordService(db).record(
+            report.care_session_id, new_report_data["keywords"], report.keywords
+        )
         report.keywords = new_report_data["keywords"]
         report.content = new_report_data["content"]
         report.ai_comment = new_report_data["ai_comment"]
         report.status = "regenerated"
+        report.report_fingerprint = fingerprint
         
-        db.commit()
+        await db.commit()
         
         return {
             "message": "AI 리포트가 성공적으로 재생성되었습니다.",
             "report_id": report.id,
-            "session_id": report.session_id
+            "session_id": report.care_session_id
         }
         
     except Exception as e:
@@ -324,11 +352,13 @@ async def regenerate_ai_report(
 
 @router.get("/keywords/trending")
 async def get_trending_keywords(
-    days: int = 30,
+    days: int = Query(30, ge=1, le=365),
+    limit: int = Query(10, ge=1, le=100),
+    nursing_home_id: Optional[int] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """인기 키워드 조회"""
+    """인기 키워드 조회 (일자별 키워드 카운터 합산, 요양원별 필터 가능)"""
     try:
         # 관리자만 접근 가능
         if current_user.user_type != "admin":
@@ -337,18 +367,20 @@ async def get_trending_keywords(
                 detail="관리자 권한이 필요합니다."
             )
         
-        # AI 리포트 서비스 초기화
-        ai_report_service = AIReportService(db)
-        
         # 인기 키워드 조회
-        trending_keywords = await ai_report_service.get_trending_keywords(days=days)
+        trending_keywords = await TrendingKeywordService(db).get_trending(
+            days=days, limit=limit, nursing_home_id=nursing_home_id
+        )
         
         return {
             "trending_keywords": trending_keywords,
             "period_days": days,
+            "nursing_home_id": nursing_home_id,
             "message": "인기 키워드를 성공적으로 조회했습니다."
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -356,59 +388,97 @@ async def get_trending_keywords(
         )
 
 # AI 분석 트리거 및 콜백 엔드포인트 추가
-from app.services.ai_trigger import AIAnalysisTrigger
-from app.models.enhanced_care import WeeklyChecklistScore, SpecialNote
+from app.services.analysis_queue import analysis_queue
+from app.config import settings
+from app.models.enhanced_care import SpecialNote
+from app.services.time_series import TimeSeriesService
 
-@router.post("/trigger-ai-analysis")
+@router.post("/trigger-ai-analysis", status_code=status.HTTP_202_ACCEPTED)
 async def trigger_ai_analysis(
     care_session_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """AI 분석 트리거 (백엔드 내부 처리)"""
+    """AI 분석 트리거 (백그라운드 작업 등록 후 즉시 202 응답, 진행 상태는 analysis-status로 조회)"""
     
     # 케어 세션 및 권한 확인
-    care_session = db.query(CareSession).filter(
-        CareSession.id == care_session_id
-    ).first()
+    care_session = await db.get(CareSession, care_session_id)
     
     if not care_session:
         raise HTTPException(status_code=404, detail="케어 세션을 찾을 수 없습니다")
     
-    # AI 분석 서비스 실행
-    ai_trigger = AIAnalysisTrigger(db)
+    await ensure_session_access(db, current_user, care_session)
+    
     try:
-        result = await ai_trigger.analyze_care_session(care_session_id)
-        return result
+        report = await analysis_queue.enqueue(db, care_session_id)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, 
-            detail=f"AI 분석 실행 실패: {str(e)}"
+            detail=f"AI 분석 등록 실패: {str(e)}"
         )
+    
+    return {
+        "success": True,
+        "message": "AI 분석이 등록되었습니다",
+        "care_session_id": care_session_id,
+        "report_id": report.id if report else None,
+        "ai_processing_status": report.ai_processing_status if report else "pending",
+        "status_url": f"/api/ai/analysis-status/{care_session_id}"
+    }
+
+@router.get("/analysis-status/{care_session_id}")
+async def get_analysis_status(
+    care_session_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """AI 분석 진행 상태 조회 (pending, processing, completed, failed)"""
+    
+    care_session = await db.get(CareSession, care_session_id)
+    if not care_session:
+        raise HTTPException(status_code=404, detail="케어 세션을 찾을 수 없습니다")
+    
+    await ensure_session_access(db, current_user, care_session)
+    
+    result = await db.execute(select(AIReport).where(
+        AIReport.care_session_id == care_session_id
+    ))
+    report = result.scalars().first()
+    
+    # 첫 분석이 끝나기 전에는 리포트가 없으므로 큐/작업 상태로 응답
+    processing_status = report.ai_processing_status if report else await analysis_queue.get_status(db, care_session_id)
+    if processing_status is None:
+        raise HTTPException(status_code=404, detail="등록된 AI 분석이 없습니다")
+    
+    return {
+        "care_session_id": care_session_id,
+        "report_id": report.id if report else None,
+        "ai_processing_status": processing_status,
+        "queued": analysis_queue.is_queued(care_session_id),
+        "error": await analysis_queue.get_error(db, care_session_id) if processing_status == "failed" else None
+    }
 
 @router.get("/weekly-scores/{senior_id}")
 async def get_weekly_scores(
     senior_id: int,
-    weeks: int = 4,
+    weeks: Optional[int] = Query(None, ge=1, le=settings.trend_series_max_weeks),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """시니어의 주간 점수 조회"""
+    """시니어의 주간 점수 조회 (기본 trend_analysis_weeks 주)"""
     
-    from datetime import datetime, timedelta
+    from datetime import date, timedelta
     
     # 권한 확인
-    senior = db.query(Senior).filter(Senior.id == senior_id).first()
+    senior = await db.get(Senior, senior_id)
     if not senior:
         raise HTTPException(status_code=404, detail="시니어를 찾을 수 없습니다")
     
     # 최근 N주 데이터 조회
-    weeks_ago = datetime.now() - timedelta(weeks=weeks)
-    
-    weekly_scores = db.query(WeeklyChecklistScore).filter(
-        WeeklyChecklistScore.senior_id == senior_id,
-        WeeklyChecklistScore.week_start_date >= weeks_ago.date()
-    ).order_by(WeeklyChecklistScore.week_start_date).all()
+    weeks = weeks or settings.trend_analysis_weeks
+    weekly_scores = await TimeSeriesService(db).weekly_scores(senior_id, date.today() - timedelta(weeks=weeks))
     
     return {
         "senior_id": senior_id,
@@ -432,19 +502,20 @@ async def get_special_notes(
     senior_id: int,
     limit: int = 10,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """시니어의 특이사항 조회"""
     
     # 권한 확인
-    senior = db.query(Senior).filter(Senior.id == senior_id).first()
+    senior = await db.get(Senior, senior_id)
     if not senior:
         raise HTTPException(status_code=404, detail="시니어를 찾을 수 없습니다")
     
     # 최근 특이사항 조회
-    special_notes = db.query(SpecialNote).filter(
+    result = await db.execute(select(SpecialNote).where(
         SpecialNote.senior_id == senior_id
-    ).order_by(SpecialNote.created_at.desc()).limit(limit).all()
+    ).order_by(SpecialNote.created_at.desc()).limit(limit))
+    special_notes = result.scalars().all()
     
     return {
         "senior_id": senior_id,
@@ -2,11 +2,13 @@
 케어기버 관련 라우터
 """
 from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime, date
 
 from ..database import get_db
+from ..loaders import columns_only
 from ..models import User, Senior, CareSession, ChecklistResponse, CareNote, Notification
 from ..schemas import (
     CareSessionResponse, SeniorResponse, ChecklistSubmission, CareNoteSubmission,
@@ -21,7 +23,7 @@ router = APIRouter()
 @router.get("/home", response_model=CaregiverHomeResponse)
 async def get_caregiver_home(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """케어기버 홈 화면 데이터 조회"""
     try:
@@ -34,23 +36,26 @@ async def get_caregiver_home(
         
         caregiver = current_user.caregiver_profile
         
-        # 오늘 날짜 기준 돌봄 세션 조회
+        # 오늘 날짜 기준 돌봄 세션 조회 (응답은 컬럼만 사용 - 관계 로드 없음)
         today = date.today()
-        today_sessions = db.query(CareSession).filter(
+        result = await db.execute(select(CareSession).options(*columns_only()).where(
             CareSession.caregiver_id == caregiver.id,
             CareSession.created_at >= today
-        ).all()
+        ))
+        today_sessions = result.scalars().all()
         
         # 담당 시니어 목록 조회
-        seniors = db.query(Senior).filter(
+        result = await db.execute(select(Senior).options(*columns_only()).where(
             Senior.caregiver_id == caregiver.id
-        ).all()
+        ))
+        seniors = result.scalars().all()
         
         # 읽지 않은 알림 조회
-        notifications = db.query(Notification).filter(
+        result = await db.execute(select(Notification).options(*columns_only()).where(
             Notification.receiver_id == current_user.id,
             Notification.is_read == False
-        ).order_by(Notification.created_at.desc()).limit(10).all()
+        ).order_by(Notification.created_at.desc()).limit(10))
+        notifications = result.scalars().all()
         
         return CaregiverHomeResponse(
             caregiver_name=caregiver.name,
@@ -68,7 +73,7 @@ async def get_caregiver_home(
 @router.get("/seniors", response_model=List[SeniorResponse])
 async def get_assigned_seniors(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """담당 시니어 목록 조회"""
     try:
@@ -81,11 +86,11 @@ async def get_assigned_seniors(
         
         caregiver = current_user.caregiver_profile
         
-        seniors = db.query(Senior).filter(
+        result = await db.execute(select(Senior).where(
             Senior.caregiver_id == caregiver.id
-        ).all()
+        ))
         
-        return seniors
+        return result.scalars().all()
         
     except Exception as e:
         raise HTTPException(
@@ -99,7 +104,7 @@ async def check_in_attendance(
     location: str = Form(...),
     photo: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """출근 체크인"""
     try:
@@ -113,7 +118,7 @@ async def check_in_attendance(
         caregiver = current_user.caregiver_profile
         
         # 시니어 확인
-        senior = db.query(Senior).filter(Senior.id == senior_id).first()
+        senior = await db.get(Senior, senior_id)
         if not senior:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -135,8 +140,8 @@ async def check_in_attendance(
         )
         
         db.add(care_session)
-        db.commit()
-        db.refresh(care_session)
+        await db.commit()
+        await db.refresh(care_session)
         
         return {
             "message": "출근 체크가 완료되었습니다.",
@@ -156,15 +161,16 @@ async def check_out_attendance(
     location: str = Form(...),
     photo: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """퇴근 체크아웃"""
     try:
         # 돌봄 세션 조회
-        care_session = db.query(CareSession).filter(
+        result = await db.execute(select(CareSession).where(
             CareSession.id == session_id,
             CareSession.caregiver_id == current_user.id
-        ).first()
+        ))
+        care_session = result.scalars().first()
         
         if not care_session:
             raise HTTPException(
@@ -188,7 +194,7 @@ async def check_out_attendance(
         care_session.end_photo = photo_path
         care_session.status = "completed"
         
-        db.commit()
+        await db.commit()
         
         return {
             "message": "퇴근 체크가 완료되었습니다.",
@@ -207,12 +213,12 @@ async def check_out_attendance(
 async def get_checklist_template(
     senior_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """체크리스트 템플릿 조회"""
     try:
         # 시니어 정보 조회
-        senior = db.query(Senior).filter(Senior.id == senior_id).first()
+        senior = await db.get(Senior, senior_id)
         if not senior:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -221,7 +227,7 @@ async def get_checklist_template(
         
         # 케어 서비스를 통해 체크리스트 템플릿 생성
         care_service = CareService(db)
-        template = care_service.get_checklist_template(senior)
+        template = await care_service.get_checklist_template(senior)
         
         return {
             "senior_info": senior,
@@ -238,15 +244,16 @@ async def get_checklist_template(
 async def submit_checklist(
     checklist_data: ChecklistSubmission,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """체크리스트 제출"""
     try:
         # 돌봄 세션 확인
-        care_session = db.query(CareSession).filter(
+        result = await db.execute(select(CareSession).where(
             CareSession.id == checklist_data.session_id,
             CareSession.caregiver_id == current_user.id
-        ).first()
+        ))
+        care_session = result.scalars().first()
         
         if not care_session:
             raise HTTPException(
@@ -265,7 +272,7 @@ async def submit_checklist(
             )
             db.add(checklist_response)
         
-        db.commit()
+        await db.commit()
         
         return {
             "message": "체크리스트가 성공적으로 제출되었습니다.",
@@ -283,15 +290,16 @@ async def submit_checklist(
 async def submit_care_note(
     care_note_data: CareNoteSubmission,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """돌봄노트 제출"""
     try:
         # 돌봄 세션 확인
-        care_session = db.query(CareSession).filter(
+        result = await db.execute(select(CareSession).where(
             CareSession.id == care_note_data.session_id,
             CareSession.caregiver_id == current_user.id
-        ).first()
+        ))
+        care_session = result.scalars().first()
         
         if not care_session:
             raise HTTPException(
@@ -309,7 +317,7 @@ async def submit_care_note(
             )
             db.add(care_note)
         
-        db.commit()
+        await db.commit()
         
         return {
             "message": "돌봄노트가 성공적으로 제출되었습니다.",
@@ -328,20 +336,21 @@ async def get_care_history(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """돌봄 이력 조회"""
     try:
-        query = db.query(CareSession).filter(
+        query = select(CareSession).where(
             CareSession.caregiver_id == current_user.id
         )
         
         if start_date:
-            query = query.filter(CareSession.start_time >= start_date)
+            query = query.where(CareSession.start_time >= start_date)
         if end_date:
-            query = query.filter(CareSession.start_time <= end_date)
+            query = query.where(CareSession.start_time <= end_date)
         
-        care_sessions = query.order_by(CareSession.start_time.desc()).all()
+        result = await db.execute(query.order_by(CareSession.start_time.desc()))
+        care_sessions = result.scalars().all()
         
         return {
             "care_sessions": care_sessions,
@@ -357,18 +366,18 @@ async def get_care_history(
 @router.get("/profile")
 async def get_caregiver_profile(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """케어기버 프로필 조회"""
     try:
         return {
             "user_info": current_user,
-            "assigned_seniors_count": db.query(Senior).filter(
+            "assigned_seniors_count": await db.scalar(select(func.count(Senior.id)).where(
                 Senior.caregiver_id == current_user.id
-            ).count(),
-            "total_sessions": db.query(CareSession).filter(
+            )),
+            "total_sessions": await db.scalar(select(func.count(CareSession.id)).where(
                 CareSession.caregiver_id == current_user.id
-            ).count()
+            ))
         }
         
     except Exception as e:
@@ -385,7 +394,7 @@ from app.models.enhanced_care import CareSchedule
 async def get_care_schedule(
     senior_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """시니어별 케어 스케줄 조회"""
     
@@ -393,11 +402,12 @@ async def get_care_schedule(
     if not current_user.caregiver_profile:
         raise HTTPException(status_code=403, detail="케어기버 권한이 필요합니다")
     
-    schedules = db.query(CareSchedule).filter(
+    result = await db.execute(select(CareSchedule).where(
         CareSchedule.senior_id == senior_id,
         CareSchedule.caregiver_id == current_user.caregiver_profile.id,
         CareSchedule.is_active == True
-    ).all()
+    ))
+    schedules = result.scalars().all()
     
     # 요일명 매핑
     day_names = ["일", "월", "화", "수", "목", "금", "토"]
@@ -437,7 +447,7 @@ def calculate_next_care_date(day_of_week: int) -> date:
 async def create_care_schedule(
     schedule_data: dict,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """새로운 케어 스케줄 생성"""
     
@@ -445,12 +455,13 @@ async def create_care_schedule(
         raise HTTPException(status_code=403, detail="케어기버 권한이 필요합니다")
     
     # 중복 스케줄 확인
-    existing = db.query(CareSchedule).filter(
+    result = await db.execute(select(CareSchedule).where(
         CareSchedule.senior_id == schedule_data["senior_id"],
         CareSchedule.caregiver_id == current_user.caregiver_profile.id,
         CareSchedule.day_of_week == schedule_data["day_of_week"],
         CareSchedule.is_active == True
-    ).first()
+    ))
+    existing = result.scalars().first()
     
     if existing:
         raise HTTPException(status_code=400, detail="해당 요일에 이미 스케줄이 있습니다")
@@ -465,8 +476,8 @@ async def create_care_schedule(
     )
     
     db.add(new_schedule)
-    db.commit()
-    db.refresh(new_schedule)
+    await db.commit()
+    await db.refresh(new_schedule)
     
     return {
         "message": "케어 스케줄이 생성되었습니다",
@@ -0,0 +1,59 @@
+"""
+실시간 이벤트 라우터 (Server-Sent Events)
+"""
+import json
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+
+from ..config import settings
+from ..database import AsyncSessionLocal
+from ..models import User
+from ..services.auth import get_current_user, security
+from ..services.realtime import get_realtime_broker
+
+router = APIRouter()
+
+async def get_stream_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
+    """로그인 토큰 검증 (스트림이 열려 있는 동안 DB 세션을 잡고 있지 않도록 짧은 세션 사용)"""
+    async with AsyncSessionLocal() as db:
+        return await get_current_user(credentials, db)
+
+def format_event(event: str, data: dict) -> str:
+    """SSE 메시지 형식"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+@router.get("/stream")
+async def stream_events(request: Request, current_user: User = Depends(get_stream_user)):
+    """
+    알림/리포트 실시간 이벤트 스트림 (text/event-stream)
+
+    - ready: 연결 직후 한 번
+    - notification: 새 알림 (id, type, title, content, data, created_at)
+    - report: 담당 시니어의 AI 리포트 생성/갱신 (report_id, care_session_id, senior_id)
+    - resync: 전달하지 못한 이벤트가 밀려 버려졌으니 화면 전체 재조회 필요
+
+    이벤트가 없으면 realtime_heartbeat_seconds 마다 주석(ping)을 보내 연결을 유지합니다.
+    """
+    subscription = get_realtime_broker().subscribe(current_user.id)
+
+    async def event_stream():
+        try:
+            yield format_event("ready", {"user_id": current_user.id})
+            while not await request.is_disconnected():
+                try:
+                    message = await subscription.get(settings.realtime_heartbeat_seconds)
+                except StopAsyncIteration:
+                    break
+                if message is None:
+                    yield ": ping\n\n"
+                else:
+                    yield format_event(message["event"], message["data"])
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,8 +1,9 @@
 """
 가디언 관련 라우터
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime, date
 
@@ -12,42 +13,38 @@ from ..schemas import (
     GuardianHomeResponse, AIReportResponse, FeedbackSubmission, 
     SeniorResponse, NotificationResponse
 )
-from ..services.auth import get_current_user
+from ..services.auth import get_current_user, get_current_guardian
+from ..loaders import report_with_session
+from ..pagination import keyset_paginate
+from ..response_models import PaginatedResponse, cursor_paginated_response
 from ..services.notification import NotificationService
+from ..services.guardian_home import GuardianHomeService, invalidate_guardian_home
 
 router = APIRouter()
 
+def get_guardian_id(current_user: User) -> int:
+    """
+    현재 가디언의 프로필 ID (seniors.guardian_id, feedbacks.guardian_id 기준)
+    
+    get_current_guardian 으로 인증된 사용자만 전달해야 합니다.
+    None 으로 비교하면 IS NULL 조건이 되어 가디언이 없는 시니어가 조회되므로 허용하지 않습니다.
+    """
+    return current_user.guardian_profile.id
+
+async def get_guardian_senior_ids(db: AsyncSession, guardian_id: int) -> List[int]:
+    """가디언이 담당하는 시니어 ID 목록 조회"""
+    result = await db.execute(select(Senior.id).where(Senior.guardian_id == guardian_id))
+    return list(result.scalars().all())
+
 @router.get("/home", response_model=GuardianHomeResponse)
 async def get_guardian_home(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_guardian),
+    db: AsyncSession = Depends(get_db)
 ):
-    """가디언 홈 화면 데이터 조회"""
+    """가디언 홈 화면 데이터 조회 (시니어 + 최근 리포트 + 읽지 않은 알림)"""
     try:
-        # 담당 시니어 목록 조회
-        seniors = db.query(Senior).filter(
-            Senior.guardian_id == current_user.id
-        ).all()
-        
-        senior_ids = [senior.id for senior in seniors]
-        
-        # 최근 리포트 조회 (최근 10개)
-        recent_reports = db.query(AIReport).join(CareSession).filter(
-            CareSession.senior_id.in_(senior_ids)
-        ).order_by(AIReport.created_at.desc()).limit(10).all()
-        
-        # 읽지 않은 알림 조회
-        unread_notifications = db.query(Notification).filter(
-            Notification.receiver_id == current_user.id,
-            Notification.is_read == False
-        ).order_by(Notification.created_at.desc()).limit(10).all()
-        
-        return GuardianHomeResponse(
-            guardian_name=current_user.name,
-            seniors=seniors,
-            recent_reports=recent_reports,
-            unread_notifications=unread_notifications
-        )
+        home_service = GuardianHomeService(db)
+        return await home_service.get_home(current_user)
         
     except Exception as e:
         raise HTTPException(
@@ -57,16 +54,16 @@ async def get_guardian_home(
 
 @router.get("/seniors", response_model=List[SeniorResponse])
 async def get_guardian_seniors(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_guardian),
+    db: AsyncSession = Depends(get_db)
 ):
     """담당 시니어 목록 조회"""
     try:
-        seniors = db.query(Senior).filter(
-            Senior.guardian_id == current_user.id
-        ).all()
+        result = await db.execute(select(Senior).where(
+            Senior.guardian_id == get_guardian_id(current_user)
+        ))
         
-        return seniors
+        return result.scalars().all()
         
     except Exception as e:
         raise HTTPException(
@@ -74,45 +71,52 @@ async def get_guardian_seniors(
             detail=f"시니어 목록 조회 중 오류가 발생했습니다: {str(e)}"
         )
 
-@router.get("/reports", response_model=List[AIReportResponse])
+@router.get("/reports", response_model=PaginatedResponse[AIReportResponse])
 async def get_reports(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     senior_id: Optional[int] = None,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    size: Optional[int] = None,
+    current_user: User = Depends(get_current_guardian),
+    db: AsyncSession = Depends(get_db)
 ):
-    """AI 리포트 목록 조회"""
+    """AI 리포트 목록 조회 (최신순 커서 페이지네이션, 다음 페이지는 next_cursor 전달)"""
     try:
         # 가디언이 담당하는 시니어들 조회
-        seniors = db.query(Senior).filter(
-            Senior.guardian_id == current_user.id
-        ).all()
-        
-        senior_ids = [senior.id for senior in seniors]
+        senior_ids = await get_guardian_senior_ids(db, get_guardian_id(current_user))
         
         # 리포트 쿼리 작성
-        query = db.query(AIReport).join(CareSession).filter(
+        query = select(AIReport).join(CareSession).where(
             CareSession.senior_id.in_(senior_ids)
         )
         
         # 필터 적용
         if start_date:
-            query = query.filter(AIReport.created_at >= start_date)
+            query = query.where(AIReport.created_at >= start_date)
         if end_date:
-            query = query.filter(AIReport.created_at <= end_date)
+            query = query.where(AIReport.created_at <= end_date)
         if senior_id:
             if senior_id not in senior_ids:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="해당 시니어의 리포트에 접근할 권한이 없습니다."
                 )
-            query = query.filter(CareSession.senior_id == senior_id)
+            query = query.where(CareSession.senior_id == senior_id)
         
-        reports = query.order_by(AIReport.created_at.desc()).all()
+        reports, next_cursor, page_size = await keyset_paginate(
+            db, query, AIReport.created_at, AIReport.id, cursor=cursor, size=size
+        )
         
-        return reports
+        return cursor_paginated_response(
+            items=[AIReportResponse.model_validate(report) for report in reports],
+            size=page_size,
+            next_cursor=next_cursor,
+            has_previous=cursor is not None
+        )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -122,31 +126,28 @@ async def get_reports(
 @router.get("/reports/{report_id}")
 async def get_report_detail(
     report_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_guardian),
+    db: AsyncSession = Depends(get_db)
 ):
     """AI 리포트 상세 조회"""
     try:
-        # 리포트 조회
-        report = db.query(AIReport).filter(AIReport.id == report_id).first()
+        # 리포트 조회 (세션, 케어기버, 시니어를 한 번에 로드)
+        result = await db.execute(select(AIReport).options(
+            *report_with_session()
+        ).where(AIReport.id == report_id))
+        report = result.scalars().first()
         if not report:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="리포트를 찾을 수 없습니다."
             )
         
-        # 세션 정보 조회
-        session = db.query(CareSession).filter(
-            CareSession.id == report.session_id
-        ).first()
-        
-        # 시니어 정보 조회
-        senior = db.query(Senior).filter(
-            Senior.id == session.senior_id
-        ).first()
+        # 세션 및 시니어 정보
+        session = report.care_session
+        senior = session.senior
         
         # 권한 확인
-        if senior.guardian_id != current_user.id:
+        if senior.guardian_id != get_guardian_id(current_user):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="해당 리포트에 접근할 권한이 없습니다."
@@ -155,7 +156,7 @@ async def get_report_detail(
         # 리포트 읽음 상태 업데이트
         if report.status == "generated":
             report.status = "read"
-            db.commit()
+            await db.commit()
         
         return {
             "report": report,
@@ -164,6 +165,8 @@ async def get_report_detail(
             "caregiver": session.caregiver
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -173,15 +176,13 @@ async def get_report_detail(
 @router.post("/feedback")
 async def submit_feedback(
     feedback_data: FeedbackSubmission,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_guardian),
+    db: AsyncSession = Depends(get_db)
 ):
     """피드백 제출"""
     try:
         # 리포트 존재 확인
-        report = db.query(AIReport).filter(
-            AIReport.id == feedback_data.report_id
-        ).first()
+        report = await db.get(AIReport, feedback_data.report_id)
         
         if not report:
             raise HTTPException(
@@ -190,16 +191,12 @@ async def submit_feedback(
             )
         
         # 세션 및 시니어 정보 조회
-        session = db.query(CareSession).filter(
-            CareSession.id == report.session_id
-        ).first()
+        session = await db.get(CareSession, report.care_session_id)
         
-        senior = db.query(Senior).filter(
-            Senior.id == session.senior_id
-        ).first()
+        senior = await db.get(Senior, session.senior_id)
         
         # 권한 확인
-        if senior.guardian_id != current_user.id:
+        if senior.guardian_id != get_guardian_id(current_user):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="해당 리포트에 피드백할 권한이 없습니다."
@@ -207,16 +204,16 @@ async def submit_feedback(
         
         # 피드백 생성
         feedback = Feedback(
-            report_id=feedback_data.report_id,
-            guardian_id=current_user.id,
+            ai_report_id=feedback_data.report_id,
+            guardian_id=get_guardian_id(current_user),
             message=feedback_data.message,
             requirements=feedback_data.requirements,
             status="pending"
         )
         
         db.add(feedback)
-        db.commit()
-        db.refresh(feedback)
+        await db.commit()
+        await db.refresh(feedback)
         
         # 케어기버에게 알림 전송
         notification_service = NotificationService(db)
@@ -235,6 +232,8 @@ async def submit_feedback(
             "status": "pending"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -243,14 +242,15 @@ async def submit_feedback(
 
 @router.get("/feedback/history")
 async def get_feedback_history(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_guardian),
+    db: AsyncSession = Depends(get_db)
 ):
     """피드백 이력 조회"""
     try:
-        feedbacks = db.query(Feedback).filter(
-            Feedback.guardian_id == current_user.id
-        ).order_by(Feedback.created_at.desc()).all()
+        result = await db.execute(select(Feedback).where(
+            Feedback.guardian_id == get_guardian_id(current_user)
+        ).order_by(Feedback.created_at.desc()))
+        feedbacks = result.scalars().all()
         
         return {
             "feedbacks": feedbacks,
@@ -267,20 +267,20 @@ async def get_feedback_history(
 async def get_notifications(
     unread_only: bool = False,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """알림 목록 조회"""
     try:
-        query = db.query(Notification).filter(
+        query = select(Notification).where(
             Notification.receiver_id == current_user.id
         )
         
         if unread_only:
-            query = query.filter(Notification.is_read == False)
+            query = query.where(Notification.is_read == False)
         
-        notifications = query.order_by(Notification.created_at.desc()).all()
+        result = await db.execute(query.order_by(Notification.created_at.desc()))
         
-        return notifications
+        return result.scalars().all()
         
     except Exception as e:
         raise HTTPException(
@@ -292,14 +292,15 @@ async def get_notifications(
 async def mark_notification_read(
     notification_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """알림 읽음 처리"""
     try:
-        notification = db.query(Notification).filter(
+        result = await db.execute(select(Notification).where(
             Notification.id == notification_id,
             Notification.receiver_id == current_user.id
-        ).first()
+        ))
+        notification = result.scalars().first()
         
         if not notification:
             raise HTTPException(
@@ -310,7 +311,8 @@ async def mark_notification_read(
         notification.is_read = True
         notification.read_at = datetime.utcnow()
         
-        db.commit()
+        await db.commit()
+        invalidate_guardian_home(current_user.id)
         
         return {"message": "알림이 읽음 처리되었습니다."}
         
@@ -322,35 +324,29 @@ async def mark_notification_read(
 
 @router.get("/profile")
 async def get_guardian_profile(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_guardian),
+    db: AsyncSession = Depends(get_db)
 ):
     """가디언 프로필 조회"""
     try:
-        # 담당 시니어 수 조회
-        seniors_count = db.query(Senior).filter(
-            Senior.guardian_id == current_user.id
-        ).count()
+        guardian_id = get_guardian_id(current_user)
         
-        # 총 리포트 수 조회
-        seniors = db.query(Senior).filter(
-            Senior.guardian_id == current_user.id
-        ).all()
+        # 담당 시니어 조회
+        senior_ids = await get_guardian_senior_ids(db, guardian_id)
         
-        senior_ids = [senior.id for senior in seniors]
-        
-        total_reports = db.query(AIReport).join(CareSession).filter(
+        # 총 리포트 수 조회
+        total_reports = await db.scalar(select(func.count(AIReport.id)).join(CareSession).where(
             CareSession.senior_id.in_(senior_ids)
-        ).count()
+        ))
         
         return {
             "user_info": current_user,
-            "assigned_seniors_count": seniors_count,
+            "assigned_seniors_count": len(senior_ids),
             "total_reports": total_reports,
-            "pending_feedback": db.query(Feedback).filter(
-                Feedback.guardian_id == current_user.id,
+            "pending_feedback": await db.scalar(select(func.count(Feedback.id)).where(
+                Feedback.guardian_id == guardian_id,
                 Feedback.status == "pending"
-            ).count()
+            ))
         }
         
     except Exception as e:
@@ -360,31 +356,64 @@ async def get_guardian_profile(
         )
 
 # 추이 분석 엔드포인트 추가
+from app.config import settings
+from app.services.time_series import BUCKETS, TimeSeriesService
 from app.services.trend_analysis import TrendAnalysisService
 
 @router.get("/trend-analysis/{senior_id}")
 async def get_trend_analysis(
     senior_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_guardian),
+    db: AsyncSession = Depends(get_db)
 ):
     """시니어 상태 변화 추이 분석"""
     
     # 권한 확인 (가디언이 해당 시니어의 보호자인지)
-    senior = db.query(Senior).filter(
+    result = await db.execute(select(Senior).where(
         Senior.id == senior_id,
-        Senior.guardian_id == current_user.guardian_profile.id
-    ).first()
+        Senior.guardian_id == get_guardian_id(current_user)
+    ))
+    senior = result.scalars().first()
     
     if not senior:
         raise HTTPException(status_code=404, detail="시니어 정보를 찾을 수 없습니다")
     
     # 추이 분석 수행
     trend_service = TrendAnalysisService(db)
-    analysis = trend_service.analyze_4week_trend(senior_id)
+    analysis = await trend_service.analyze_4week_trend(senior_id)
     
     return {
         "senior_name": senior.name,
         "analysis_date": datetime.now().isoformat(),
         "trend_analysis": analysis
     }
+
+@router.get("/trend-series/{senior_id}")
+async def get_trend_series(
+    senior_id: int,
+    weeks: Optional[int] = Query(None, ge=1, le=settings.trend_series_max_weeks),
+    bucket: str = Query("auto", description="auto, day, week, month (auto: 짧은 구간은 주, 긴 구간은 월)"),
+    current_user: User = Depends(get_current_guardian),
+    db: AsyncSession = Depends(get_db)
+):
+    """시니어 점수 시계열 조회 (기본 trend_analysis_weeks 주, 긴 구간은 월간 사전 집계 사용)"""
+    
+    if bucket not in BUCKETS:
+        raise HTTPException(status_code=400, detail=f"bucket 은 {', '.join(BUCKETS)} 중 하나여야 합니다")
+    
+    # 권한 확인 (가디언이 해당 시니어의 보호자인지)
+    result = await db.execute(select(Senior).where(
+        Senior.id == senior_id,
+        Senior.guardian_id == get_guardian_id(current_user)
+    ))
+    senior = result.scalars().first()
+    
+    if not senior:
+        raise HTTPException(status_code=404, detail="시니어 정보를 찾을 수 없습니다")
+    
+    series = await TimeSeriesService(db).get_series(senior_id, weeks, bucket)
+    
+    return {
+        "senior_name": senior.name,
+        **series
+    }
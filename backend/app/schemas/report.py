@@ -1,7 +1,7 @@
 """
 AI 리포트 및 피드백 관련 스키마
 """
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, AliasChoices, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -15,7 +15,7 @@ class AIReportCreate(AIReportBase):
 
 class AIReportResponse(AIReportBase):
     id: int
-    session_id: int
+    session_id: int = Field(validation_alias=AliasChoices("session_id", "care_session_id"))
     keywords: List[str] = []
     status: str = "generated"
     created_at: datetime
@@ -0,0 +1,354 @@
+"""
+AI 분석 제공자
+
+케어 세션 분석(코멘트/키워드/추이/특이사항) 생성을 제공자 인터페이스로 분리합니다.
+    template: 프로세스 내 템플릿 분석 (기본값, AIAnalysisTrigger._generate_basic_analysis)
+    http:     외부 AI 서비스 (settings.ai_service_url)
+
+HTTP 제공자는 세션마다 직렬로 네트워크 왕복을 하지 않도록
+    - 공유 AsyncClient 커넥션 풀 (keep-alive)
+    - 호출별 타임아웃, 지터를 준 지수 백오프 재시도
+    - 연속 실패 시 회로 차단기(circuit breaker)로 즉시 실패
+    - 짧은 시간창 동안 들어온 요청을 묶어 한 번에 전송 (POST /v1/analyze/batch)
+을 사용합니다.
+
+요청/응답 형식 (JSON)
+    요청: {"requests": [build_analysis_request(...), ...]}
+    응답: {"results": [{"ai_comment", "keywords", "trend_analysis", "special_notes"}, ...]}  (요청 순서)
+"""
+import asyncio
+import logging
+import random
+import time
+import weakref
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger("ai_provider")
+
+RESULT_FIELDS = ("ai_comment", "keywords", "trend_analysis", "special_notes")
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+class AIProviderError(Exception):
+    """AI 제공자 호출 실패"""
+
+class AIProviderUnavailable(AIProviderError):
+    """회로 차단기가 열려 호출하지 않음"""
+
+def build_analysis_request(
+    care_session_id: int,
+    senior,
+    checklist_responses: List,
+    care_notes: List,
+    previous_data: List[Dict[str, Any]],
+    total_score: int,
+    score_percentage: float
+) -> Dict[str, Any]:
+    """분석 요청 (JSON 직렬화 가능한 형태)"""
+    return {
+        "care_session_id": care_session_id,
+        "senior": {"name": senior.name},
+        "checklist_responses": [
+            {
+                "question_key": response.question_key,
+                "answer": response.answer,
+                "notes": response.notes,
+                "score_value": response.score_value
+            }
+            for response in checklist_responses
+        ],
+        "care_notes": [{"content": note.content} for note in care_notes],
+        "previous_data": previous_data,
+        "total_score": total_score,
+        "score_percentage": score_percentage
+    }
+
+class AIProvider(ABC):
+    """AI 분석 제공자 인터페이스"""
+    name = "base"
+
+    async def analyze(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """세션 한 건 분석"""
+        results = await self.analyze_batch([request])
+        return results[0]
+
+    @abstractmethod
+    async def analyze_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """세션 여러 건 분석 (요청 순서대로 결과 반환)"""
+
+    async def close(self):
+        """보유 자원 정리"""
+
+    def stats(self) -> dict:
+        return {"provider": self.name}
+
+class TemplateAIProvider(AIProvider):
+    """프로세스 내 템플릿 분석 (네트워크 호출 없음)"""
+    name = "template"
+
+    async def analyze_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [self.analyze_sync(request) for request in requests]
+
+    def analyze_sync(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # ai_trigger 가 이 모듈을 사용하므로 순환 임포트를 피해 지연 임포트
+        from app.services.ai_trigger import AIAnalysisTrigger
+
+        result = AIAnalysisTrigger(db=None)._generate_basic_analysis(
+            SimpleNamespace(**request["senior"]),
+            [SimpleNamespace(**response) for response in request["checklist_responses"]],
+            [SimpleNamespace(**note) for note in request["care_notes"]],
+            request["previous_data"],
+            request["total_score"],
+            request["score_percentage"]
+        )
+        return {field: result[field] for field in RESULT_FIELDS}
+
+class CircuitBreaker:
+    """연속 실패 시 일정 시간 호출 차단 (closed → open → half_open → closed)"""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """호출 가능 여부 (half_open 에서는 시험 호출 하나만 허용)"""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+
+    def release_trial(self):
+        """시험 호출 종료 (취소/예상 밖 예외로 성공·실패가 기록되지 않아도 다음 시험 호출 허용)"""
+        self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        return {"state": self.state, "consecutive_failures": self._failures}
+
+class HTTPAIProvider(AIProvider):
+    """외부 AI 서비스 제공자 (커넥션 풀 + 재시도 + 회로 차단기 + 요청 묶음 전송)"""
+    name = "http"
+
+    def __init__(
+        self,
+        base_url: str = settings.ai_service_url,
+        timeout: float = settings.ai_provider_timeout_seconds,
+        connect_timeout: float = settings.ai_provider_connect_timeout_seconds,
+        max_connections: int = settings.ai_provider_max_connections,
+        max_retries: int = settings.ai_provider_max_retries,
+        retry_backoff: float = settings.ai_provider_retry_backoff_seconds,
+        batch_size: int = settings.ai_provider_batch_size,
+        batch_window_ms: int = settings.ai_provider_batch_window_ms,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window_ms / 1000
+        self.breaker = circuit_breaker or CircuitBreaker(
+            settings.ai_provider_circuit_failure_threshold,
+            settings.ai_provider_circuit_reset_seconds
+        )
+        # 이벤트 루프별 클라이언트 (커넥션은 생성한 루프에서만 사용 가능, 루프가 사라지면 항목도 제거)
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        # 이벤트 루프별 대기 묶음 (Future 와 전송 태스크는 만든 루프에서만 사용 가능)
+        self._pending: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[tuple]]" = weakref.WeakKeyDictionary()  # (요청, Future)
+        self._flush_handles: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.TimerHandle]" = weakref.WeakKeyDictionary()
+        self._send_tasks: Set[asyncio.Task] = set()  # 전송 중인 묶음 (완료 전 GC 방지)
+        self.calls = 0
+        self.retries = 0
+
+    async def analyze(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """요청을 대기열에 넣고 묶음 전송 결과를 기다림 (batch_size 도달 또는 batch_window 경과 시 전송)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(loop, [])
+        pending.append((request, future))
+
+        if len(pending) >= self.batch_size:
+            self._flush(loop)
+        elif loop not in self._flush_handles:
+            self._flush_handles[loop] = loop.call_later(self.batch_window, self._flush, loop)
+
+        return await future
+
+    async def analyze_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """batch_size 단위로 나눠 동시에 전송"""
+        chunks = [requests[i:i + self.batch_size] for i in range(0, len(requests), self.batch_size)]
+        chunk_results = await asyncio.gather(*(self._post(chunk) for chunk in chunks))
+        return [result for chunk in chunk_results for result in chunk]
+
+    async def close(self):
+        """대기 중인 묶음 전송 후 클라이언트 정리 (다른 루프의 묶음/클라이언트는 그 루프에서 처리)"""
+        current_loop = asyncio.get_running_loop()
+        self._flush(current_loop)
+        for loop in list(self._pending.keys()):
+            if loop is not current_loop and loop.is_running():
+                loop.call_soon_threadsafe(self._flush, loop)
+
+        send_tasks = [task for task in self._send_tasks if task.get_loop() is current_loop]
+        if send_tasks:
+            await asyncio.gather(*send_tasks, return_exceptions=True)
+
+        clients, self._clients = list(self._clients.items()), weakref.WeakKeyDictionary()
+        for loop, client in clients:
+            if loop is current_loop:
+                await client.aclose()
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    def stats(self) -> dict:
+        return {
+            "provider": self.name,
+            "base_url": self.base_url,
+            "calls": self.calls,
+            "retries": self.retries,
+            "pending": sum(len(batch) for batch in list(self._pending.values())),
+            "circuit": self.breaker.stats()
+        }
+
+    def _flush(self, loop: asyncio.AbstractEventLoop):
+        """해당 루프의 대기 묶음 전송 (그 루프에서 호출)"""
+        handle = self._flush_handles.pop(loop, None)
+        if handle is not None:
+            handle.cancel()
+        batch = self._pending.pop(loop, None)
+        if batch:
+            task = loop.create_task(self._send_pending(batch))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._on_send_done)
+
+    def _on_send_done(self, task: asyncio.Task):
+        self._send_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("AI 서비스 묶음 전송 태스크 실패", exc_info=task.exception())
+
+    async def _send_pending(self, batch: List[tuple]):
+        try:
+            results = await self._post([request for request, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """이벤트 루프별 공유 클라이언트 (keep-alive 커넥션 재사용)"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._clients[loop] = httpx.AsyncClient(
+                base_url=self.base_url, timeout=self.timeout, limits=self.limits
+            )
+        return client
+
+    async def _post(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """묶음 요청 한 번 전송 (재시도/회로 차단 포함)"""
+        if not self.breaker.allow():
+            raise AIProviderUnavailable("AI 서비스 회로 차단 중입니다")
+
+        try:
+            return await self._post_attempts(requests)
+        finally:
+            # 취소나 예상 밖 예외로 끝나도 half_open 시험 호출 표시를 풀어 차단기가 멈추지 않게 함
+            self.breaker.release_trial()
+
+    async def _post_attempts(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        client = self._get_client()
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.retries += 1
+                # full jitter: 0 ~ backoff * 2^(attempt-1)
+                await asyncio.sleep(random.uniform(0, self.retry_backoff * (2 ** (attempt - 1))))
+            try:
+                self.calls += 1
+                response = await client.post("/v1/analyze/batch", json={"requests": requests})
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    last_error = AIProviderError(f"AI 서비스 응답 오류: HTTP {response.status_code}")
+                    continue
+                response.raise_for_status()
+                results = self._parse_results(response.json(), len(requests))
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                last_error = e
+                continue
+            except (httpx.HTTPStatusError, ValueError, KeyError, TypeError) as e:
+                # 재시도해도 같은 결과가 나오는 오류
+                self.breaker.record_failure()
+                raise AIProviderError(f"AI 서비스 응답을 처리할 수 없습니다: {e}") from e
+
+            self.breaker.record_success()
+            return results
+
+        self.breaker.record_failure()
+        raise AIProviderError(f"AI 서비스 호출 실패 ({self.max_retries + 1}회 시도): {last_error}") from last_error
+
+    def _parse_results(self, body: Dict[str, Any], expected: int) -> List[Dict[str, Any]]:
+        results = body["results"]
+        if len(results) != expected:
+            raise ValueError(f"결과 수 불일치 (요청 {expected}건, 응답 {len(results)}건)")
+        return [
+            {
+                "ai_comment": result["ai_comment"],
+                "keywords": list(result.get("keywords") or []),
+                "trend_analysis": result.get("trend_analysis") or {},
+                "special_notes": result.get("special_notes") or ""
+            }
+            for result in results
+        ]
+
+_providers: Dict[str, AIProvider] = {}
+
+def get_ai_provider(name: Optional[str] = None) -> AIProvider:
+    """설정(ai_provider)에 맞는 공유 제공자 인스턴스"""
+    name = name or settings.ai_provider
+    if name not in _providers:
+        if name == "template":
+            _providers[name] = TemplateAIProvider()
+        elif name == "http":
+            _providers[name] = HTTPAIProvider()
+        else:
+            raise ValueError(f"지원하지 않는 AI 제공자입니다: {name}")
+    return _providers[name]
+
+async def close_ai_providers():
+    """애플리케이션 종료 시 커넥션 풀 정리"""
+    for provider in _providers.values():
+        await provider.close()
@@ -4,11 +4,12 @@ AI 리포트 생성 서비스
 import json
 from typing import Dict, List, Any
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Senior, CareSession, ChecklistResponse, CareNote
+from app.services.note_matcher import care_note_matcher
 
 class AIReportService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     async def generate_report(
@@ -84,8 +85,7 @@ class AIReportService:
         ]
         
         if family_notes:
-            content = family_notes[0].content.lower()
-            if any(word in content for word in ["그리워", "보고싶", "가족"]):
+            if "family_longing" in care_note_matcher.scan(family_notes[0].content):
                 keywords.append("가족그리움")
         
         # 특별한 순간 키워드
@@ -95,8 +95,7 @@ class AIReportService:
         ]
         
         if special_notes:
-            content = special_notes[0].content.lower()
-            if any(word in content for word in ["웃음", "기쁨", "행복", "즐거움"]):
+            if "happy_moment" in care_note_matcher.scan(special_notes[0].content):
                 keywords.append("행복한순간")
         
         # 최대 5개 키워드 반환
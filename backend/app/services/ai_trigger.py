@@ -1,66 +1,206 @@
 """
 AI 분석 트리거 서비스 (백엔드 전용, n8n 제외)
 """
+import hashlib
 import json
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+import logging
+from typing import Dict, Any, List, Optional, Set
+from datetime import date, datetime, timedelta
+from sqlalchemy import select, case, literal_column
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import CareSession, ChecklistResponse, CareNote, AIReport, Senior
-from app.models.enhanced_care import WeeklyChecklistScore, SpecialNote
+from app.models.enhanced_care import WeeklyChecklistScore, MonthlyChecklistScore, SpecialNote
 from app.config import settings
+from app.services.guardian_home import invalidate_guardian_home_for_senior
+from app.services.realtime import publish_report_event
+from app.services.ai_provider import AIProviderError, TemplateAIProvider, build_analysis_request, get_ai_provider
+from app.services.anomaly_detector import AnomalyDetector
+from app.services.note_matcher import care_note_matcher
+from app.services.question_registry import question_registry
+from app.services.trending_keywords import TrendingKeywordService
+from app.services.time_series import TimeSeriesService
+from app.services.trend_statistics import TrendStatisticsService
+from app.services.weekly_rebuild import WeeklyScoreRebuilder, month_start_of, week_start_of
+
+logger = logging.getLogger("ai_trigger")
+
+# 기존 score_breakdown 과 새 score_breakdown 의 카테고리별 합 (ON CONFLICT DO UPDATE 에서 사용, {table} = 대상 테이블)
+BREAKDOWN_MERGE_SQL = {
+    "postgresql": (
+        "(SELECT COALESCE(json_object_agg(merged.key, merged.total), '{{}}'::json) FROM ("
+        "SELECT parts.key, SUM(parts.value::numeric) AS total FROM ("
+        "SELECT * FROM json_each_text(COALESCE({table}.score_breakdown, '{{}}'::json)) "
+        "UNION ALL SELECT * FROM json_each_text(COALESCE(excluded.score_breakdown, '{{}}'::json))"
+        ") AS parts GROUP BY parts.key) AS merged)"
+    ),
+    "sqlite": (
+        "(SELECT json_group_object(merged.key, merged.total) FROM ("
+        "SELECT parts.key, SUM(parts.value) AS total FROM ("
+        "SELECT key, value FROM json_each(COALESCE({table}.score_breakdown, '{{}}')) "
+        "UNION ALL SELECT key, value FROM json_each(COALESCE(excluded.score_breakdown, '{{}}'))"
+        ") AS parts GROUP BY parts.key) AS merged)"
+    ),
+}
+
+def breakdown_merge_column(dialect_name: str, table_name: str):
+    """score_breakdown 병합 SQL (주간/월간 점수 upsert 공용)"""
+    return literal_column(BREAKDOWN_MERGE_SQL[dialect_name].format(table=table_name))
+
+def weekly_score_to_dict(score: WeeklyChecklistScore) -> Dict[str, Any]:
+    """추이 분석 입력용 주간 점수 요약"""
+    return {
+        "week_start": score.week_start_date.isoformat(),
+        "score_percentage": float(score.score_percentage),
+        "trend_indicator": score.trend_indicator,
+        "total_score": score.total_score,
+        "checklist_count": score.checklist_count,
+        "score_breakdown": score.score_breakdown
+    }
+
+def analysis_fingerprint(scope: str, checklist_responses: List, care_notes: List, context: Optional[Dict[str, Any]] = None) -> str:
+    """
+    분석 입력 지문 (응답 답변, 노트 내용, 부가 입력, 규칙 버전의 SHA-256)
+    
+    입력과 ai_analysis_rule_version 이 같으면 분석 결과도 같으므로 scope 별 저장 지문
+    (ai_analysis: AIReport.input_fingerprint, report: AIReport.report_fingerprint)과
+    비교하여 재계산을 건너뜁니다. 규칙 버전을 올리면 모든 지문이 한 번에 무효화됩니다.
+    """
+    payload = {
+        "scope": scope,
+        "rule_version": settings.ai_analysis_rule_version,
+        "provider": settings.ai_provider,
+        "responses": [
+            [response.question_key, response.answer, response.notes]
+            for response in sorted(checklist_responses, key=lambda r: (r.question_key, r.id))
+        ],
+        "notes": [note.content for note in care_notes],
+        "context": context or {}
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+def session_analysis_fingerprint(senior, checklist_responses: List, care_notes: List, previous_data: List[Dict]) -> str:
+    """AIAnalysisTrigger 분석 결과의 입력 지문"""
+    return analysis_fingerprint(
+        "ai_analysis", checklist_responses, care_notes,
+        {"senior": senior.name, "previous": previous_data}
+    )
+
+def analyze_session_offline(senior, checklist_responses: List, care_notes: List, previous_data: List[Dict]) -> Dict[str, Any]:
+    """
+    DB 접근 없이 점수 계산 + 기본 분석 (배치 재분석 프로세스 풀용)
+    
+    answer/question_key/notes 속성을 가진 응답, content 속성을 가진 노트,
+    name 속성을 가진 시니어 객체면 ORM 객체가 아니어도 됩니다.
+    """
+    trigger = AIAnalysisTrigger(db=None)
+    total_score, score_percentage, score_breakdown = trigger._score_responses(checklist_responses)
+    ai_result = trigger._generate_basic_analysis(
+        senior, checklist_responses, care_notes, previous_data,
+        total_score, score_percentage
+    )
+    
+    return {
+        "total_score": total_score,
+        "score_percentage": score_percentage,
+        "score_breakdown": score_breakdown,
+        "response_scores": [
+            (response.id, response.score_value, response.category) for response in checklist_responses
+        ],
+        "ai_result": ai_result
+    }
 
 class AIAnalysisTrigger:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     async def analyze_care_session(self, care_session_id: int) -> Dict[str, Any]:
         """케어 세션 분석 및 AI 리포트 생성 (백엔드 전용)"""
         
         # 1. 케어 세션 데이터 수집
-        care_session = self.db.query(CareSession).filter(
+        result = await self.db.execute(select(CareSession).where(
             CareSession.id == care_session_id
-        ).first()
+        ))
+        care_session = result.scalars().first()
         
         if not care_session:
             raise ValueError("케어 세션을 찾을 수 없습니다")
         
         # 2. 체크리스트 응답 수집
-        checklist_responses = self.db.query(ChecklistResponse).filter(
+        result = await self.db.execute(select(ChecklistResponse).where(
             ChecklistResponse.care_session_id == care_session_id
-        ).all()
+        ))
+        checklist_responses = result.scalars().all()
         
         # 3. 돌봄노트 수집
-        care_notes = self.db.query(CareNote).filter(
+        result = await self.db.execute(select(CareNote).where(
             CareNote.care_session_id == care_session_id
-        ).all()
+        ))
+        care_notes = result.scalars().all()
         
         # 4. 시니어 정보 조회
-        senior = self.db.query(Senior).filter(
-            Senior.id == care_session.senior_id
-        ).first()
+        senior = await self.db.get(Senior, care_session.senior_id)
+        
+        # 5. 이전 trend_analysis_weeks 주 데이터 조회
+        previous_data = await self._get_previous_weeks_data(care_session.senior_id, care_session.start_time.date())
         
-        # 5. 이전 4주 데이터 조회
-        previous_data = self._get_previous_4weeks_data(care_session.senior_id)
+        # 입력이 이전 분석과 같으면 저장된 결과 반환 (주간 점수 중복 누적도 방지)
+        fingerprint = session_analysis_fingerprint(senior, checklist_responses, care_notes, previous_data)
+        memoized = await self._get_memoized_result(care_session_id, fingerprint)
+        if memoized:
+            return memoized
         
         # 6. 점수 계산
         total_score, score_percentage, score_breakdown = self._calculate_scores(checklist_responses)
         
-        # 7. 기본 AI 분석 (n8n 없이 내부 로직으로)
-        ai_result = self._generate_basic_analysis(
-            senior, checklist_responses, care_notes, previous_data, 
+        # 7. AI 분석 (설정된 제공자, 기본값은 내부 템플릿 분석 - 잠금 없이 실행)
+        request = build_analysis_request(
+            care_session_id, senior, checklist_responses, care_notes, previous_data,
             total_score, score_percentage
         )
+        ai_result, fallback_used = await self._run_provider(request)
         
-        # 8. AI 리포트 생성 또는 업데이트
-        ai_report = self._create_or_update_report(
-            care_session_id, ai_result, total_score, score_percentage, score_breakdown
-        )
+        # 이후 반영은 한 트랜잭션 - 같은 시니어의 분석(같은 세션의 동시 실행 포함)은 시니어 행 잠금으로 직렬화
+        await self.db.execute(select(Senior.id).where(Senior.id == senior.id).with_for_update())
+        
+        # 잠금을 기다리는 동안 같은 입력의 분석이 먼저 반영되었으면 그 결과 반환
+        memoized = await self._get_memoized_result(care_session_id, fingerprint)
+        if memoized:
+            await self.db.commit()
+            return memoized
+        
+        # 이미 점수가 집계(주간/월간/추이 통계, 이상 감지 상태)에 반영된 세션인지 (입력이 바뀐 재분석)
+        already_counted = await self.db.scalar(select(AIReport.checklist_score_total).where(
+            AIReport.care_session_id == care_session_id
+        )) is not None
+        
+        # 8. 카테고리 점수 이상 감지
+        await self._record_anomalies(care_session, checklist_responses, already_counted)
         
-        # 9. 주간 점수 업데이트
-        await self._update_weekly_score(
-            care_session_id, total_score, score_breakdown
+        # 9. AI 리포트 생성 또는 업데이트 (대체 분석 결과는 지문을 남기지 않아 다음 호출 시 재시도)
+        ai_report = await self._create_or_update_report(
+            care_session_id, ai_result, total_score, score_percentage, score_breakdown,
+            None if fallback_used else fingerprint
         )
         
+        # 10. 주간 점수 업데이트 (재분석이면 이전 점수가 이미 누적되어 있으므로 해당 주/달을 다시 집계)
+        if already_counted:
+            await self._rebuild_weekly_score(care_session)
+        else:
+            await self._update_weekly_score(
+                care_session, total_score, score_breakdown, len(checklist_responses)
+            )
+        
+        # 지문은 집계와 함께 커밋 (집계 실패 시 지문도 남지 않아 다음 호출에서 다시 분석)
+        await self.db.commit()
+        await self.db.refresh(ai_report)
+        
+        # 담당 가디언 홈 캐시 무효화 및 실시간 이벤트 발행
+        await invalidate_guardian_home_for_senior(self.db, care_session.senior_id)
+        await publish_report_event(self.db, care_session.senior_id, ai_report.id, care_session_id)
+        
         return {
             "success": True,
             "message": "AI 분석이 완료되었습니다",
@@ -68,31 +208,95 @@ class AIAnalysisTrigger:
             "ai_result": ai_result
         }
     
-    def _get_previous_4weeks_data(self, senior_id: int) -> List[Dict[str, Any]]:
-        """최근 4주 데이터 조회"""
-        four_weeks_ago = datetime.now() - timedelta(weeks=4)
-        
-        weekly_scores = self.db.query(WeeklyChecklistScore).filter(
-            WeeklyChecklistScore.senior_id == senior_id,
-            WeeklyChecklistScore.week_start_date >= four_weeks_ago.date()
-        ).order_by(WeeklyChecklistScore.week_start_date).all()
-        
-        return [
-            {
-                "week_start": score.week_start_date.isoformat(),
-                "score_percentage": float(score.score_percentage),
-                "trend_indicator": score.trend_indicator,
-                "total_score": score.total_score,
-                "checklist_count": score.checklist_count,
-                "score_breakdown": score.score_breakdown
-            } for score in weekly_scores
-        ]
+    async def _run_provider(self, request: Dict[str, Any]) -> tuple:
+        """제공자 분석 실행 - (분석 결과, 템플릿 대체 여부)"""
+        provider = get_ai_provider()
+        fallback_used = False
+        
+        try:
+            result = await provider.analyze(request)
+        except AIProviderError as e:
+            if not settings.ai_provider_fallback_to_template:
+                raise
+            logger.warning(f"AI 제공자 호출 실패, 템플릿 분석으로 대체: care_session_id={request['care_session_id']} ({e})")
+            result = TemplateAIProvider().analyze_sync(request)
+            fallback_used = True
+        
+        ai_result = {
+            **result,
+            "total_score": request["total_score"],
+            "score_percentage": request["score_percentage"]
+        }
+        return ai_result, fallback_used
+    
+    async def _get_memoized_result(self, care_session_id: int, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """입력 지문이 같은 완료된 리포트가 있으면 저장된 분석 결과 반환 (다른 트랜잭션이 커밋한 최신 값 기준)"""
+        result = await self.db.execute(select(AIReport).where(
+            AIReport.care_session_id == care_session_id
+        ).execution_options(populate_existing=True))
+        report = result.scalars().first()
+        
+        if not report or report.input_fingerprint != fingerprint:
+            return None
+        
+        # 작업 큐가 processing 으로 바꿔 둔 상태 복구
+        if report.ai_processing_status != "completed":
+            report.ai_processing_status = "completed"
+            await self.db.commit()
+        
+        return {
+            "success": True,
+            "message": "입력 변경이 없어 저장된 분석 결과를 반환합니다",
+            "report_id": report.id,
+            "cached": True,
+            "ai_result": {
+                "ai_comment": report.ai_comment,
+                "keywords": report.keywords,
+                "trend_analysis": report.trend_comparison,
+                "special_notes": report.special_notes_summary or "",
+                "total_score": report.checklist_score_total,
+                "score_percentage": float(report.checklist_score_percentage or 0)
+            }
+        }
+    
+    async def _get_previous_weeks_data(self, senior_id: int, session_date: date) -> List[Dict[str, Any]]:
+        """세션이 속한 주 이전 trend_analysis_weeks 주 데이터 조회 (이번 주는 이 세션 분석으로 바뀌므로 제외)"""
+        week_start = week_start_of(session_date)
+        weekly_scores = await TimeSeriesService(self.db).weekly_scores(
+            senior_id, week_start - timedelta(weeks=settings.trend_analysis_weeks), week_start
+        )
+        
+        return [weekly_score_to_dict(score) for score in weekly_scores]
     
     def _calculate_scores(self, checklist_responses: List[ChecklistResponse]) -> tuple:
         """체크리스트 응답을 점수로 계산"""
         if not checklist_responses:
             return 0, 0.0, {}
         
+        return self._score_responses(checklist_responses)
+    
+    async def _record_anomalies(
+        self,
+        care_session: CareSession,
+        checklist_responses: List[ChecklistResponse],
+        already_counted: bool
+    ):
+        """
+        채점된 세션을 이상 감지 상태에 반영 (커밋은 리포트/주간 점수와 같은 트랜잭션에서)
+        
+        already_counted: 이전 분석 점수가 이미 반영된 세션의 재분석 여부
+        """
+        if not checklist_responses:
+            return
+        
+        anomalies = await AnomalyDetector(self.db).record_session(
+            care_session.senior_id, care_session.id, checklist_responses, already_applied=already_counted
+        )
+        if anomalies:
+            logger.info(f"세션 점수 이상 감지: care_session_id={care_session.id}, {len(anomalies)}건")
+    
+    def _score_responses(self, checklist_responses: List[ChecklistResponse]) -> tuple:
+        """응답별 점수/카테고리 기록 후 (총점, 백분율, 카테고리별 점수) 반환"""
         total_score = 0
         max_possible_score = 0
         score_breakdown = {}
@@ -114,8 +318,6 @@ class AIAnalysisTrigger:
                 score_breakdown[category] = 0
             score_breakdown[category] += score_value
         
-        self.db.commit()
-        
         score_percentage = (total_score / max_possible_score * 100) if max_possible_score > 0 else 0
         
         return total_score, score_percentage, score_breakdown
@@ -138,21 +340,8 @@ class AIAnalysisTrigger:
             return 3  # 기본값
     
     def _get_question_category(self, question_key: str) -> str:
-        """질문 키를 카테고리로 분류"""
-        category_mapping = {
-            "health": ["health", "medicine", "pain", "sleep"],
-            "mental": ["mood", "emotion", "anxiety", "depression"],
-            "physical": ["mobility", "exercise", "walk", "strength"],
-            "social": ["family", "friend", "social", "communication"],
-            "daily": ["meal", "hygiene", "daily", "routine"]
-        }
-        
-        question_lower = question_key.lower()
-        for category, keywords in category_mapping.items():
-            if any(keyword in question_lower for keyword in keywords):
-                return category
-        
-        return "general"
+        """질문 키를 카테고리로 분류 (시작 시 구성된 레지스트리 조회)"""
+        return question_registry.classify(question_key)
     
     def _generate_basic_analysis(
         self, 
@@ -165,19 +354,22 @@ class AIAnalysisTrigger:
     ) -> Dict[str, Any]:
         """기본 AI 분석 생성 (n8n 없이 내부 로직)"""
         
+        # 돌봄노트별 어휘 카테고리 (노트당 한 번 순회)
+        note_categories = [care_note_matcher.scan(note.content) for note in care_notes]
+        
         # 키워드 생성
-        keywords = self._generate_keywords(checklist_responses, care_notes)
+        keywords = self._generate_keywords(checklist_responses, care_notes, note_categories)
         
         # 상태 변화 분석
         trend_analysis = self._analyze_trend_simple(previous_data, score_percentage)
         
         # AI 코멘트 생성 (템플릿 기반)
         ai_comment = self._generate_ai_comment_template(
-            senior, checklist_responses, care_notes, trend_analysis
+            senior, checklist_responses, care_notes, trend_analysis, note_categories
         )
         
         # 특이사항 확인
-        special_notes = self._check_special_conditions(checklist_responses, care_notes)
+        special_notes = self._check_special_conditions(checklist_responses, care_notes, note_categories)
         
         return {
             "ai_comment": ai_comment,
@@ -188,7 +380,7 @@ class AIAnalysisTrigger:
             "score_percentage": score_percentage
         }
     
-    def _generate_keywords(self, checklist_responses: List, care_notes: List) -> List[str]:
+    def _generate_keywords(self, checklist_responses: List, care_notes: List, note_categories: List[Set[str]]) -> List[str]:
         """키워드 생성"""
         keywords = []
         
@@ -213,13 +405,12 @@ class AIAnalysisTrigger:
                 keywords.extend(["주의필요", "관찰필요"])
         
         # 돌봄노트 기반 키워드
-        for note in care_notes:
-            content_lower = note.content.lower()
-            if "가족" in content_lower or "자녀" in content_lower:
+        for categories in note_categories:
+            if "family" in categories:
                 keywords.append("가족그리움")
-            if "아프" in content_lower or "힘들" in content_lower:
+            if "pain" in categories:
                 keywords.append("컨디션저하")
-            if "좋" in content_lower or "기분" in content_lower:
+            if "positive" in categories:
                 keywords.append("긍정적")
         
         return list(set(keywords))  # 중복 제거
@@ -249,7 +440,7 @@ class AIAnalysisTrigger:
             "message": message
         }
     
-    def _generate_ai_comment_template(self, senior, checklist_responses, care_notes, trend_analysis) -> str:
+    def _generate_ai_comment_template(self, senior, checklist_responses, care_notes, trend_analysis, note_categories) -> str:
         """템플릿 기반 AI 코멘트 생성"""
         
         # 기본 인사
@@ -269,7 +460,7 @@ class AIAnalysisTrigger:
         comment_parts.append(trend_analysis["message"])
         
         # 가족 소통 제안
-        family_mentioned = any("가족" in note.content for note in care_notes)
+        family_mentioned = any("family_mention" in categories for categories in note_categories)
         if family_mentioned:
             comment_parts.append("어르신이 가족 이야기를 많이 하셨으니, 안부 전화를 드려보시면 좋을 것 같습니다.")
         else:
@@ -277,7 +468,7 @@ class AIAnalysisTrigger:
         
         return " ".join(comment_parts)
     
-    def _check_special_conditions(self, checklist_responses, care_notes) -> str:
+    def _check_special_conditions(self, checklist_responses, care_notes, note_categories) -> str:
         """특이사항 확인"""
         special_notes = []
         
@@ -287,27 +478,34 @@ class AIAnalysisTrigger:
                 special_notes.append(response.notes.strip())
         
         # 돌봄노트에서 특이사항 확인
-        for note in care_notes:
+        for note, categories in zip(care_notes, note_categories):
             content = note.content.strip()
-            if any(keyword in content.lower() for keyword in ["아프", "힘들", "이상", "문제"]):
+            if "risk" in categories:
                 special_notes.append(content[:50] + "..." if len(content) > 50 else content)
         
         return "; ".join(special_notes) if special_notes else ""
     
-    def _create_or_update_report(
+    async def _create_or_update_report(
         self, 
         care_session_id: int, 
         ai_result: Dict, 
         total_score: int, 
         score_percentage: float, 
-        score_breakdown: Dict
+        score_breakdown: Dict,
+        input_fingerprint: Optional[str] = None
     ) -> AIReport:
-        """AI 리포트 생성 또는 업데이트"""
+        """AI 리포트 생성 또는 업데이트 (커밋은 호출 측에서 주간 점수와 함께)"""
         
         # 기존 리포트 확인
-        existing_report = self.db.query(AIReport).filter(
+        result = await self.db.execute(select(AIReport).where(
             AIReport.care_session_id == care_session_id
-        ).first()
+        ))
+        existing_report = result.scalars().first()
+        
+        # 인기 키워드 일자별 카운터 증감
+        await TrendingKeywordService(self.db).record(
+            care_session_id, ai_result["keywords"], existing_report.keywords if existing_report else None
+        )
         
         if existing_report:
             # 기존 리포트 업데이트
@@ -320,6 +518,7 @@ class AIAnalysisTrigger:
             existing_report.special_notes_summary = ai_result["special_notes"]
             existing_report.ai_processing_status = "completed"
             existing_report.status = "generated"
+            existing_report.input_fingerprint = input_fingerprint
             
             ai_report = existing_report
         else:
@@ -334,15 +533,14 @@ class AIAnalysisTrigger:
                 trend_comparison=ai_result["trend_analysis"],
                 special_notes_summary=ai_result["special_notes"],
                 ai_processing_status="completed",
-                status="generated"
+                status="generated",
+                input_fingerprint=input_fingerprint
             )
             self.db.add(ai_report)
         
         # 특이사항이 있다면 별도 저장
         if ai_result["special_notes"]:
-            care_session = self.db.query(CareSession).filter(
-                CareSession.id == care_session_id
-            ).first()
+            care_session = await self.db.get(CareSession, care_session_id)
             
             special_note = SpecialNote(
                 senior_id=care_session.senior_id,
@@ -354,69 +552,139 @@ class AIAnalysisTrigger:
             )
             self.db.add(special_note)
         
-        self.db.commit()
-        self.db.refresh(ai_report)
-        
+        await self.db.flush()
         return ai_report
     
     async def _update_weekly_score(
         self, 
-        care_session_id: int, 
+        care_session: CareSession, 
         total_score: int, 
-        score_breakdown: Dict[str, Any]
-    ):
-        """주간 체크리스트 점수 업데이트"""
-        
-        care_session = self.db.query(CareSession).filter(
-            CareSession.id == care_session_id
-        ).first()
+        score_breakdown: Dict[str, Any],
+        response_count: int
+    ) -> Dict[str, Any]:
+        """
+        주간 체크리스트 점수 누적 (단일 INSERT ... ON CONFLICT DO UPDATE, 커밋은 호출 측에서)
         
-        if not care_session:
-            return
+        같은 주에 같은 시니어의 분석이 동시에 실행되어도 갱신이 유실되거나
+        주간 행이 중복 생성되지 않으며, 누적 결과를 RETURNING으로 바로 반환합니다.
+        """
         
         # 이번 주의 시작일과 종료일 계산
         session_date = care_session.start_time.date()
         week_start = session_date - timedelta(days=session_date.weekday())  # 월요일
         week_end = week_start + timedelta(days=6)  # 일요일
         
-        # 기존 주간 점수 레코드 조회 또는 생성
-        weekly_score = self.db.query(WeeklyChecklistScore).filter(
-            WeeklyChecklistScore.senior_id == care_session.senior_id,
-            WeeklyChecklistScore.week_start_date == week_start
-        ).first()
-        
-        if weekly_score:
-            # 기존 레코드 업데이트
-            weekly_score.total_score += total_score
-            weekly_score.checklist_count += 1
-            weekly_score.max_possible_score += len(score_breakdown) * 5  # 가정: 5점 만점
-            weekly_score.score_percentage = (weekly_score.total_score / weekly_score.max_possible_score) * 100
-            
-            # 점수 세부사항 업데이트
-            if weekly_score.score_breakdown:
-                for category, score in score_breakdown.items():
-                    if category in weekly_score.score_breakdown:
-                        weekly_score.score_breakdown[category] += score
-                    else:
-                        weekly_score.score_breakdown[category] = score
-            else:
-                weekly_score.score_breakdown = score_breakdown
-                
-        else:
-            # 새 레코드 생성
-            max_possible = len(score_breakdown) * 5  # 가정: 5점 만점
-            weekly_score = WeeklyChecklistScore(
-                senior_id=care_session.senior_id,
-                caregiver_id=care_session.caregiver_id,
-                week_start_date=week_start,
-                week_end_date=week_end,
-                total_score=total_score,
-                max_possible_score=max_possible,
-                score_percentage=(total_score / max_possible) * 100 if max_possible > 0 else 0,
-                checklist_count=1,
-                score_breakdown=score_breakdown,
-                trend_indicator="stable"  # 기본값, 나중에 계산
-            )
-            self.db.add(weekly_score)
+        max_possible = response_count * 5  # 가정: 응답당 5점 만점 (_calculate_scores 와 동일)
+        
+        dialect_name = self.db.get_bind().dialect.name
+        if dialect_name not in BREAKDOWN_MERGE_SQL:
+            raise ValueError(f"주간 점수 upsert를 지원하지 않는 DB입니다: {dialect_name}")
+        insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+        
+        stmt = insert(WeeklyChecklistScore).values(
+            senior_id=care_session.senior_id,
+            caregiver_id=care_session.caregiver_id,
+            week_start_date=week_start,
+            week_end_date=week_end,
+            total_score=total_score,
+            max_possible_score=max_possible,
+            score_percentage=(total_score / max_possible) * 100 if max_possible > 0 else 0,
+            checklist_count=1,
+            score_breakdown=score_breakdown,
+            trend_indicator="stable",  # 기본값, 나중에 계산
+            updated_at=datetime.now()
+        )
+        
+        table = WeeklyChecklistScore.__table__
+        new_total = table.c.total_score + stmt.excluded.total_score
+        new_max = table.c.max_possible_score + stmt.excluded.max_possible_score
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WeeklyChecklistScore.senior_id, WeeklyChecklistScore.week_start_date],
+            set_={
+                "total_score": new_total,
+                "max_possible_score": new_max,
+                "score_percentage": case(
+                    (new_max > 0, new_total * 100.0 / new_max),
+                    else_=0
+                ),
+                "checklist_count": table.c.checklist_count + 1,
+                # 카테고리별 점수 합산 (JSON을 DB에서 병합)
+                "score_breakdown": breakdown_merge_column(dialect_name, table.name),
+                "updated_at": stmt.excluded.updated_at
+            }
+        ).returning(
+            WeeklyChecklistScore.id,
+            WeeklyChecklistScore.total_score,
+            WeeklyChecklistScore.max_possible_score,
+            WeeklyChecklistScore.score_percentage,
+            WeeklyChecklistScore.checklist_count,
+            WeeklyChecklistScore.score_breakdown
+        )
+        
+        result = await self.db.execute(stmt)
+        weekly_score = dict(result.mappings().one())
+        
+        # 장기 구간 조회용 월간 사전 집계 (같은 트랜잭션)
+        await self._update_monthly_score(
+            insert, dialect_name, care_session.senior_id, month_start_of(session_date),
+            total_score, max_possible, score_breakdown
+        )
+        
+        # 추이 누적 통계 갱신 (같은 트랜잭션)
+        await TrendStatisticsService(self.db).record_week(
+            care_session.senior_id, week_start, weekly_score["score_percentage"], weekly_score["score_breakdown"]
+        )
+        
+        return weekly_score
+    
+    async def _rebuild_weekly_score(self, care_session: CareSession) -> Dict[str, Any]:
+        """
+        재분석 세션의 주간/월간 점수 재집계
+        
+        증분 upsert 는 이전 분석의 기여분을 빼지 못하므로 세션이 속한 주와 달을
+        응답 점수로 다시 집계하고 추이 누적 통계는 다음 조회 때 다시 계산합니다. (커밋은 호출 측에서)
+        """
+        session_date = care_session.start_time.date()
+        return await WeeklyScoreRebuilder(self.db).rebuild(
+            session_date, session_date, [care_session.senior_id], commit=False
+        )
+    
+    async def _update_monthly_score(
+        self,
+        insert,
+        dialect_name: str,
+        senior_id: int,
+        month_start: date,
+        total_score: int,
+        max_possible: int,
+        score_breakdown: Dict[str, Any]
+    ):
+        """월간 체크리스트 점수 누적 (주간 점수와 같은 증분으로 INSERT ... ON CONFLICT DO UPDATE)"""
+        stmt = insert(MonthlyChecklistScore).values(
+            senior_id=senior_id,
+            month_start=month_start,
+            total_score=total_score,
+            max_possible_score=max_possible,
+            score_percentage=(total_score / max_possible) * 100 if max_possible > 0 else 0,
+            checklist_count=1,
+            score_breakdown=score_breakdown
+        )
+        
+        table = MonthlyChecklistScore.__table__
+        new_total = table.c.total_score + stmt.excluded.total_score
+        new_max = table.c.max_possible_score + stmt.excluded.max_possible_score
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MonthlyChecklistScore.senior_id, MonthlyChecklistScore.month_start],
+            set_={
+                "total_score": new_total,
+                "max_possible_score": new_max,
+                "score_percentage": case(
+                    (new_max > 0, new_total * 100.0 / new_max),
+                    else_=0
+                ),
+                "checklist_count": table.c.checklist_count + 1,
+                "score_breakdown": breakdown_merge_column(dialect_name, table.name)
+            }
+        )
         
-        self.db.commit()
+        await self.db.execute(stmt)
@@ -0,0 +1,339 @@
+"""
+AI 분석 백그라운드 작업 큐
+
+요청 처리 중에는 작업만 등록하고(202 응답), 프로세스 내 워커 풀이
+AIAnalysisTrigger.analyze_care_session 을 실행합니다.
+진행 상태는 AIReport.ai_processing_status 로 관리합니다.
+    pending → processing → completed / failed
+리포트는 분석이 끝날 때 생성되므로(자리표시 리포트 없음) 첫 분석 중인 세션의 상태는
+큐/작업 행에서 조회합니다. 이미 실행 중인 세션을 다시 요청하면(답변 수정 등) 현재 실행이
+끝난 뒤 한 번 더 분석합니다.
+
+ai_analysis_queue_backend=database 설정 시 ai_analysis_jobs 테이블에도 작업을 기록하여
+서버 재시작 후 미완료 작업을 다시 큐에 넣고(큐가 가득 차면 자리가 날 때마다 순서대로),
+실패 사유를 작업 행에 남겨 다른 워커/재시작 후에도 상태 조회에서 확인할 수 있습니다.
+여러 워커 프로세스가 같은 작업을 복구해도 실행 직전에 조건부 UPDATE 로 작업 행을 선점(owner,
+claimed_at)하므로 한 프로세스만 실행합니다. 처리 중 작업은 선점 후
+ai_analysis_job_lease_seconds 가 지나야 다른 프로세스가 가져갑니다(중단된 프로세스의 작업 복구).
+"""
+import asyncio
+import contextvars
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Set
+from fastapi import HTTPException, status
+from sqlalchemy import select, update, func, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import TTLCache
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import AIReport, AIAnalysisJob
+from app.services.ai_trigger import AIAnalysisTrigger
+
+logger = logging.getLogger("ai_analysis_queue")
+
+class AnalysisJobQueue:
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        workers: int = settings.ai_analysis_workers,
+        max_size: int = settings.ai_analysis_queue_size,
+        backend: str = settings.ai_analysis_queue_backend
+    ):
+        self.session_factory = session_factory
+        self.worker_count = workers
+        self.max_size = max_size
+        self.backend = backend
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers = []
+        self._active: Set[int] = set()  # 대기 중이거나 처리 중인 세션 ID
+        self._running: Set[int] = set()  # 처리 중인 세션 ID
+        self._dirty: Set[int] = set()  # 처리 중에 다시 요청되어 끝난 뒤 한 번 더 실행할 세션 ID
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"[-64:]  # 작업 행 선점 식별자
+        # 세션 ID별 마지막 실패 사유 (오래된 항목부터 제거)
+        self._errors = TTLCache(max_size=max_size, ttl_seconds=settings.ai_analysis_error_ttl_seconds)
+        self._recovery: Optional[asyncio.Task] = None  # 큐에 바로 넣지 못한 복구 작업 등록 태스크
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def persistent(self) -> bool:
+        return self.backend == "database"
+
+    async def start(self):
+        """워커 시작 (database 백엔드는 미완료 작업 복구)"""
+        if self.running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        # 요청 컨텍스트(쿼리 통계 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"ai-analysis-{i}", context=contextvars.Context())
+            for i in range(self.worker_count)
+        ]
+
+        if self.persistent:
+            await self._recover_unfinished_jobs()
+
+    async def stop(self):
+        """워커 종료 (처리 중인 작업은 재시작 후 복구 대상)"""
+        tasks = self._workers + ([self._recovery] if self._recovery else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._recovery = None
+        self._queue = None
+        self._active.clear()
+        self._running.clear()
+        self._dirty.clear()
+
+    async def enqueue(self, db: AsyncSession, care_session_id: int) -> Optional[AIReport]:
+        """
+        분석 작업 등록 - 기존 리포트가 있으면 상태를 pending으로 기록 후 즉시 반환
+
+        Returns:
+            세션의 리포트 (첫 분석이면 분석이 끝날 때 생성되므로 None)
+        """
+        if not self.running:
+            await self.start()
+
+        report = await self._get_report(db, care_session_id)
+        if care_session_id in self._active:
+            # 실행 중에 다시 요청됨 (답변 수정 등) - 현재 실행이 끝난 뒤 최신 입력으로 한 번 더 실행
+            if care_session_id in self._running and care_session_id not in self._dirty:
+                self._dirty.add(care_session_id)
+                if self.persistent:
+                    db.add(AIAnalysisJob(care_session_id=care_session_id, status="pending"))
+                    await db.commit()
+            return report
+
+        if self._queue.full():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="AI 분석 요청이 많아 잠시 후 다시 시도해주세요",
+                headers={"Retry-After": "5"},
+            )
+
+        if report:
+            report.ai_processing_status = "pending"
+        if self.persistent:
+            db.add(AIAnalysisJob(care_session_id=care_session_id, status="pending"))
+        await db.commit()
+
+        self._errors.pop(care_session_id, None)
+        self._active.add(care_session_id)
+        self._queue.put_nowait(care_session_id)
+        return report
+
+    async def get_status(self, db: AsyncSession, care_session_id: int) -> Optional[str]:
+        """리포트가 아직 없는 세션의 분석 상태 (등록된 적 없으면 None)"""
+        if care_session_id in self._running:
+            return "processing"
+        if care_session_id in self._active:
+            return "pending"
+        if self.persistent:
+            return await db.scalar(select(AIAnalysisJob.status).where(
+                AIAnalysisJob.care_session_id == care_session_id
+            ).order_by(AIAnalysisJob.id.desc()).limit(1))
+        return "failed" if self._errors.get(care_session_id) is not None else None
+
+    async def get_error(self, db: AsyncSession, care_session_id: int) -> Optional[str]:
+        """마지막 실패 사유 (database 백엔드는 다른 워커/재시작 전 실패도 작업 행에서 조회)"""
+        error = self._errors.get(care_session_id)
+        if error is None and self.persistent:
+            error = await db.scalar(select(AIAnalysisJob.error).where(
+                AIAnalysisJob.care_session_id == care_session_id,
+                AIAnalysisJob.status == "failed"
+            ).order_by(AIAnalysisJob.id.desc()).limit(1))
+        return error
+
+    def is_queued(self, care_session_id: int) -> bool:
+        return care_session_id in self._active
+
+    def stats(self) -> dict:
+        """큐 상태"""
+        return {
+            "running": self.running,
+            "backend": self.backend,
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "active": len(self._active),
+            "max_size": self.max_size
+        }
+
+    async def _get_report(self, db: AsyncSession, care_session_id: int) -> Optional[AIReport]:
+        result = await db.execute(select(AIReport).where(
+            AIReport.care_session_id == care_session_id
+        ))
+        return result.scalars().first()
+
+    async def _worker(self):
+        while True:
+            care_session_id = await self._queue.get()
+            self._running.add(care_session_id)
+            try:
+                while True:
+                    try:
+                        await self._run(care_session_id)
+                    except Exception:
+                        logger.exception(f"AI 분석 작업 처리 실패: care_session_id={care_session_id}")
+                    if care_session_id not in self._dirty:
+                        break
+                    self._dirty.discard(care_session_id)
+            finally:
+                self._running.discard(care_session_id)
+                self._dirty.discard(care_session_id)
+                self._active.discard(care_session_id)
+                self._queue.task_done()
+
+    async def _run(self, care_session_id: int):
+        """단일 분석 작업 실행 (작업별 독립 세션)"""
+        async with self.session_factory() as db:
+            if self.persistent and not await self._claim(db, care_session_id):
+                # 다른 워커 프로세스가 이미 가져간 작업
+                return
+
+            await self._set_status(db, care_session_id, "processing")
+
+            try:
+                # 리포트 생성/갱신 시 ai_processing_status = completed
+                await AIAnalysisTrigger(db).analyze_care_session(care_session_id)
+                if self.persistent:
+                    await self._set_job_status(db, care_session_id, "completed")
+                    await db.commit()
+            except Exception as e:
+                await db.rollback()
+                self._errors.set(care_session_id, str(e))
+                await self._set_status(db, care_session_id, "failed", error=str(e))
+                raise
+
+    async def _claim(self, db: AsyncSession, care_session_id: int) -> bool:
+        """
+        대기 중(또는 선점 기한이 지난 처리 중) 작업 행을 이 프로세스가 선점
+
+        조건부 UPDATE 한 번이므로 여러 프로세스가 동시에 시도해도 한 곳만 성공합니다.
+        """
+        now = datetime.now()
+        lease_expired = now - timedelta(seconds=settings.ai_analysis_job_lease_seconds)
+        result = await db.execute(update(AIAnalysisJob).where(
+            AIAnalysisJob.care_session_id == care_session_id,
+            or_(
+                AIAnalysisJob.status == "pending",
+                and_(
+                    AIAnalysisJob.status == "processing",
+                    or_(AIAnalysisJob.claimed_at.is_(None), AIAnalysisJob.claimed_at < lease_expired)
+                )
+            )
+        ).values(
+            status="processing",
+            owner=self.owner,
+            claimed_at=now,
+            attempts=func.coalesce(AIAnalysisJob.attempts, 0) + 1
+        ).execution_options(synchronize_session=False))
+        await db.commit()
+        return result.rowcount > 0
+
+    async def _set_status(
+        self,
+        db: AsyncSession,
+        care_session_id: int,
+        new_status: str,
+        error: Optional[str] = None
+    ):
+        """리포트(및 이 프로세스가 선점한 작업 행)의 처리 상태 변경"""
+        result = await db.execute(select(AIReport).where(
+            AIReport.care_session_id == care_session_id
+        ))
+        report = result.scalars().first()
+        if report:
+            report.ai_processing_status = new_status
+
+        if self.persistent:
+            await self._set_job_status(db, care_session_id, new_status, error=error)
+
+        await db.commit()
+
+    async def _set_job_status(
+        self,
+        db: AsyncSession,
+        care_session_id: int,
+        new_status: str,
+        error: Optional[str] = None
+    ):
+        # 실행 중에 새로 등록된 대기 작업(다시 요청)은 건드리지 않음
+        result = await db.execute(select(AIAnalysisJob).where(
+            AIAnalysisJob.care_session_id == care_session_id,
+            AIAnalysisJob.status == "processing",
+            AIAnalysisJob.owner == self.owner
+        ))
+        for job in result.scalars().all():
+            job.status = new_status
+            job.error = error
+
+    async def _recover_unfinished_jobs(self):
+        """재시작 전 대기/처리 중이던 작업을 다시 큐에 등록 (실제 실행은 _claim 에 성공한 프로세스만)"""
+        now = datetime.now()
+        async with self.session_factory() as db:
+            result = await db.execute(select(
+                AIAnalysisJob.care_session_id, AIAnalysisJob.status, AIAnalysisJob.claimed_at
+            ).where(
+                AIAnalysisJob.status.in_(["pending", "processing"])
+            ).order_by(AIAnalysisJob.id))
+            rows = result.all()
+
+        # 선점 기한이 남은 처리 중 작업은 다른 프로세스가 실행 중일 수 있으므로 기한이 지난 뒤 다시 시도
+        lease = timedelta(seconds=settings.ai_analysis_job_lease_seconds)
+        leased = {
+            row.care_session_id: row.claimed_at + lease for row in rows
+            if row.status == "processing" and row.claimed_at is not None and row.claimed_at + lease > now
+        }
+        session_ids = [
+            care_session_id for care_session_id in dict.fromkeys(row.care_session_id for row in rows)
+            if care_session_id not in leased
+        ]
+
+        deferred = []
+        for care_session_id in session_ids:
+            if care_session_id in self._active:
+                continue
+            self._active.add(care_session_id)
+            if self._queue.full():
+                deferred.append(care_session_id)
+            else:
+                self._queue.put_nowait(care_session_id)
+
+        if rows:
+            logger.info(f"미완료 AI 분석 작업 {len(session_ids)}건 복구 (다른 프로세스가 처리 중인 작업 {len(leased)}건은 선점 기한 후 확인)")
+
+        # 큐 크기를 넘는 작업은 버리지 않고 자리가 날 때마다 등록
+        if deferred:
+            logger.warning(f"큐가 가득 차 미완료 AI 분석 작업 {len(deferred)}건은 순차 등록합니다")
+        if deferred or leased:
+            retry_at = max(leased.values()) if leased else now
+            self._recovery = asyncio.create_task(
+                self._enqueue_deferred(deferred, list(leased), (retry_at - now).total_seconds()),
+                name="ai-analysis-recovery", context=contextvars.Context()
+            )
+
+    async def _enqueue_deferred(self, session_ids: List[int], leased_ids: List[int], delay: float):
+        for care_session_id in session_ids:
+            await self._queue.put(care_session_id)
+
+        if leased_ids:
+            await asyncio.sleep(delay)
+            for care_session_id in leased_ids:
+                if care_session_id in self._active:
+                    continue
+                self._active.add(care_session_id)
+                await self._queue.put(care_session_id)
+        self._recovery = None
+
+# 애플리케이션 전역 작업 큐
+analysis_queue = AnalysisJobQueue()
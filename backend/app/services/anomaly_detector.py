@@ -0,0 +1,207 @@
+"""
+세션 점수 이상 감지 서비스
+
+시니어별/카테고리별 세션 점수율의 지수 가중 평균·분산(EWMA)을 anomaly_states 에 유지하고,
+세션이 채점될 때마다 새 점수를 평소 분포와 비교해 급락하면 바로 특이사항을 남깁니다.
+과거 세션을 다시 읽지 않으며 상태는 (시니어, 카테고리)당 실수 몇 개입니다.
+
+    z = (x - mean) / max(std, anomaly_min_std)        (반영 전 상태 기준)
+    diff = x - mean, mean += α·diff, variance = (1 - α)·(variance + α·diff²)
+
+    x = 세션의 전체 점수율(overall) 또는 카테고리 점수율 (카테고리 점수 합 / 응답 수 × 만점)
+
+같은 세션을 다시 분석하면 직전 상태(prev_mean/prev_variance)로 되돌린 뒤 다시 반영합니다.
+
+제약
+    - 되돌릴 수 있는 것은 마지막으로 반영된 세션뿐입니다. 이후 세션이 이미 반영된 과거 세션을
+      다시 분석하면(already_applied) 그 기여분을 EWMA 에서 정확히 빼낼 수 없으므로
+      상태와 해당 세션의 특이사항을 그대로 두고 건너뜁니다.
+    - already_applied 는 리포트에 점수가 저장되었는지로 판단하므로, 상태 갱신은 리포트/주간 점수와
+      같은 트랜잭션에서 커밋해야 합니다 (AIAnalysisTrigger.analyze_care_session). 제공자 호출이
+      실패해 리포트가 남지 않으면 상태도 반영되지 않아, 재시도 때 같은 세션이 두 번 반영되지 않습니다.
+    - 동시 갱신은 시니어 행 잠금(SELECT ... FOR UPDATE)으로 직렬화합니다. 상태 행이 아직 없는
+      첫 세션끼리도 같은 행을 잠그므로 upsert 가 서로의 상태를 덮어쓰지 않습니다.
+      (SQLite 는 FOR UPDATE 를 무시하지만 쓰기 트랜잭션이 DB 단위로 직렬화됩니다)
+"""
+import math
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import AnomalyState, ChecklistResponse, Senior, SpecialNote
+from app.services.trend_statistics import OVERALL
+
+NOTE_TYPE = "score_anomaly"
+STATE_COLUMNS = ("n", "mean", "variance", "prev_mean", "prev_variance", "last_session_id", "last_z")
+
+# |z| 구간별 특이사항 우선순위 (2=보통, 3=높음, 4=긴급)
+PRIORITY_BANDS = ((5.0, 4), (3.5, 3))
+
+def priority_from_z(z: float) -> int:
+    """z-score 크기로 특이사항 우선순위 결정"""
+    for bound, priority in PRIORITY_BANDS:
+        if abs(z) >= bound:
+            return priority
+    return 2
+
+def session_values(checklist_responses: List[ChecklistResponse]) -> Dict[str, float]:
+    """채점된 응답 → 전체/카테고리별 점수율 (카테고리마다 응답 수가 달라도 비교 가능)"""
+    sums: Dict[str, List[int]] = {}
+    for response in checklist_responses:
+        if response.score_value is None:
+            continue
+        for key in (OVERALL, response.category or "general"):
+            total = sums.setdefault(key, [0, 0])
+            total[0] += response.score_value
+            total[1] += 1
+
+    return {
+        key: score / (count * settings.default_max_score) * 100
+        for key, (score, count) in sums.items()
+    }
+
+def observe(state: AnomalyState, session_id: int, value: float) -> Optional[float]:
+    """
+    상태에 세션 값 반영 후 반영 전 분포 기준 z-score 반환 (관측 수 부족 시 None)
+
+    같은 세션이 마지막으로 반영된 세션이면 직전 상태로 되돌린 뒤 다시 반영합니다.
+    """
+    if state.last_session_id == session_id and state.n > 0:
+        state.n -= 1
+        state.mean, state.variance = state.prev_mean, state.prev_variance
+
+    z = None
+    if state.n >= settings.anomaly_min_observations:
+        std = max(math.sqrt(state.variance), settings.anomaly_min_std)
+        z = (value - state.mean) / std
+
+    state.prev_mean, state.prev_variance = state.mean, state.variance
+    if state.n == 0:
+        state.mean, state.variance = value, 0.0
+    else:
+        alpha = settings.anomaly_ewma_alpha
+        diff = value - state.mean
+        state.mean += alpha * diff
+        state.variance = (1 - alpha) * (state.variance + alpha * diff * diff)
+    state.n += 1
+    state.last_session_id = session_id
+    state.last_z = z
+    return z
+
+class AnomalyDetector:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_session(
+        self,
+        senior_id: int,
+        care_session_id: int,
+        checklist_responses: List[ChecklistResponse],
+        already_applied: bool = False
+    ) -> List[SpecialNote]:
+        """
+        채점된 세션 반영 및 급락 카테고리 특이사항 생성
+        (커밋은 호출 측에서 리포트 점수 저장과 같은 트랜잭션으로)
+
+        already_applied: 이전 분석에서 이미 상태에 반영된 세션의 재분석 (리포트 점수 존재 여부)
+            (마지막 반영 세션이 아니면 되돌릴 수 없으므로 건너뜀)
+
+        Returns:
+            새로 추가한 특이사항 목록
+        """
+        values = session_values(checklist_responses)
+        if not values:
+            return []
+
+        # 같은 시니어의 동시 분석 직렬화 (상태 행이 없는 첫 세션도 잠기도록 시니어 행 기준)
+        await self.db.execute(select(Senior.id).where(Senior.id == senior_id).with_for_update())
+        states = {state.category: state for state in await self._load(senior_id)}
+
+        overall = states.get(OVERALL)
+        if already_applied and overall is not None and overall.last_session_id != care_session_id:
+            return []
+
+        anomalies = []
+        for category, value in values.items():
+            state = states.get(category)
+            if state is None:
+                state = states[category] = AnomalyState(
+                    senior_id=senior_id, category=category, n=0, mean=0.0, variance=0.0
+                )
+            mean = state.mean if state.last_session_id != care_session_id else state.prev_mean
+            z = observe(state, care_session_id, value)
+            if z is not None and z <= -settings.anomaly_z_threshold:
+                anomalies.append((category, value, mean, z))
+
+        await self.db.execute(self._upsert_statement(), [
+            {
+                "senior_id": senior_id,
+                "category": category,
+                **{column: getattr(state, column) for column in STATE_COLUMNS}
+            }
+            for category, state in states.items()
+            if category in values
+        ])
+
+        # 재분석 시 이전 감지 결과는 새 결과로 교체
+        await self.db.execute(delete(SpecialNote).where(
+            SpecialNote.care_session_id == care_session_id,
+            SpecialNote.note_type == NOTE_TYPE
+        ))
+
+        notes = [self._build_note(senior_id, care_session_id, *anomaly) for anomaly in anomalies]
+        self.db.add_all(notes)
+        return notes
+
+    async def get_states(self, senior_id: int) -> Dict[str, Dict[str, Any]]:
+        """카테고리별 현재 평소 점수율/표준편차/최근 z-score"""
+        return {
+            state.category: {
+                "n": state.n,
+                "mean": state.mean,
+                "std": math.sqrt(state.variance),
+                "last_z": state.last_z
+            }
+            for state in await self._load(senior_id)
+        }
+
+    def _build_note(self, senior_id: int, care_session_id: int, category: str, value: float, mean: float, z: float) -> SpecialNote:
+        label = "전체 점수" if category == OVERALL else f"{category} 점수"
+        return SpecialNote(
+            senior_id=senior_id,
+            care_session_id=care_session_id,
+            note_type=NOTE_TYPE,
+            short_summary=f"{label}가 평소({mean:.0f}%)보다 크게 낮습니다 ({value:.0f}%, z={z:.1f})"[:200],
+            detailed_content=(
+                f"이번 세션 {label} {value:.1f}%는 최근 평균 {mean:.1f}% 대비 "
+                f"표준편차 {abs(z):.1f}배 낮은 값입니다. 상태 확인이 필요합니다."
+            ),
+            priority_level=priority_from_z(z)
+        )
+
+    async def _load(self, senior_id: int) -> List[AnomalyState]:
+        """상태 행을 세션에 붙지 않은 객체로 조회 (변경은 upsert 로만 저장)"""
+        table = AnomalyState.__table__
+        result = await self.db.execute(select(table.c.category, *(table.c[column] for column in STATE_COLUMNS)).where(
+            table.c.senior_id == senior_id
+        ))
+        return [AnomalyState(senior_id=senior_id, **row) for row in result.mappings()]
+
+    def _upsert_statement(self):
+        """(시니어, 카테고리) 충돌 시 상태 덮어쓰기"""
+        dialect_name = self.db.get_bind().dialect.name
+        if dialect_name not in ("postgresql", "sqlite"):
+            raise ValueError(f"이상 감지 상태 upsert를 지원하지 않는 DB입니다: {dialect_name}")
+        insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+
+        stmt = insert(AnomalyState.__table__)
+        return stmt.on_conflict_do_update(
+            index_elements=[AnomalyState.senior_id, AnomalyState.category],
+            set_={
+                **{column: stmt.excluded[column] for column in STATE_COLUMNS},
+                "updated_at": func.now()
+            }
+        )
@@ -1,13 +1,19 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.models import User
 from app.database import get_db
+from app.cache import TTLCache
+from app.loaders import user_with_profiles
 
 # 암호화 설정
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -21,6 +27,42 @@ def get_password_hash(password):
     """비밀번호 해싱"""
     return pwd_context.hash(password)
 
+# bcrypt 전용 워커 풀 (이벤트 루프 블로킹 방지)
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash"
+)
+_password_inflight = 0
+_password_inflight_lock = threading.Lock()
+
+async def _run_in_password_pool(func, *args):
+    """해싱 작업을 워커 풀에서 실행 (실행 중 + 대기 요청이 한도를 넘으면 즉시 503)"""
+    global _password_inflight
+    
+    with _password_inflight_lock:
+        if _password_inflight >= settings.password_hash_workers + settings.password_hash_max_queue:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="로그인 요청이 많아 잠시 후 다시 시도해주세요",
+                headers={"Retry-After": "1"},
+            )
+        _password_inflight += 1
+    
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, func, *args)
+    finally:
+        with _password_inflight_lock:
+            _password_inflight -= 1
+
+async def verify_password_async(plain_password, hashed_password):
+    """비밀번호 검증 (워커 풀)"""
+    return await _run_in_password_pool(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password):
+    """비밀번호 해싱 (워커 풀)"""
+    return await _run_in_password_pool(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """JWT 토큰 생성"""
     to_encode = data.copy()
@@ -33,16 +75,45 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     return encoded_jwt
 
-def authenticate_user(db: Session, user_code: str, password: str):
+def _user_with_profiles_query(user_code: str):
+    """프로필을 함께 로드하는 사용자 조회 쿼리 (비동기 세션에서는 지연 로딩 불가)"""
+    return select(User).options(*user_with_profiles()).where(User.user_code == user_code)
+
+# 인증된 사용자 스냅샷 캐시 (토큰 sub 기준, 프로세스 단위)
+# 무효화가 현재 프로세스에만 적용되므로 기본은 비활성화 (auth_user_cache_ttl_seconds)
+_user_cache = TTLCache(
+    max_size=settings.auth_user_cache_max_size,
+    ttl_seconds=settings.auth_user_cache_ttl_seconds
+)
+
+def _detach_user_snapshot(db: AsyncSession, user: User) -> User:
+    """프로필이 로드된 사용자를 세션에서 분리하여 요청 간 공유 가능한 스냅샷으로 변환"""
+    for profile in (user.caregiver_profile, user.guardian_profile, user.admin_profile):
+        if profile is not None:
+            db.expunge(profile)
+    db.expunge(user)
+    return user
+
+def invalidate_user_cache(user_code: Optional[str] = None, user_id: Optional[int] = None):
+    """사용자 캐시 무효화 (활성화/비활성화, 비밀번호 변경 시 호출)"""
+    if user_code is not None:
+        _user_cache.pop(user_code)
+    if user_id is not None:
+        user_code = _user_cache.pop(("id", user_id))
+        if user_code is not None:
+            _user_cache.pop(user_code)
+
+async def authenticate_user(db: AsyncSession, user_code: str, password: str):
     """사용자 인증"""
-    user = db.query(User).filter(User.user_code == user_code).first()
+    result = await db.execute(_user_with_profiles_query(user_code))
+    user = result.scalars().first()
     if not user:
         return False
-    if not verify_password(password, user.password_hash):
+    if not await verify_password_async(password, user.password_hash):
         return False
     return user
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: AsyncSession = Depends(get_db)):
     """현재 사용자 정보 조회"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -58,8 +129,21 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.user_code == user_code).first()
+    # 캐시 적중 시 DB 조회 없이 반환
+    use_cache = settings.auth_user_cache_ttl_seconds > 0
+    user = _user_cache.get(user_code) if use_cache else None
     if user is None:
+        result = await db.execute(_user_with_profiles_query(user_code))
+        user = result.scalars().first()
+        if user is None:
+            raise credentials_exception
+        
+        if use_cache:
+            user = _detach_user_snapshot(db, user)
+            _user_cache.set(user_code, user)
+            _user_cache.set(("id", user.id), user_code)
+    
+    if not user.is_active:
         raise credentials_exception
     
     return user
@@ -74,8 +158,8 @@ def get_current_caregiver(current_user: User = Depends(get_current_user)):
     return current_user
 
 def get_current_guardian(current_user: User = Depends(get_current_user)):
-    """현재 가디언 정보 조회"""
-    if current_user.user_type != "guardian":
+    """현재 가디언 정보 조회 (가디언 프로필이 없으면 담당 시니어 조회 기준이 없으므로 거부)"""
+    if current_user.user_type != "guardian" or current_user.guardian_profile is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not a guardian"
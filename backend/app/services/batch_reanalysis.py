@@ -0,0 +1,379 @@
+"""
+케어 세션 일괄 재분석 서비스
+
+점수 규칙/키워드 로직 변경 후 과거 세션을 다시 분석할 때 사용합니다.
+    1. 세션 배치 단위로 응답/노트/시니어/이전 주간 점수를 IN 조회로 한 번에 로드
+    2. 프로세스 풀에서 analyze_session_offline 로 점수 계산 및 기본 분석
+    3. 응답 점수, AIReport, SpecialNote 를 배치 트랜잭션으로 저장
+    4. 배치마다 체크포인트 기록 (중단 후 --resume 으로 이어서 실행)
+    (입력 지문이 기존 리포트와 같은 세션은 force 가 아니면 분석을 건너뜀)
+    5. 마지막에 대상 기간 주간 점수를 WeeklyScoreRebuilder 로 재집계
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import select, update, delete, func
+
+from app.config import settings
+from app.models import CareSession, ChecklistResponse, CareNote, AIReport, Senior, SpecialNote, WeeklyChecklistScore
+from app.services.ai_provider import AIProviderError, build_analysis_request, get_ai_provider
+from app.services.ai_trigger import analyze_session_offline, session_analysis_fingerprint, weekly_score_to_dict
+from app.services.guardian_home import invalidate_guardian_home_for_senior
+from app.services.trending_keywords import TrendingKeywordService
+from app.services.weekly_rebuild import WeeklyScoreRebuilder, week_start_of
+
+logger = logging.getLogger("batch_reanalysis")
+
+def _analyze_chunk(payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """프로세스 풀 작업 단위: 세션 여러 개를 분석하여 결과 반환"""
+    results = []
+    for payload in payloads:
+        result = analyze_session_offline(
+            payload["senior"], payload["responses"], payload["notes"], payload["previous_data"]
+        )
+        result["care_session_id"] = payload["care_session_id"]
+        result["senior_id"] = payload["senior_id"]
+        result["fingerprint"] = payload["fingerprint"]
+        results.append(result)
+    return results
+
+class BatchReanalyzer:
+    def __init__(
+        self,
+        session_factory,
+        workers: Optional[int] = None,
+        batch_size: int = 500,
+        chunk_size: int = 50,
+        checkpoint_path: Optional[str] = None,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        force: bool = False
+    ):
+        self.session_factory = session_factory
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path
+        self.progress = progress
+        self.force = force
+
+    async def run(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        senior_ids: Optional[List[int]] = None,
+        resume: bool = False
+    ) -> Dict[str, Any]:
+        """대상 세션 일괄 재분석 후 처리량 통계 반환"""
+        after_id = self._load_checkpoint(start_date, end_date, senior_ids) if resume else 0
+
+        async with self.session_factory() as db:
+            session_ids = await self._select_session_ids(db, start_date, end_date, senior_ids, after_id)
+
+        started = time.perf_counter()
+        processed = 0
+        unchanged = 0
+        response_count = 0
+        loop = asyncio.get_running_loop()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for offset in range(0, len(session_ids), self.batch_size):
+                batch_ids = session_ids[offset:offset + self.batch_size]
+
+                async with self.session_factory() as db:
+                    payloads = await self._prefetch(db, batch_ids)
+                    if not self.force:
+                        changed = [payload for payload in payloads if payload["fingerprint"] != payload["stored_fingerprint"]]
+                        unchanged += len(payloads) - len(changed)
+                        payloads = changed
+
+                    chunks = [payloads[i:i + self.chunk_size] for i in range(0, len(payloads), self.chunk_size)]
+                    chunk_results = await asyncio.gather(*(
+                        loop.run_in_executor(pool, _analyze_chunk, chunk) for chunk in chunks
+                    ))
+                    results = [result for chunk in chunk_results for result in chunk]
+                    await self._apply_provider(payloads, results)
+
+                    if results:
+                        await self._write_results(db, results)
+
+                processed += len(batch_ids)
+                response_count += sum(len(payload["responses"]) for payload in payloads)
+                self._save_checkpoint(start_date, end_date, senior_ids, batch_ids[-1])
+                self._report_progress(processed, len(session_ids), started)
+
+        # 응답 점수가 바뀌었으므로 대상 기간 주간 점수는 집계로 다시 생성
+        # (--resume 이면 중단 전 배치가 바꾼 주도 포함하도록 체크포인트 이후가 아닌 전체 대상 조건 기준)
+        weekly = None
+        if session_ids or after_id > 0:
+            async with self.session_factory() as db:
+                week_from, week_to = await self._session_date_range(db, start_date, end_date, senior_ids)
+                if week_from is not None:
+                    weekly = await WeeklyScoreRebuilder(db).rebuild(week_from, week_to, senior_ids)
+
+        elapsed = time.perf_counter() - started
+        self._clear_checkpoint()
+
+        return {
+            "sessions": processed,
+            "unchanged": unchanged,
+            "responses": response_count,
+            "skipped_by_resume": after_id > 0,
+            "elapsed_seconds": round(elapsed, 2),
+            "sessions_per_second": round(processed / elapsed, 1) if elapsed > 0 else 0,
+            "responses_per_second": round(response_count / elapsed, 1) if elapsed > 0 else 0,
+            "weekly_scores": weekly
+        }
+
+    def _filter_sessions(self, query, start_date, end_date, senior_ids):
+        """재분석 대상 조건 적용"""
+        if start_date:
+            query = query.where(CareSession.start_time >= start_date)
+        if end_date:
+            query = query.where(CareSession.start_time < end_date + timedelta(days=1))
+        if senior_ids:
+            query = query.where(CareSession.senior_id.in_(senior_ids))
+        return query
+
+    async def _select_session_ids(self, db, start_date, end_date, senior_ids, after_id: int) -> List[int]:
+        query = self._filter_sessions(select(CareSession.id).where(CareSession.id > after_id), start_date, end_date, senior_ids)
+        result = await db.execute(query.order_by(CareSession.id))
+        return list(result.scalars().all())
+
+    async def _session_date_range(self, db, start_date, end_date, senior_ids):
+        """대상 조건 전체 세션의 최소/최대 시작일 (ID 순서와 시간 순서가 다를 수 있음, 대상이 없으면 None)"""
+        first, last = (await db.execute(self._filter_sessions(
+            select(func.min(CareSession.start_time), func.max(CareSession.start_time)),
+            start_date, end_date, senior_ids
+        ))).one()
+        if first is None:
+            return None, None
+        return first.date(), last.date()
+
+    async def _prefetch(self, db, batch_ids: List[int]) -> List[Dict[str, Any]]:
+        """배치 세션의 분석 입력을 IN 조회로 일괄 로드 (프로세스 간 전달 가능한 형태)"""
+        sessions = (await db.execute(
+            select(CareSession).where(CareSession.id.in_(batch_ids))
+        )).scalars().all()
+
+        senior_ids = {session.senior_id for session in sessions}
+        seniors = {
+            senior.id: SimpleNamespace(id=senior.id, name=senior.name)
+            for senior in (await db.execute(select(Senior).where(Senior.id.in_(senior_ids)))).scalars().all()
+        }
+
+        responses = defaultdict(list)
+        for response in (await db.execute(
+            select(ChecklistResponse).where(ChecklistResponse.care_session_id.in_(batch_ids))
+            .order_by(ChecklistResponse.id)
+        )).scalars().all():
+            responses[response.care_session_id].append(SimpleNamespace(
+                id=response.id,
+                question_key=response.question_key,
+                answer=response.answer,
+                notes=response.notes,
+                score_value=response.score_value,
+                category=response.category
+            ))
+
+        notes = defaultdict(list)
+        for note in (await db.execute(
+            select(CareNote).where(CareNote.care_session_id.in_(batch_ids)).order_by(CareNote.id)
+        )).scalars().all():
+            notes[note.care_session_id].append(SimpleNamespace(content=note.content))
+
+        # 세션이 속한 주 이전 trend_analysis_weeks 주 주간 점수 (AIAnalysisTrigger._get_previous_weeks_data 와 동일)
+        previous_weeks = timedelta(weeks=settings.trend_analysis_weeks)
+        min_date = week_start_of(min(session.start_time.date() for session in sessions)) - previous_weeks
+        weekly_scores = defaultdict(list)
+        for score in (await db.execute(
+            select(WeeklyChecklistScore).where(
+                WeeklyChecklistScore.senior_id.in_(senior_ids),
+                WeeklyChecklistScore.week_start_date >= min_date
+            ).order_by(WeeklyChecklistScore.week_start_date)
+        )).scalars().all():
+            weekly_scores[score.senior_id].append(score)
+
+        stored_fingerprints = dict((await db.execute(
+            select(AIReport.care_session_id, AIReport.input_fingerprint)
+            .where(AIReport.care_session_id.in_(batch_ids))
+        )).all())
+
+        payloads = []
+        for session in sessions:
+            week_start = week_start_of(session.start_time.date())
+            previous_data = [
+                weekly_score_to_dict(score)
+                for score in weekly_scores[session.senior_id]
+                if week_start - previous_weeks <= score.week_start_date < week_start
+            ]
+            senior = seniors.get(session.senior_id) or SimpleNamespace(id=session.senior_id, name="")
+            payloads.append({
+                "care_session_id": session.id,
+                "senior_id": session.senior_id,
+                "senior": senior,
+                "responses": responses[session.id],
+                "notes": notes[session.id],
+                "previous_data": previous_data,
+                "fingerprint": session_analysis_fingerprint(
+                    senior, responses[session.id], notes[session.id], previous_data
+                ),
+                "stored_fingerprint": stored_fingerprints.get(session.id)
+            })
+        return payloads
+
+    async def _apply_provider(self, payloads: List[Dict[str, Any]], results: List[Dict[str, Any]]):
+        """외부 AI 제공자 사용 시 분석 문구를 묶음 호출 결과로 교체 (점수는 로컬 계산 유지)"""
+        provider = get_ai_provider()
+        if provider.name == "template" or not results:
+            return
+
+        requests = []
+        for payload, result in zip(payloads, results):
+            scores = {response_id: score_value for response_id, score_value, _ in result["response_scores"]}
+            responses = [
+                SimpleNamespace(**{**vars(response), "score_value": scores.get(response.id, response.score_value)})
+                for response in payload["responses"]
+            ]
+            requests.append(build_analysis_request(
+                payload["care_session_id"], payload["senior"], responses, payload["notes"],
+                payload["previous_data"], result["total_score"], result["score_percentage"]
+            ))
+
+        try:
+            provider_results = await provider.analyze_batch(requests)
+        except AIProviderError as e:
+            if not settings.ai_provider_fallback_to_template:
+                raise
+            logger.warning(f"AI 제공자 호출 실패, 배치 {len(results)}건 템플릿 분석 유지: {e}")
+            # 대체 결과는 지문을 남기지 않아 다음 실행 때 다시 분석
+            for result in results:
+                result["fingerprint"] = None
+            return
+
+        for result, provider_result in zip(results, provider_results):
+            result["ai_result"].update(provider_result)
+
+    async def _write_results(self, db, results: List[Dict[str, Any]]):
+        """응답 점수, AIReport, SpecialNote 를 한 트랜잭션으로 저장"""
+        session_ids = [result["care_session_id"] for result in results]
+
+        # 1. 응답 점수/카테고리 일괄 UPDATE (기본키 기준 executemany)
+        response_rows = [
+            {"id": response_id, "score_value": score_value, "category": category}
+            for result in results
+            for response_id, score_value, category in result["response_scores"]
+        ]
+        if response_rows:
+            await db.execute(update(ChecklistResponse), response_rows)
+
+        # 2. 리포트 생성 또는 갱신
+        existing_reports = {
+            report.care_session_id: report
+            for report in (await db.execute(
+                select(AIReport).where(AIReport.care_session_id.in_(session_ids))
+            )).scalars().all()
+        }
+        # 인기 키워드 일자별 카운터 증감 (배치 단위로 합산)
+        await TrendingKeywordService(db).record_many([
+            (
+                result["care_session_id"],
+                existing_reports[result["care_session_id"]].keywords if result["care_session_id"] in existing_reports else None,
+                result["ai_result"]["keywords"]
+            )
+            for result in results
+        ])
+
+        for result in results:
+            ai_result = result["ai_result"]
+            values = dict(
+                ai_comment=ai_result["ai_comment"],
+                keywords=ai_result["keywords"],
+                content=f"케어 세션 분석 결과: {ai_result['ai_comment']}",
+                checklist_score_total=result["total_score"],
+                checklist_score_percentage=result["score_percentage"],
+                trend_comparison=ai_result["trend_analysis"],
+                special_notes_summary=ai_result["special_notes"],
+                ai_processing_status="completed",
+                status="generated",
+                input_fingerprint=result["fingerprint"]
+            )
+            report = existing_reports.get(result["care_session_id"])
+            if report:
+                for key, value in values.items():
+                    setattr(report, key, value)
+            else:
+                db.add(AIReport(care_session_id=result["care_session_id"], **values))
+
+        # 3. AI 분석 특이사항은 재분석 결과로 교체 (중복 방지)
+        await db.execute(delete(SpecialNote).where(
+            SpecialNote.care_session_id.in_(session_ids),
+            SpecialNote.note_type == "ai_analysis"
+        ))
+        db.add_all([
+            SpecialNote(
+                senior_id=result["senior_id"],
+                care_session_id=result["care_session_id"],
+                note_type="ai_analysis",
+                short_summary=result["ai_result"]["special_notes"][:200],
+                detailed_content=result["ai_result"]["ai_comment"],
+                priority_level=2
+            )
+            for result in results if result["ai_result"]["special_notes"]
+        ])
+
+        await db.commit()
+
+        # 담당 가디언 홈 캐시 무효화
+        for senior_id in {result["senior_id"] for result in results}:
+            await invalidate_guardian_home_for_senior(db, senior_id)
+
+    def _checkpoint_key(self, start_date, end_date, senior_ids) -> Dict[str, Any]:
+        return {
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+            "senior_ids": sorted(senior_ids) if senior_ids else None
+        }
+
+    def _load_checkpoint(self, start_date, end_date, senior_ids) -> int:
+        """같은 조건으로 중단된 실행의 마지막 완료 세션 ID"""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return 0
+        with open(self.checkpoint_path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("filters") != self._checkpoint_key(start_date, end_date, senior_ids):
+            raise ValueError("체크포인트의 대상 조건이 현재 실행 조건과 다릅니다")
+        return checkpoint.get("last_session_id", 0)
+
+    def _save_checkpoint(self, start_date, end_date, senior_ids, last_session_id: int):
+        if not self.checkpoint_path:
+            return
+        with open(self.checkpoint_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "filters": self._checkpoint_key(start_date, end_date, senior_ids),
+                "last_session_id": last_session_id,
+                "updated_at": datetime.now().isoformat()
+            }, f, ensure_ascii=False)
+
+    def _clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def _report_progress(self, processed: int, total: int, started: float):
+        if not self.progress:
+            return
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed > 0 else 0
+        self.progress({
+            "processed": processed,
+            "total": total,
+            "percent": round(processed / total * 100, 1) if total else 100.0,
+            "sessions_per_second": round(rate, 1),
+            "eta_seconds": round((total - processed) / rate, 1) if rate > 0 else None
+        })
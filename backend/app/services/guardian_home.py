@@ -0,0 +1,118 @@
+"""
+가디언 홈 화면 집계 서비스
+
+가장 많이 호출되는 엔드포인트이므로 시니어 + 최근 리포트를 단일 SELECT로,
+읽지 않은 알림을 두 번째 SELECT로 조회합니다 (총 2회 왕복).
+선택적으로 가디언별 짧은 TTL 캐시를 사용하며, 해당 가디언의 리포트/알림이
+기록되면 캐시를 무효화합니다.
+"""
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.cache import TTLCache
+from app.models import User, Guardian, Senior, CareSession, AIReport, Notification
+from app.schemas import GuardianHomeResponse
+
+# 가디언별 홈 응답 캐시 (키: 가디언 사용자 ID)
+_home_cache = TTLCache(
+    max_size=settings.guardian_home_cache_max_size,
+    ttl_seconds=settings.guardian_home_cache_ttl_seconds
+)
+
+def invalidate_guardian_home(user_id: Optional[int]):
+    """가디언 홈 캐시 무효화 (가디언 사용자 ID 기준)"""
+    if user_id is not None:
+        _home_cache.pop(user_id)
+
+async def invalidate_guardian_home_for_senior(db: AsyncSession, senior_id: int):
+    """시니어의 리포트가 기록되었을 때 담당 가디언의 홈 캐시 무효화"""
+    if settings.guardian_home_cache_ttl_seconds <= 0:
+        return
+    user_id = await db.scalar(
+        select(Guardian.user_id).join(Senior, Senior.guardian_id == Guardian.id).where(Senior.id == senior_id)
+    )
+    invalidate_guardian_home(user_id)
+
+def get_guardian_home_cache_stats() -> dict:
+    """가디언 홈 캐시 통계"""
+    return _home_cache.stats()
+
+class GuardianHomeService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_home(self, current_user: User, limit: int = 10) -> GuardianHomeResponse:
+        """가디언 홈 데이터 조회 (캐시 적중 시 DB 조회 없음)"""
+        use_cache = settings.guardian_home_cache_ttl_seconds > 0
+        if use_cache:
+            cached = _home_cache.get(current_user.id)
+            if cached is not None:
+                return cached
+
+        guardian_id = current_user.guardian_profile.id if current_user.guardian_profile else None
+        seniors, recent_reports = await self._get_seniors_with_recent_reports(guardian_id, limit)
+        unread_notifications = await self._get_unread_notifications(current_user.id, limit)
+
+        home = GuardianHomeResponse(
+            guardian_name=current_user.guardian_profile.name if current_user.guardian_profile else current_user.user_code,
+            seniors=seniors,
+            recent_reports=recent_reports,
+            unread_notifications=unread_notifications
+        )
+
+        if use_cache:
+            _home_cache.set(current_user.id, home)
+
+        return home
+
+    async def _get_seniors_with_recent_reports(self, guardian_id: Optional[int], limit: int):
+        """
+        담당 시니어 + 가디언 전체 기준 최근 리포트 N개를 단일 SELECT로 조회
+
+        최신순 N개로 잘라 낸 리포트 CTE(ORDER BY ... LIMIT)를 시니어에 LEFT JOIN 하므로
+        리포트가 없는 시니어도 한 행으로 포함되고, 가디언의 전체 리포트 이력에 순번을 매기지 않습니다.
+        가디언 프로필이 없으면(guardian_id=None) guardian_id IS NULL 로 조회되지 않도록 빈 결과를 반환합니다.
+        """
+        if guardian_id is None:
+            return [], []
+
+        recent = select(
+            AIReport.id.label("report_id"),
+            CareSession.senior_id.label("senior_id")
+        ).join(
+            CareSession, AIReport.care_session_id == CareSession.id
+        ).join(
+            Senior, CareSession.senior_id == Senior.id
+        ).where(
+            Senior.guardian_id == guardian_id
+        ).order_by(
+            AIReport.created_at.desc(), AIReport.id.desc()
+        ).limit(limit).cte("recent_reports")
+
+        result = await self.db.execute(
+            select(Senior, AIReport)
+            .outerjoin(recent, recent.c.senior_id == Senior.id)
+            .outerjoin(AIReport, AIReport.id == recent.c.report_id)
+            .where(Senior.guardian_id == guardian_id)
+            .order_by(Senior.id)
+        )
+
+        seniors = {}
+        reports = []
+        for senior, report in result.all():
+            seniors.setdefault(senior.id, senior)
+            if report is not None:
+                reports.append(report)
+
+        recent_reports = sorted(reports, key=lambda report: (report.created_at, report.id), reverse=True)
+        return list(seniors.values()), recent_reports
+
+    async def _get_unread_notifications(self, user_id: int, limit: int):
+        """읽지 않은 알림 최신순 조회 (idx_notifications_receiver_unread 사용)"""
+        result = await self.db.execute(select(Notification).where(
+            Notification.receiver_id == user_id,
+            Notification.is_read == False
+        ).order_by(Notification.created_at.desc()).limit(limit))
+        return result.scalars().all()
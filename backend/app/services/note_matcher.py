@@ -0,0 +1,69 @@
+"""
+돌봄노트 키워드/위험어 다중 패턴 매처
+
+설정의 어휘 사전(카테고리 → 용어 목록)으로 Aho-Corasick 오토마톤을 한 번 구성하고,
+노트 본문을 한 번만 순회하여 포함된 모든 카테고리를 반환합니다.
+용어 하나가 여러 카테고리에 속할 수 있습니다. (예: "아프" → pain, risk)
+"""
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+from app.config import settings
+
+class AhoCorasickMatcher:
+    def __init__(self, lexicon: Dict[str, Iterable[str]]):
+        # 상태별 전이(문자 → 상태), 실패 링크, 출력 카테고리
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[str]] = [frozenset()]
+        self.categories = list(lexicon)
+
+        outputs: List[Set[str]] = [set()]
+        for category, terms in lexicon.items():
+            for term in terms:
+                state = 0
+                for char in term.lower():
+                    next_state = self._goto[state].get(char)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto.append({})
+                        self._fail.append(0)
+                        outputs.append(set())
+                        self._goto[state][char] = next_state
+                    state = next_state
+                if term:
+                    outputs[state].add(category)
+
+        # BFS 로 실패 링크 구성, 실패 링크의 출력 병합
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._output = [frozenset(output) for output in outputs]
+
+        # 실패 링크를 미리 따라간 전이표 (DFA) - 순회 시 문자당 dict 조회 한 번
+        self._delta: List[Dict[str, int]] = [dict(self._goto[0])] + [None] * (len(self._goto) - 1)
+        for state in queue:
+            self._delta[state] = {**self._delta[self._fail[state]], **self._goto[state]}
+
+    def scan(self, text: str) -> Set[str]:
+        """본문을 한 번 순회하여 일치한 카테고리 집합 반환"""
+        found: Set[str] = set()
+        if not text:
+            return found
+
+        delta, output = self._delta, self._output
+        state = 0
+        for char in text.lower():
+            state = delta[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+# 애플리케이션 전역 돌봄노트 매처 (모듈 로드 시 설정의 어휘로 구성)
+care_note_matcher = AhoCorasickMatcher(settings.care_note_lexicon)
@@ -2,12 +2,15 @@
 알림 서비스
 """
 from typing import Dict, List, Any, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import User, Notification
+from app.services.guardian_home import invalidate_guardian_home
+from app.services.realtime import notification_event, publish_event
 from datetime import datetime
 
 class NotificationService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     async def send_notification(
@@ -31,10 +34,12 @@ class NotificationService:
         )
         
         self.db.add(notification)
-        self.db.commit()
-        self.db.refresh(notification)
+        await self.db.commit()
+        await self.db.refresh(notification)
+        invalidate_guardian_home(receiver_id)
         
-        # 여기서 실제 푸시 알림 전송 로직을 구현할 수 있습니다
+        # 연결 중인 수신자에게 실시간 이벤트 발행 (모바일 푸시는 _send_push_notification 에서)
+        await publish_event(receiver_id, "notification", notification_event(notification))
         # await self._send_push_notification(notification)
         
         return notification
@@ -64,35 +69,41 @@ class NotificationService:
             notifications.append(notification)
         
         self.db.add_all(notifications)
-        self.db.commit()
+        await self.db.commit()
+        
+        for notification in notifications:
+            invalidate_guardian_home(notification.receiver_id)
+            await publish_event(notification.receiver_id, "notification", notification_event(notification))
         
         return notifications
     
-    def mark_as_read(self, notification_id: int, user_id: int) -> bool:
+    async def mark_as_read(self, notification_id: int, user_id: int) -> bool:
         """알림 읽음 처리"""
         
-        notification = self.db.query(Notification).filter(
+        result = await self.db.execute(select(Notification).where(
             Notification.id == notification_id,
             Notification.receiver_id == user_id
-        ).first()
+        ))
+        notification = result.scalars().first()
         
         if notification:
             notification.is_read = True
             notification.read_at = datetime.utcnow()
-            self.db.commit()
+            await self.db.commit()
+            invalidate_guardian_home(user_id)
             return True
         
         return False
     
-    def get_unread_count(self, user_id: int) -> int:
+    async def get_unread_count(self, user_id: int) -> int:
         """읽지 않은 알림 개수 조회"""
         
-        return self.db.query(Notification).filter(
+        return await self.db.scalar(select(func.count(Notification.id)).where(
             Notification.receiver_id == user_id,
             Notification.is_read == False
-        ).count()
+        ))
     
-    def get_notifications(
+    async def get_notifications(
         self,
         user_id: int,
         limit: int = 20,
@@ -101,16 +112,17 @@ class NotificationService:
     ) -> List[Notification]:
         """사용자 알림 목록 조회"""
         
-        query = self.db.query(Notification).filter(
+        query = select(Notification).where(
             Notification.receiver_id == user_id
         )
         
         if unread_only:
-            query = query.filter(Notification.is_read == False)
+            query = query.where(Notification.is_read == False)
         
-        return query.order_by(
+        result = await self.db.execute(query.order_by(
             Notification.created_at.desc()
-        ).offset(offset).limit(limit).all()
+        ).offset(offset).limit(limit))
+        return result.scalars().all()
     
     async def _send_push_notification(self, notification: Notification):
         """실제 푸시 알림 전송 (Firebase 등)"""
@@ -0,0 +1,219 @@
+"""
+관리자 일괄 알림 전송 서비스
+
+요청 처리 중에는 notification_broadcasts 에 작업만 등록하고(202 응답, 작업 ID 반환),
+프로세스 내 백그라운드 태스크가 대상 사용자를 ID 순 청크로 나누어 전송합니다.
+청크마다 INSERT ... SELECT 한 번과 진행 상황 갱신을 한 트랜잭션으로 커밋하므로
+수신자 N명이 N개 트랜잭션이 아니라 N / chunk_size 개 트랜잭션으로 끝납니다.
+    pending → running → completed / failed
+
+진행 위치(last_user_id)가 청크와 함께 조건부로 커밋되므로 서버 재시작 후 미완료 작업은
+마지막 청크 다음 사용자부터 이어서 전송되며, 여러 워커가 같은 작업을 이어받아도 청크는 한 번만 반영됩니다.
+"""
+import asyncio
+import contextvars
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+from sqlalchemy import select, insert, update, func, literal, JSON
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import User, Notification, NotificationBroadcast
+from app.services.guardian_home import invalidate_guardian_home
+from app.services.realtime import publish_event
+
+logger = logging.getLogger("notification_broadcast")
+
+def broadcast_progress(broadcast: NotificationBroadcast) -> Dict[str, Any]:
+    """일괄 알림 진행 상황 응답"""
+    total = broadcast.total_count or 0
+    return {
+        "broadcast_id": broadcast.id,
+        "status": broadcast.status,
+        "user_type": broadcast.user_type,
+        "total_count": total,
+        "sent_count": broadcast.sent_count or 0,
+        "percent": round((broadcast.sent_count or 0) / total * 100, 1) if total else 100.0,
+        "error": broadcast.error,
+        "created_at": broadcast.created_at,
+        "started_at": broadcast.started_at,
+        "completed_at": broadcast.completed_at
+    }
+
+class NotificationBroadcaster:
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        chunk_size: int = settings.notification_broadcast_chunk_size
+    ):
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+    async def start(self):
+        """재시작 전 대기/전송 중이던 작업 이어서 실행"""
+        async with self.session_factory() as db:
+            result = await db.execute(select(NotificationBroadcast.id).where(
+                NotificationBroadcast.status.in_(["pending", "running"])
+            ).order_by(NotificationBroadcast.id))
+            broadcast_ids = result.scalars().all()
+
+        for broadcast_id in broadcast_ids:
+            self._spawn(broadcast_id)
+
+        if broadcast_ids:
+            logger.info(f"미완료 일괄 알림 {len(broadcast_ids)}건 이어서 전송")
+
+    async def stop(self):
+        """전송 태스크 종료 (커밋된 청크까지 반영, 나머지는 재시작 후 이어서 전송)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def submit(
+        self,
+        db: AsyncSession,
+        sender_id: int,
+        type: str,
+        title: str,
+        content: str,
+        data: Optional[Dict[str, Any]] = None,
+        user_type: Optional[str] = None
+    ) -> NotificationBroadcast:
+        """일괄 알림 작업 등록 (대상자 수 기록 후 백그라운드 전송 시작)"""
+        total_count = await db.scalar(
+            select(func.count(User.id)).where(*self._recipient_filters(user_type))
+        )
+
+        broadcast = NotificationBroadcast(
+            sender_id=sender_id,
+            user_type=user_type,
+            type=type,
+            title=title,
+            content=content,
+            data=data,
+            status="pending",
+            total_count=total_count,
+            sent_count=0,
+            last_user_id=0
+        )
+        db.add(broadcast)
+        await db.commit()
+        await db.refresh(broadcast)
+
+        self._spawn(broadcast.id)
+        return broadcast
+
+    async def get(self, db: AsyncSession, broadcast_id: int) -> Optional[NotificationBroadcast]:
+        return await db.get(NotificationBroadcast, broadcast_id, populate_existing=True)
+
+    def _spawn(self, broadcast_id: int):
+        if broadcast_id in self._tasks:
+            return
+        # 요청 컨텍스트(쿼리 통계 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+        task = asyncio.create_task(
+            self._run(broadcast_id), name=f"notification-broadcast-{broadcast_id}", context=contextvars.Context()
+        )
+        self._tasks[broadcast_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(broadcast_id, None))
+
+    async def _run(self, broadcast_id: int):
+        async with self.session_factory() as db:
+            broadcast = await self.get(db, broadcast_id)
+            if broadcast is None or broadcast.status in ("completed", "failed"):
+                return
+
+            broadcast.status = "running"
+            broadcast.started_at = broadcast.started_at or datetime.now()
+            await db.commit()
+
+            try:
+                while await self._send_chunk(db, broadcast):
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"일괄 알림 전송 실패: broadcast_id={broadcast_id}")
+                await db.rollback()
+                broadcast = await self.get(db, broadcast_id)
+                broadcast.status = "failed"
+                broadcast.error = str(e)
+                await db.commit()
+                return
+
+            broadcast.status = "completed"
+            broadcast.completed_at = datetime.now()
+            await db.commit()
+            logger.info(f"일괄 알림 전송 완료: broadcast_id={broadcast_id}, {broadcast.sent_count}명")
+
+    async def _send_chunk(self, db: AsyncSession, broadcast: NotificationBroadcast) -> bool:
+        """
+        다음 청크 전송 (INSERT ... SELECT + 진행 상황 갱신, 한 트랜잭션)
+
+        Returns:
+            전송한 수신자가 있으면 True
+        """
+        filters = self._recipient_filters(broadcast.user_type)
+
+        result = await db.execute(
+            select(User.id).where(*filters, User.id > broadcast.last_user_id).order_by(User.id).limit(self.chunk_size)
+        )
+        receiver_ids = result.scalars().all()
+        if not receiver_ids:
+            return False
+
+        recipients = select(
+            literal(broadcast.sender_id),
+            User.id,
+            literal(broadcast.type),
+            literal(broadcast.title),
+            literal(broadcast.content),
+            literal(broadcast.data, JSON),
+            literal(False)
+        ).where(*filters, User.id > broadcast.last_user_id, User.id <= receiver_ids[-1])
+
+        result = await db.execute(insert(Notification).from_select(
+            ["sender_id", "receiver_id", "type", "title", "content", "data", "is_read"], recipients
+        ))
+
+        # 진행 위치 조건부 갱신 - 다른 워커 프로세스가 같은 작업을 이어받아 먼저 커밋했으면 이 청크는 취소
+        advanced = await db.execute(update(NotificationBroadcast).where(
+            NotificationBroadcast.id == broadcast.id,
+            NotificationBroadcast.last_user_id == broadcast.last_user_id
+        ).values(
+            sent_count=NotificationBroadcast.sent_count + result.rowcount,
+            last_user_id=receiver_ids[-1]
+        ).execution_options(synchronize_session=False))
+        if advanced.rowcount == 0:
+            await db.rollback()
+        else:
+            await db.commit()
+            # INSERT ... SELECT 는 알림 ID 를 돌려주지 않으므로 작업 ID 로 발행 (클라이언트는 목록 재조회)
+            event = {
+                "id": None,
+                "broadcast_id": broadcast.id,
+                "type": broadcast.type,
+                "title": broadcast.title,
+                "content": broadcast.content,
+                "data": broadcast.data,
+                "created_at": datetime.now().isoformat()
+            }
+            for receiver_id in receiver_ids:
+                invalidate_guardian_home(receiver_id)
+                await publish_event(receiver_id, "notification", event)
+
+        await db.refresh(broadcast)
+        return True
+
+    def _recipient_filters(self, user_type: Optional[str]) -> list:
+        filters = [User.is_active == True]
+        if user_type:
+            filters.append(User.user_type == user_type)
+        return filters
+
+# 애플리케이션 전역 일괄 알림 전송기
+notification_broadcaster = NotificationBroadcaster()
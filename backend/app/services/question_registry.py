@@ -0,0 +1,91 @@
+"""
+체크리스트 질문 키 → 점수 카테고리 레지스트리
+
+체크리스트 템플릿(공통 + 질병별) 질문 키는 고정된 집합이므로 시작 시 한 번 분류해 두고
+분석 시에는 dict 조회만 합니다. 템플릿에 없는 키는 키워드 부분 일치로 분류한 뒤
+크기 제한이 있는 메모에 저장합니다.
+
+분류 규칙 (설정으로 변경 가능)
+    question_category_overrides: 질문 키별 카테고리 직접 지정 (우선 적용)
+    question_category_keywords: 카테고리별 키워드 - 키에 포함된 첫 번째 카테고리, 없으면 general
+"""
+from typing import Dict, Iterable, List, Optional
+
+from app.cache import TTLCache
+from app.config import settings
+from app.services.care import COMMON_CHECKLIST, DISEASE_QUESTIONS
+
+DEFAULT_CATEGORY = "general"
+
+def template_question_keys() -> List[str]:
+    """체크리스트 템플릿에 정의된 모든 질문 키"""
+    questions = list(COMMON_CHECKLIST)
+    for disease_questions in DISEASE_QUESTIONS.values():
+        questions.extend(disease_questions)
+    return list(dict.fromkeys(question["key"] for question in questions))
+
+class QuestionCategoryRegistry:
+    def __init__(
+        self,
+        category_keywords: Dict[str, List[str]],
+        question_keys: Iterable[str] = (),
+        overrides: Optional[Dict[str, str]] = None,
+        memo_size: int = 4096
+    ):
+        # (카테고리, 소문자 키워드 튜플) - 설정 순서가 우선순위
+        self._rules = [
+            (category, tuple(keyword.lower() for keyword in keywords))
+            for category, keywords in category_keywords.items()
+        ]
+        self._overrides = dict(overrides or {})
+        self._known: Dict[str, str] = {}
+        self._memo = TTLCache(max_size=memo_size, ttl_seconds=float("inf"))
+        self.register(question_keys)
+
+    @property
+    def categories(self) -> List[str]:
+        """분류 가능한 카테고리 (general 포함)"""
+        categories = [category for category, _ in self._rules] + list(self._overrides.values())
+        return [category for category in dict.fromkeys(categories) if category != DEFAULT_CATEGORY] + [DEFAULT_CATEGORY]
+
+    def register(self, question_keys: Iterable[str]):
+        """질문 키를 미리 분류하여 등록"""
+        for question_key in question_keys:
+            self._known[question_key] = self._match(question_key)
+
+    def classify(self, question_key: str) -> str:
+        """질문 키의 카테고리 (등록된 키는 dict 조회, 그 외는 메모)"""
+        category = self._known.get(question_key)
+        if category is not None:
+            return category
+
+        category = self._memo.get(question_key)
+        if category is None:
+            category = self._match(question_key)
+            self._memo.set(question_key, category)
+        return category
+
+    def stats(self) -> dict:
+        """레지스트리 통계"""
+        return {
+            "registered": len(self._known),
+            "memo": self._memo.stats()
+        }
+
+    def _match(self, question_key: str) -> str:
+        if question_key in self._overrides:
+            return self._overrides[question_key]
+
+        question_lower = question_key.lower()
+        for category, keywords in self._rules:
+            if any(keyword in question_lower for keyword in keywords):
+                return category
+        return DEFAULT_CATEGORY
+
+# 애플리케이션 전역 레지스트리 (모듈 로드 시 템플릿 키로 구성)
+question_registry = QuestionCategoryRegistry(
+    settings.question_category_keywords,
+    template_question_keys(),
+    overrides=settings.question_category_overrides,
+    memo_size=settings.question_category_memo_size
+)
@@ -0,0 +1,162 @@
+"""
+실시간 이벤트 푸시 (리포트/알림)
+
+알림 저장, 리포트 생성이 커밋된 뒤 수신 사용자에게 이벤트를 발행하고,
+클라이언트는 /api/events/stream (Server-Sent Events) 연결 하나로 받아 필요한 화면만 다시 조회합니다.
+가디언 홈/알림, 케어기버 홈을 주기적으로 폴링할 필요가 없어집니다.
+
+발행/구독은 사용자 ID 단위이며 전달 방식은 realtime_backend 설정으로 교체할 수 있습니다.
+    memory : 프로세스 내 전달 (단일 워커 또는 로컬 개발용)
+다중 워커 배포에서는 RealtimeBroker 를 상속해 publish 를 공유 메시지 버스(Redis pub/sub,
+PostgreSQL LISTEN/NOTIFY 등)로 보내고, 버스에서 받은 메시지를 deliver 로 넘기는 백엔드를 등록합니다.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+from sqlalchemy import select, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Guardian, Senior
+
+logger = logging.getLogger("realtime")
+
+# 구독 큐가 가득 찬 느린 클라이언트에게 보내는 이벤트 (전체 다시 조회 요청)
+RESYNC_EVENT = {"event": "resync", "data": {}}
+
+class Subscription:
+    """사용자 한 연결의 이벤트 큐"""
+
+    def __init__(self, broker: "RealtimeBroker", user_id: int, max_size: int):
+        self.broker = broker
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self.closed = False
+
+    def put(self, event: Dict[str, Any]):
+        """이벤트 적재 (가득 차면 쌓인 이벤트를 버리고 resync 하나로 대체)"""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """다음 이벤트 (timeout 초 동안 없으면 None, 종료 시 StopAsyncIteration)"""
+        try:
+            event = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def close(self):
+        """구독 해제 후 대기 중인 get 종료"""
+        if self.closed:
+            return
+        self.closed = True
+        self.broker.unsubscribe(self)
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+class RealtimeBroker:
+    """사용자별 이벤트 발행/구독 (기본 구현은 프로세스 내 전달)"""
+
+    def __init__(self, queue_size: int = settings.realtime_queue_size):
+        self.queue_size = queue_size
+        self._subscriptions: Dict[int, Set[Subscription]] = {}
+        self._published = 0
+        self._delivered = 0
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(self, user_id, self.queue_size)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    async def publish(self, user_id: int, event: str, data: Dict[str, Any]):
+        """사용자에게 이벤트 발행 (다중 워커 백엔드는 공유 버스로 전송하도록 재정의)"""
+        self._published += 1
+        self.deliver(user_id, {"event": event, "data": data})
+
+    def deliver(self, user_id: int, message: Dict[str, Any]):
+        """이 프로세스에 연결된 해당 사용자의 구독에 전달"""
+        for subscription in self._subscriptions.get(user_id, ()):
+            subscription.put(message)
+            self._delivered += 1
+
+    async def close(self):
+        """모든 구독 종료 (애플리케이션 종료 시)"""
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
+
+    def stats(self) -> dict:
+        return {
+            "backend": settings.realtime_backend,
+            "users": len(self._subscriptions),
+            "connections": sum(len(subscriptions) for subscriptions in self._subscriptions.values()),
+            "published": self._published,
+            "delivered": self._delivered
+        }
+
+_brokers: Dict[str, RealtimeBroker] = {}
+
+def get_realtime_broker(name: Optional[str] = None) -> RealtimeBroker:
+    """설정(realtime_backend)에 맞는 공유 브로커 인스턴스"""
+    name = name or settings.realtime_backend
+    if name not in _brokers:
+        if name == "memory":
+            _brokers[name] = RealtimeBroker()
+        else:
+            raise ValueError(f"지원하지 않는 실시간 전달 방식입니다: {name}")
+    return _brokers[name]
+
+async def close_realtime_brokers():
+    """애플리케이션 종료 시 연결 정리"""
+    for broker in _brokers.values():
+        await broker.close()
+
+async def publish_event(user_id: Optional[int], event: str, data: Dict[str, Any]):
+    """사용자에게 이벤트 발행 (발행 실패는 기록만 하고 원래 요청은 계속 진행)"""
+    if user_id is None:
+        return
+    try:
+        await get_realtime_broker().publish(user_id, event, data)
+    except Exception:
+        logger.exception(f"실시간 이벤트 발행 실패: user_id={user_id}, event={event}")
+
+def notification_event(notification) -> Dict[str, Any]:
+    """알림 이벤트 본문 (일괄 전송 직후 로드되지 않은 서버 기본값은 지연 로딩하지 않음)"""
+    created_at = inspect(notification).dict.get("created_at") or datetime.now()
+    return {
+        "id": notification.id,
+        "type": notification.type,
+        "title": notification.title,
+        "content": notification.content,
+        "data": notification.data,
+        "created_at": created_at.isoformat()
+    }
+
+async def publish_report_event(db: AsyncSession, senior_id: int, report_id: int, care_session_id: int):
+    """시니어의 리포트가 생성/갱신되었음을 담당 가디언에게 발행"""
+    user_id = await db.scalar(
+        select(Guardian.user_id).join(Senior, Senior.guardian_id == Guardian.id).where(Senior.id == senior_id)
+    )
+    await publish_event(user_id, "report", {
+        "report_id": report_id,
+        "care_session_id": care_session_id,
+        "senior_id": senior_id
+    })
@@ -0,0 +1,145 @@
+"""
+체크리스트 점수 시계열 조회 서비스
+
+시니어 한 명의 점수를 임의 구간(4/12/52주 등)과 일/주/월 버킷으로 조회합니다.
+버킷마다 한 테이블의 (senior_id, 기간) 인덱스 범위 스캔 한 번으로 끝납니다.
+
+    day   : care_sessions ⋈ checklist_responses 일 단위 집계 (idx_care_sessions_senior_start)
+    week  : weekly_checklist_scores (uq_weekly_scores_senior_week)
+    month : monthly_checklist_scores 사전 집계 (uq_monthly_scores_senior_month)
+
+긴 구간은 월간 사전 집계를 사용하므로 1년 추이도 4주 추이와 비슷한 행 수만 읽습니다.
+"""
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import WeeklyChecklistScore, MonthlyChecklistScore
+from app.services.trend_statistics import summarize_points, trend_window_start
+from app.services.weekly_rebuild import (
+    aggregate_row_values, month_start_of, next_month_start, session_score_aggregate
+)
+
+BUCKETS = ("auto", "day", "week", "month")
+
+def resolve_bucket(weeks: int, bucket: str = "auto") -> str:
+    """auto 버킷 결정 (trend_weekly_bucket_max_weeks 이하는 주, 초과는 월)"""
+    if bucket not in BUCKETS:
+        raise ValueError(f"지원하지 않는 버킷입니다: {bucket}")
+    if bucket != "auto":
+        return bucket
+    return "week" if weeks <= settings.trend_weekly_bucket_max_weeks else "month"
+
+class TimeSeriesService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def weekly_scores(
+        self,
+        senior_id: int,
+        start: date,
+        end: Optional[date] = None
+    ) -> List[WeeklyChecklistScore]:
+        """[start, end) 에 시작하는 주간 점수 행 (주 오름차순, end 없으면 이후 전체)"""
+        query = select(WeeklyChecklistScore).where(
+            WeeklyChecklistScore.senior_id == senior_id,
+            WeeklyChecklistScore.week_start_date >= start
+        )
+        if end is not None:
+            query = query.where(WeeklyChecklistScore.week_start_date < end)
+
+        result = await self.db.execute(query.order_by(WeeklyChecklistScore.week_start_date))
+        return result.scalars().all()
+
+    async def get_series(
+        self,
+        senior_id: int,
+        weeks: Optional[int] = None,
+        bucket: str = "auto",
+        today: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        최근 weeks 주(기본 trend_analysis_weeks) 점수 시계열과 추세 요약
+
+        구간 시작은 추이 분석과 같이 weeks 주 전 이후의 첫 월요일이며,
+        월 버킷은 구간 시작일이 속한 달 전체부터 포함합니다.
+        추세 기울기의 x 는 구간 시작으로부터 지난 주 수(일/월 버킷은 소수)입니다.
+        """
+        today = today or date.today()
+        weeks = min(weeks or settings.trend_analysis_weeks, settings.trend_series_max_weeks)
+        bucket = resolve_bucket(weeks, bucket)
+        window_start = trend_window_start(today, weeks)
+
+        if bucket == "day":
+            points = await self._daily_points(senior_id, window_start, today + timedelta(days=1))
+        elif bucket == "week":
+            points = [self._weekly_point(score) for score in await self.weekly_scores(senior_id, window_start)]
+        else:
+            points = await self._monthly_points(senior_id, month_start_of(window_start))
+
+        summary = summarize_points([
+            ((point["period_start"] - window_start).days / 7, point["score_percentage"])
+            for point in points
+        ])
+        if summary["n"] < settings.min_data_points:
+            summary["trend"] = "insufficient_data"
+
+        return {
+            "senior_id": senior_id,
+            "period_weeks": weeks,
+            "bucket": bucket,
+            "window_start": window_start.isoformat(),
+            "window_end": today.isoformat(),
+            "summary": summary,
+            "points": [self._serialize(point) for point in points]
+        }
+
+    async def _daily_points(self, senior_id: int, start: date, end: date) -> List[Dict[str, Any]]:
+        query = session_score_aggregate(self.db.get_bind().dialect.name, "day", start, end, [senior_id])
+        result = await self.db.execute(query)
+
+        points = []
+        for row in result:
+            point = aggregate_row_values(row)
+            point["period_end"] = point["period_start"]
+            points.append(point)
+        return points
+
+    async def _monthly_points(self, senior_id: int, start: date) -> List[Dict[str, Any]]:
+        result = await self.db.execute(select(MonthlyChecklistScore).where(
+            MonthlyChecklistScore.senior_id == senior_id,
+            MonthlyChecklistScore.month_start >= start
+        ).order_by(MonthlyChecklistScore.month_start))
+
+        return [
+            {
+                "period_start": score.month_start,
+                "period_end": next_month_start(score.month_start) - timedelta(days=1),
+                "total_score": score.total_score,
+                "max_possible_score": score.max_possible_score,
+                "score_percentage": float(score.score_percentage),
+                "checklist_count": score.checklist_count,
+                "score_breakdown": score.score_breakdown
+            }
+            for score in result.scalars().all()
+        ]
+
+    def _weekly_point(self, score: WeeklyChecklistScore) -> Dict[str, Any]:
+        return {
+            "period_start": score.week_start_date,
+            "period_end": score.week_end_date,
+            "total_score": score.total_score,
+            "max_possible_score": score.max_possible_score,
+            "score_percentage": float(score.score_percentage),
+            "checklist_count": score.checklist_count,
+            "score_breakdown": score.score_breakdown
+        }
+
+    def _serialize(self, point: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **point,
+            "period_start": point["period_start"].isoformat(),
+            "period_end": point["period_end"].isoformat()
+        }
@@ -1,43 +1,151 @@
 """
-추이 분석 서비스 - 최근 4주 상태 변화 분석
+추이 분석 서비스 - 최근 trend_analysis_weeks 주(기본 4주) 상태 변화 분석
+
+조회 시 당일 저장된 분석 결과(health_trend_analysis)를 그대로 반환하고,
+구간 주간 점수의 워터마크가 저장 시점과 달라진 경우에만 다시 계산해 저장합니다.
+같은 시니어를 동시에 조회해도 재계산은 프로세스당 한 번만 실행됩니다.
 """
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta, date
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-import statistics
+from datetime import date, datetime
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import SingleFlight
+from app.config import settings
 from app.models.enhanced_care import WeeklyChecklistScore, HealthTrendAnalysis
+from app.services.time_series import TimeSeriesService
+from app.services.trend_statistics import OVERALL, TrendStatisticsService, trend_window_start
+
+INSUFFICIENT_DATA = {
+    "trend": "insufficient_data", 
+    "message": "분석할 데이터가 부족합니다",
+    "weekly_data": [],
+    "recommendations": ["더 많은 데이터 수집이 필요합니다"]
+}
+
+# (시니어, 일자, 워터마크)별 재계산 합치기
+_recompute_flight = SingleFlight()
+
+def format_watermark(
+    window_start: date,
+    week_count: int,
+    checklist_count: int,
+    total_score: int,
+    max_score: int,
+    last_updated: Optional[datetime]
+) -> str:
+    """구간 주간 점수 워터마크 문자열 (조회 시와 일괄 계산 시 동일 형식)"""
+    updated = last_updated.isoformat() if last_updated else ""
+    return f"{window_start}:{week_count}:{checklist_count}:{total_score}:{max_score}:{updated}"
+
+def snapshot_row(senior_id: int, analysis_date: date, analysis_data: Dict[str, Any], watermark: str) -> Dict[str, Any]:
+    """health_trend_analysis 당일 행 값"""
+    return {
+        "senior_id": senior_id,
+        "analysis_date": analysis_date,
+        "period_weeks": settings.trend_analysis_weeks,
+        "trend_summary": analysis_data,
+        "key_indicators": {
+            "trend": analysis_data["trend"],
+            "alert_count": len(analysis_data["alerts"]),
+            "weekly_count": len(analysis_data["weekly_data"])
+        },
+        "ai_insights": f"트렌드: {analysis_data['trend']}, 알림: {len(analysis_data['alerts'])}개",
+        "source_watermark": watermark
+    }
+
+def snapshot_upsert_statement(dialect_name: str):
+    """(시니어, 분석일) 충돌 시 분석 결과 갱신"""
+    if dialect_name not in ("postgresql", "sqlite"):
+        raise ValueError(f"추이 분석 upsert를 지원하지 않는 DB입니다: {dialect_name}")
+    insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+
+    stmt = insert(HealthTrendAnalysis.__table__)
+    return stmt.on_conflict_do_update(
+        index_elements=[HealthTrendAnalysis.senior_id, HealthTrendAnalysis.analysis_date],
+        set_={
+            **{
+                column: stmt.excluded[column]
+                for column in ("period_weeks", "trend_summary", "key_indicators", "ai_insights", "source_watermark")
+            },
+            "updated_at": func.now()
+        }
+    )
 
 class TrendAnalysisService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def analyze_4week_trend(self, senior_id: int) -> Dict[str, Any]:
-        """최근 4주 상태 변화 추이 분석"""
+    async def analyze_4week_trend(self, senior_id: int) -> Dict[str, Any]:
+        """최근 trend_analysis_weeks 주 상태 변화 추이 분석 (당일 저장 결과 재사용, 주간 점수가 바뀐 경우에만 재계산)"""
+        today = date.today()
+        watermark, week_count = await self._weekly_watermark(senior_id, today)
         
-        # 최근 4주 데이터 조회
-        four_weeks_ago = datetime.now() - timedelta(weeks=4)
+        if week_count < settings.min_data_points:
+            return dict(INSUFFICIENT_DATA)
         
-        weekly_scores = self.db.query(WeeklyChecklistScore).filter(
+        snapshot = await self._load_snapshot(senior_id, today)
+        if snapshot is not None and snapshot.source_watermark == watermark:
+            return snapshot.trend_summary
+        
+        return await _recompute_flight.run(
+            (senior_id, today, watermark),
+            lambda: self._recompute(senior_id, today, watermark)
+        )
+    
+    async def _weekly_watermark(self, senior_id: int, today: date):
+        """
+        구간 주간 점수 워터마크 (구간 시작, 주 수, 체크리스트 수/점수 합, 마지막 갱신 시각)
+
+        주간 점수 upsert 와 재집계가 updated_at 을 기록하므로, 재분석/재집계로 점수가 주 사이를
+        옮겨 가 합계가 그대로여도 max(updated_at) 이 바뀌어 다시 계산됩니다.
+        """
+        window_start = trend_window_start(today)
+        result = await self.db.execute(select(
+            func.count(WeeklyChecklistScore.id),
+            func.coalesce(func.sum(WeeklyChecklistScore.checklist_count), 0),
+            func.coalesce(func.sum(WeeklyChecklistScore.total_score), 0),
+            func.coalesce(func.sum(WeeklyChecklistScore.max_possible_score), 0),
+            func.max(WeeklyChecklistScore.updated_at)
+        ).where(
             WeeklyChecklistScore.senior_id == senior_id,
-            WeeklyChecklistScore.week_start_date >= four_weeks_ago.date()
-        ).order_by(WeeklyChecklistScore.week_start_date).all()
+            WeeklyChecklistScore.week_start_date >= window_start
+        ))
+        week_count, checklist_count, total_score, max_score, last_updated = result.one()
+        return format_watermark(window_start, week_count, checklist_count, total_score, max_score, last_updated), week_count
+    
+    async def _load_snapshot(self, senior_id: int, analysis_date: date) -> Optional[HealthTrendAnalysis]:
+        result = await self.db.execute(select(HealthTrendAnalysis).where(
+            HealthTrendAnalysis.senior_id == senior_id,
+            HealthTrendAnalysis.analysis_date == analysis_date
+        ))
+        return result.scalars().first()
+    
+    async def _recompute(self, senior_id: int, today: date, watermark: str) -> Dict[str, Any]:
+        analysis = await self._compute_4week_trend(senior_id, today)
+        if analysis["trend"] != INSUFFICIENT_DATA["trend"]:
+            await self._save_trend_analysis(senior_id, analysis, today, watermark)
+        return analysis
+    
+    async def _compute_4week_trend(self, senior_id: int, today: date) -> Dict[str, Any]:
+        """최근 trend_analysis_weeks 주 상태 변화 추이 계산"""
         
-        if len(weekly_scores) < 2:
-            return {
-                "trend": "insufficient_data", 
-                "message": "분석할 데이터가 부족합니다",
-                "weekly_data": [],
-                "recommendations": ["더 많은 데이터 수집이 필요합니다"]
-            }
+        # 추이 누적 통계 (기울기/평균/변화량은 행 재계산 없이 계산)
+        trend_stats = await TrendStatisticsService(self.db).get(senior_id, today)
+        overall = trend_stats.get(OVERALL)
+        
+        if not overall or overall["n"] < settings.min_data_points:
+            return dict(INSUFFICIENT_DATA)
+        
+        # 주간 상세 표시/특이사항 감지용 구간 주간 데이터 조회
+        weekly_scores = await TimeSeriesService(self.db).weekly_scores(senior_id, trend_window_start(today))
         
-        # 추이 계산
-        scores = [float(score.score_percentage) for score in weekly_scores]
-        trend_analysis = self._calculate_trend(scores)
+        trend_analysis = {"trend": overall["trend"], "strength": overall["strength"]}
         
         # 카테고리별 분석
-        category_trends = self._analyze_categories(weekly_scores)
+        category_trends = self._analyze_categories(trend_stats)
         
         # 특이사항 감지
         alerts = self._detect_alerts(weekly_scores)
@@ -62,117 +170,84 @@ class TrendAnalysisService:
                 "total_score": score.total_score
             })
         
-        # 트렌드 분석 결과 저장
-        self._save_trend_analysis(senior_id, {
-            "trend": trend_analysis["trend"],
-            "weekly_data": weekly_data,
-            "category_analysis": category_trends,
-            "alerts": alerts
-        })
-        
         return {
             "trend": trend_analysis["trend"],
             "trend_strength": trend_analysis["strength"],
-            "average_score": statistics.mean(scores),
-            "score_change": scores[-1] - scores[0] if len(scores) >= 2 else 0,
+            "average_score": overall["average"],
+            "score_change": overall["change"],
+            "smoothed_score": overall["ewma"],
             "weekly_data": weekly_data,
             "category_analysis": category_trends,
             "alerts": alerts,
             "recommendations": self._generate_recommendations(trend_analysis, alerts)
         }
     
-    def _calculate_trend(self, scores: List[float]) -> Dict[str, Any]:
-        """점수 배열로부터 추이 계산"""
-        if len(scores) < 2:
-            return {"trend": "stable", "strength": 0}
-        
-        # 선형 회귀를 통한 추세 계산
-        n = len(scores)
-        x = list(range(n))
-        y = scores
-        
-        # 기울기 계산 (최소제곱법)
-        x_mean = statistics.mean(x)
-        y_mean = statistics.mean(y)
-        
-        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            slope = 0
-        else:
-            slope = numerator / denominator
-        
-        # 추세 판단
-        if slope > 2:
-            return {"trend": "improving", "strength": min(abs(slope), 10)}
-        elif slope < -2:
-            return {"trend": "declining", "strength": min(abs(slope), 10)}
-        else:
-            return {"trend": "stable", "strength": abs(slope)}
-    
-    def _analyze_categories(self, weekly_scores: List[WeeklyChecklistScore]) -> Dict[str, Any]:
+    def _analyze_categories(self, trend_stats: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """카테고리별 상세 분석"""
-        category_data = {}
-        
-        for score in weekly_scores:
-            if score.score_breakdown:
-                for category, value in score.score_breakdown.items():
-                    if category not in category_data:
-                        category_data[category] = []
-                    category_data[category].append(float(value) if value else 0)
-        
         category_trends = {}
-        for category, values in category_data.items():
-            if len(values) >= 2:
-                trend = self._calculate_trend(values)
+        for category, stat in trend_stats.items():
+            if category != OVERALL and stat["n"] >= settings.min_data_points:
                 category_trends[category] = {
-                    "current_score": values[-1],
-                    "trend": trend["trend"],
-                    "change": values[-1] - values[0],
-                    "average": statistics.mean(values)
+                    "current_score": stat["current"],
+                    "trend": stat["trend"],
+                    "change": stat["change"],
+                    "average": stat["average"]
                 }
         
         return category_trends
     
     def _detect_alerts(self, weekly_scores: List[WeeklyChecklistScore]) -> List[Dict[str, Any]]:
         """이상 상황 감지"""
+        if len(weekly_scores) < 2:
+            return []
+        
+        latest = weekly_scores[-1]
+        previous = weekly_scores[-2]
+        scores = [float(s.score_percentage) for s in weekly_scores[-3:]]
+        
+        return self._build_alerts(
+            score_diff=float(latest.score_percentage) - float(previous.score_percentage),
+            continuous_decline=len(scores) >= 3 and all(scores[i] > scores[i+1] for i in range(len(scores)-1)),
+            low_activity=latest.checklist_count < 2 and previous.checklist_count >= 3
+        )
+    
+    def _build_alerts(self, score_diff: float, continuous_decline: bool, low_activity: bool) -> List[Dict[str, Any]]:
+        """
+        감지 결과로 알림 목록 생성
+
+        Args:
+            score_diff: 최근 주 - 직전 주 점수율 (alert_threshold_percentage 이상 하락 시 알림)
+            continuous_decline: 최근 3주 연속 하락 여부
+            low_activity: 최근 주 체크리스트 2회 미만 & 직전 주 3회 이상
+        """
         alerts = []
         
-        if len(weekly_scores) >= 2:
-            latest = weekly_scores[-1]
-            previous = weekly_scores[-2]
-            
-            # 급격한 점수 하락
-            score_diff = float(latest.score_percentage) - float(previous.score_percentage)
-            if score_diff < -15:
-                alerts.append({
-                    "type": "score_drop",
-                    "severity": "high",
-                    "message": f"이번 주 컨디션이 {abs(score_diff):.1f}% 급격히 저하되었습니다",
-                    "recommendation": "가디언에게 즉시 연락하여 상태 확인이 필요합니다"
-                })
-            
-            # 지속적인 하락 (3주 연속)
-            if len(weekly_scores) >= 3:
-                last_three = weekly_scores[-3:]
-                scores = [float(s.score_percentage) for s in last_three]
-                if all(scores[i] > scores[i+1] for i in range(len(scores)-1)):
-                    alerts.append({
-                        "type": "continuous_decline",
-                        "severity": "medium", 
-                        "message": "3주 연속 상태가 저하되고 있습니다",
-                        "recommendation": "전문의 상담을 고려해보세요"
-                    })
-            
-            # 체크리스트 제출 빈도 저하
-            if latest.checklist_count < 2 and previous.checklist_count >= 3:
-                alerts.append({
-                    "type": "low_activity",
-                    "severity": "low",
-                    "message": "이번 주 케어 활동이 평소보다 적습니다",
-                    "recommendation": "케어기버와 스케줄을 확인해보세요"
-                })
+        # 급격한 점수 하락
+        if score_diff < -settings.alert_threshold_percentage:
+            alerts.append({
+                "type": "score_drop",
+                "severity": "high",
+                "message": f"이번 주 컨디션이 {abs(score_diff):.1f}% 급격히 저하되었습니다",
+                "recommendation": "가디언에게 즉시 연락하여 상태 확인이 필요합니다"
+            })
+        
+        # 지속적인 하락 (3주 연속)
+        if continuous_decline:
+            alerts.append({
+                "type": "continuous_decline",
+                "severity": "medium", 
+                "message": "3주 연속 상태가 저하되고 있습니다",
+                "recommendation": "전문의 상담을 고려해보세요"
+            })
+        
+        # 체크리스트 제출 빈도 저하
+        if low_activity:
+            alerts.append({
+                "type": "low_activity",
+                "severity": "low",
+                "message": "이번 주 케어 활동이 평소보다 적습니다",
+                "recommendation": "케어기버와 스케줄을 확인해보세요"
+            })
         
         return alerts
     
@@ -204,35 +279,16 @@ class TrendAnalysisService:
         
         return recommendations
     
-    def _save_trend_analysis(self, senior_id: int, analysis_data: Dict[str, Any]):
-        """트렌드 분석 결과를 데이터베이스에 저장"""
-        
-        # 기존 분석 결과가 있는지 확인 (오늘 날짜)
-        today = date.today()
-        existing_analysis = self.db.query(HealthTrendAnalysis).filter(
-            HealthTrendAnalysis.senior_id == senior_id,
-            HealthTrendAnalysis.analysis_date == today
-        ).first()
-        
-        if existing_analysis:
-            # 기존 레코드 업데이트
-            existing_analysis.trend_summary = analysis_data
-            existing_analysis.ai_insights = f"트렌드: {analysis_data['trend']}, 알림: {len(analysis_data['alerts'])}개"
-            existing_analysis.updated_at = func.now()
-        else:
-            # 새 레코드 생성
-            new_analysis = HealthTrendAnalysis(
-                senior_id=senior_id,
-                analysis_date=today,
-                period_weeks=4,
-                trend_summary=analysis_data,
-                key_indicators={
-                    "trend": analysis_data["trend"],
-                    "alert_count": len(analysis_data["alerts"]),
-                    "weekly_count": len(analysis_data["weekly_data"])
-                },
-                ai_insights=f"트렌드: {analysis_data['trend']}, 알림: {len(analysis_data['alerts'])}개"
-            )
-            self.db.add(new_analysis)
-        
-        self.db.commit()
+    async def _save_trend_analysis(
+        self,
+        senior_id: int,
+        analysis_data: Dict[str, Any],
+        analysis_date: date,
+        watermark: str
+    ):
+        """트렌드 분석 결과(응답 전체)를 워터마크와 함께 당일 행에 저장 (있으면 갱신)"""
+        await self.db.execute(
+            snapshot_upsert_statement(self.db.get_bind().dialect.name),
+            [snapshot_row(senior_id, analysis_date, analysis_data, watermark)]
+        )
+        await self.db.commit()
@@ -0,0 +1,289 @@
+"""
+전체 시니어 추이 분석 일괄 계산 (야간 배치)
+
+구간 주간 점수를 한 번의 쿼리로 읽어 (시니어 × 주) NumPy 배열로 만든 뒤
+    - 전체/카테고리별 기울기, 평균, 변화량, EWMA
+    - 특이사항 규칙 (급격한 하락, 3주 연속 하락, 케어 활동 저하)
+를 시니어 전체에 대해 벡터 연산으로 계산하고 health_trend_analysis 당일 행을 일괄 upsert 합니다.
+
+저장 행에는 조회 시와 같은 형식의 워터마크를 기록하므로, 이후 주간 점수가 바뀌지 않은
+시니어의 가디언 추이 조회는 저장 결과 조회만으로 끝납니다.
+계산 기준은 TrendAnalysisService (trend_statistics 누적 통계)와 동일합니다.
+"""
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+
+from app.config import settings
+from app.models import WeeklyChecklistScore
+from app.services.trend_analysis import TrendAnalysisService, format_watermark, snapshot_row, snapshot_upsert_statement
+from app.services.trend_statistics import trend_window_start
+
+# 추세 코드 → 이름 (classify_trend 와 동일 기준)
+TREND_NAMES = ["stable", "improving", "declining"]
+
+def series_statistics(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    마지막 축이 주인 점수 배열(빈 주는 NaN)의 추이 통계
+
+    x = 구간 첫 주로부터 지난 주 수, 기울기 = (nΣxy - ΣxΣy) / (nΣx² - (Σx)²)
+    """
+    weeks = values.shape[-1]
+    mask = ~np.isnan(values)
+    x = np.arange(weeks, dtype=float)
+    y = np.where(mask, values, 0.0)
+    x_masked = mask * x
+
+    n = mask.sum(axis=-1)
+    sum_x = x_masked.sum(axis=-1)
+    sum_y = y.sum(axis=-1)
+    sum_xy = (x * y).sum(axis=-1)
+    sum_xx = (x_masked * x).sum(axis=-1)
+
+    numerator = n * sum_xy - sum_x * sum_y
+    denominator = n * sum_xx - sum_x ** 2
+    slope = np.divide(
+        numerator, denominator,
+        out=np.zeros_like(numerator), where=(n >= 2) & (denominator != 0)
+    )
+    abs_slope = np.abs(slope)
+
+    # 첫/마지막 값이 있는 주
+    first_index = mask.argmax(axis=-1)
+    last_index = weeks - 1 - mask[..., ::-1].argmax(axis=-1)
+    first = np.take_along_axis(values, first_index[..., None], axis=-1)[..., 0]
+    last = np.take_along_axis(values, last_index[..., None], axis=-1)[..., 0]
+
+    # 주 순서대로 지수 평활 (첫 값에서 시작)
+    alpha = settings.trend_ewma_alpha
+    ewma = np.full(values.shape[:-1], np.nan)
+    for week in range(weeks):
+        column = values[..., week]
+        smoothed = np.where(np.isnan(ewma), column, alpha * column + (1 - alpha) * ewma)
+        ewma = np.where(mask[..., week], smoothed, ewma)
+
+    return {
+        "n": n,
+        "trend": np.where(slope > 2, 1, np.where(slope < -2, 2, 0)),
+        "strength": np.where(abs_slope > 2, np.minimum(abs_slope, 10), abs_slope),
+        "average": np.divide(sum_y, n, out=np.zeros_like(sum_y), where=n > 0),
+        "change": np.where(n >= 2, last - first, 0.0),
+        "current": last,
+        "ewma": ewma
+    }
+
+class TrendBatchAnalyzer:
+    def __init__(
+        self,
+        session_factory,
+        chunk_size: int = 5000,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+    async def run(self, today: Optional[date] = None) -> Dict[str, Any]:
+        """전체 시니어 당일 추이 분석 저장 후 처리량 통계 반환"""
+        today = today or date.today()
+        window_start = trend_window_start(today)
+        started = time.perf_counter()
+
+        async with self.session_factory() as db:
+            rows = await self._load(db, window_start)
+            loaded = time.perf_counter()
+
+            snapshots, senior_count = self._analyze(rows, window_start, today)
+            computed = time.perf_counter()
+
+            # 청크마다 커밋하여 조회 시 재계산과의 잠금 대기 최소화
+            statement = snapshot_upsert_statement(db.get_bind().dialect.name)
+            for i in range(0, len(snapshots), self.chunk_size):
+                await db.execute(statement, snapshots[i:i + self.chunk_size])
+                await db.commit()
+                self._report_progress(min(i + self.chunk_size, len(snapshots)), len(snapshots))
+
+        finished = time.perf_counter()
+        elapsed = finished - started
+
+        return {
+            "analysis_date": today,
+            "window_start": window_start,
+            "weekly_rows": len(rows),
+            "seniors": senior_count,
+            "analyzed": len(snapshots),
+            "insufficient_data": senior_count - len(snapshots),
+            "load_seconds": round(loaded - started, 2),
+            "compute_seconds": round(computed - loaded, 2),
+            "write_seconds": round(finished - computed, 2),
+            "elapsed_seconds": round(elapsed, 2),
+            "seniors_per_second": round(senior_count / elapsed, 1) if elapsed > 0 else 0
+        }
+
+    async def _load(self, db, window_start: date) -> List[tuple]:
+        """구간 내 전체 시니어 주간 점수 (시니어, 주 순)"""
+        result = await db.execute(
+            select(
+                WeeklyChecklistScore.senior_id,
+                WeeklyChecklistScore.week_start_date,
+                WeeklyChecklistScore.score_percentage,
+                WeeklyChecklistScore.checklist_count,
+                WeeklyChecklistScore.total_score,
+                WeeklyChecklistScore.max_possible_score,
+                WeeklyChecklistScore.score_breakdown,
+                WeeklyChecklistScore.updated_at
+            ).where(
+                WeeklyChecklistScore.week_start_date >= window_start
+            ).order_by(WeeklyChecklistScore.senior_id, WeeklyChecklistScore.week_start_date)
+        )
+        return result.all()
+
+    def _analyze(self, rows: List[tuple], window_start: date, today: date):
+        """주간 점수 행 → (health_trend_analysis 행 목록, 시니어 수)"""
+        if not rows:
+            return [], 0
+
+        senior_col, week_col, percentage_col, count_col, total_col, max_col, breakdown_col, updated_col = zip(*rows)
+        senior = np.array(senior_col, dtype=np.int64)
+        week_index = (np.array([week.toordinal() for week in week_col]) - window_start.toordinal()) // 7
+        percentage = np.array(percentage_col, dtype=float)
+        checklist_count = np.array(count_col, dtype=np.int64)
+
+        # 시니어별 행 구간 (senior_id 순 정렬)
+        senior_ids, starts, counts = np.unique(senior, return_index=True, return_counts=True)
+        row_senior = np.repeat(np.arange(len(senior_ids)), counts)
+        weeks = int(week_index.max()) + 1
+
+        # 전체 점수율 (시니어 × 주)
+        overall_values = np.full((len(senior_ids), weeks), np.nan)
+        overall_values[row_senior, week_index] = percentage
+        overall = series_statistics(overall_values)
+
+        # 카테고리 점수 (시니어 × 카테고리 × 주)
+        category_names: Dict[str, int] = {}
+        category_rows, category_index, category_values = [], [], []
+        for row, breakdown in enumerate(breakdown_col):
+            for category, value in (breakdown or {}).items():
+                category_rows.append(row)
+                category_index.append(category_names.setdefault(category, len(category_names)))
+                category_values.append(float(value) if value else 0)
+        category_grid = np.full((len(senior_ids), len(category_names), weeks), np.nan)
+        if category_rows:
+            category_rows = np.array(category_rows)
+            category_grid[row_senior[category_rows], category_index, week_index[category_rows]] = category_values
+        categories = series_statistics(category_grid)
+
+        # 특이사항 규칙 (시니어별 마지막 3개 행)
+        last = starts + counts - 1
+        previous = np.maximum(last - 1, 0)
+        before = np.maximum(last - 2, 0)
+        has_previous = counts >= 2
+        score_diff = np.where(has_previous, percentage[last] - percentage[previous], 0.0)
+        continuous_decline = (counts >= 3) & (percentage[before] > percentage[previous]) & (percentage[previous] > percentage[last])
+        low_activity = has_previous & (checklist_count[last] < 2) & (checklist_count[previous] >= 3)
+
+        # 주별 표시 지표 (직전 행 대비 ±5)
+        prior = np.roll(percentage, 1)
+        row_indicator = np.where(percentage > prior + 5, 1, np.where(percentage < prior - 5, 2, 0))
+        row_indicator[starts] = 0
+
+        # 워터마크 (조회 시 _weekly_watermark 와 같은 합계/마지막 갱신 시각)
+        checklist_sums = np.add.reduceat(checklist_count, starts)
+        total_sums = np.add.reduceat(np.array(total_col, dtype=np.int64), starts)
+        max_sums = np.add.reduceat(np.array(max_col, dtype=np.int64), starts)
+        last_updated = [
+            max((updated for updated in updated_col[start:start + count] if updated is not None), default=None)
+            for start, count in zip(starts.tolist(), counts.tolist())
+        ]
+
+        return self._build_snapshots(
+            today, window_start, weeks, senior_ids, starts, counts,
+            overall, categories, list(category_names),
+            score_diff, continuous_decline, low_activity,
+            week_index, percentage, checklist_count, total_col, row_indicator,
+            checklist_sums, total_sums, max_sums, last_updated
+        ), len(senior_ids)
+
+    def _build_snapshots(
+        self, today, window_start, weeks, senior_ids, starts, counts,
+        overall, categories, category_names,
+        score_diff, continuous_decline, low_activity,
+        week_index, percentage, checklist_count, total_col, row_indicator,
+        checklist_sums, total_sums, max_sums, last_updated
+    ) -> List[Dict[str, Any]]:
+        """시니어별 응답(JSON) 조립 - 조회 시 TrendAnalysisService 응답과 같은 형식"""
+        service = TrendAnalysisService(db=None)
+        week_labels = [(window_start + timedelta(weeks=week)).strftime("%Y-%m-%d") for week in range(weeks)]
+
+        # 카테고리 분석 (값이 min_data_points 주 이상인 항목만 모아서 시니어별로 묶음)
+        category_analysis = defaultdict(dict)
+        selected_seniors, selected_categories = np.nonzero(categories["n"] >= settings.min_data_points)
+        selected = zip(
+            selected_seniors.tolist(), selected_categories.tolist(),
+            *(categories[key][selected_seniors, selected_categories].tolist() for key in ("current", "trend", "change", "average"))
+        )
+        for s, c, current, trend, change, average in selected:
+            category_analysis[s][category_names[c]] = {
+                "current_score": current,
+                "trend": TREND_NAMES[trend],
+                "change": change,
+                "average": average
+            }
+
+        # 파이썬 값으로 한 번에 변환
+        overall = {key: value.tolist() for key, value in overall.items()}
+        senior_ids, starts, counts = senior_ids.tolist(), starts.tolist(), counts.tolist()
+        week_index, percentage = week_index.tolist(), percentage.tolist()
+        checklist_count, row_indicator = checklist_count.tolist(), row_indicator.tolist()
+        score_diff, continuous_decline, low_activity = score_diff.tolist(), continuous_decline.tolist(), low_activity.tolist()
+        checklist_sums, total_sums, max_sums = checklist_sums.tolist(), total_sums.tolist(), max_sums.tolist()
+
+        snapshots = []
+        for s, count in enumerate(counts):
+            if count < settings.min_data_points:
+                continue
+            start = starts[s]
+            end = start + count
+            trend = TREND_NAMES[overall["trend"][s]]
+            alerts = service._build_alerts(score_diff[s], continuous_decline[s], low_activity[s]) if count >= 2 else []
+
+            analysis = {
+                "trend": trend,
+                "trend_strength": overall["strength"][s],
+                "average_score": overall["average"][s],
+                "score_change": overall["change"][s],
+                "smoothed_score": overall["ewma"][s],
+                "weekly_data": [
+                    {
+                        "week": week_labels[week_index[row]],
+                        "score": percentage[row],
+                        "trend_indicator": TREND_NAMES[row_indicator[row]],
+                        "checklist_count": checklist_count[row],
+                        "total_score": total_col[row]
+                    }
+                    for row in range(start, end)
+                ],
+                "category_analysis": category_analysis.get(s, {}),
+                "alerts": alerts,
+                "recommendations": service._generate_recommendations({"trend": trend}, alerts)
+            }
+
+            watermark = format_watermark(
+                window_start, end - start, checklist_sums[s], total_sums[s], max_sums[s], last_updated[s]
+            )
+            snapshots.append(snapshot_row(senior_ids[s], today, analysis, watermark))
+
+        return snapshots
+
+    def _report_progress(self, written: int, total: int):
+        if not self.progress:
+            return
+        self.progress({
+            "written": written,
+            "total": total,
+            "percent": round(written / total * 100, 1) if total else 100.0
+        })
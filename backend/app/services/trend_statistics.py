@@ -0,0 +1,232 @@
+"""
+추이 누적 통계 서비스
+
+시니어별/카테고리별 최근 trend_analysis_weeks 주 점수의 충분 통계량(n, Σx, Σy, Σxy, Σx², EWMA)을
+trend_statistics 에 유지합니다. 주간 점수가 갱신될 때 해당 주 값만 더하거나 바꾸고,
+추이 조회 시 기울기/평균/변화량을 행 재계산 없이 상수 시간에 계산합니다.
+
+    x = 구간 첫 주로부터 지난 주 수, y = 점수율(overall) 또는 카테고리 점수
+    기울기 = (nΣxy - ΣxΣy) / (nΣx² - (Σx)²)
+
+갱신 규칙
+    - 마지막 주 값 변경/새 주 추가: 누적값 증분 갱신
+    - 구간 이동(주가 바뀜), 이전 주 값 변경, 통계 없음: 해당 시니어 구간 주간 점수로 다시 계산
+    - 주간 점수 재집계(WeeklyScoreRebuilder): 통계 삭제 후 다음 조회/갱신 때 다시 계산
+
+동시 갱신은 시니어 행 잠금(SELECT ... FOR UPDATE)으로 직렬화합니다. 통계 행이 아직 없어
+다시 계산하는 경우에도 같은 행을 잠그므로 동시 재계산이 서로의 주를 빠뜨리지 않습니다.
+"""
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Senior, WeeklyChecklistScore, TrendStatistic
+
+OVERALL = "overall"
+SUM_FIELDS = ("n", "sum_x", "sum_y", "sum_xy", "sum_xx")
+
+def trend_window_start(today: Optional[date] = None, weeks: Optional[int] = None) -> date:
+    """추이 구간 첫 주 (today 기준 weeks(기본 trend_analysis_weeks) 주 전 이후의 첫 월요일)"""
+    since = (today or date.today()) - timedelta(weeks=weeks or settings.trend_analysis_weeks)
+    return since + timedelta(days=(7 - since.weekday()) % 7)
+
+def classify_trend(slope: float) -> Dict[str, Any]:
+    """기울기로 추세 판단 (주당 점수 변화 ±2 기준)"""
+    if slope > 2:
+        return {"trend": "improving", "strength": min(abs(slope), 10)}
+    elif slope < -2:
+        return {"trend": "declining", "strength": min(abs(slope), 10)}
+    else:
+        return {"trend": "stable", "strength": abs(slope)}
+
+def summarize(stat: TrendStatistic) -> Dict[str, Any]:
+    """누적 통계로 추세/평균/변화량 계산"""
+    n = stat.n
+    denominator = n * stat.sum_xx - stat.sum_x ** 2
+    slope = (n * stat.sum_xy - stat.sum_x * stat.sum_y) / denominator if n >= 2 and denominator else 0
+
+    return {
+        "n": n,
+        "slope": slope,
+        **classify_trend(slope),
+        "average": stat.sum_y / n if n else 0,
+        "change": stat.last_value - stat.first_value if n >= 2 else 0,
+        "current": stat.last_value,
+        "ewma": stat.ewma
+    }
+
+def summarize_points(points: List[tuple]) -> Dict[str, Any]:
+    """(x, y) 점 목록(x 오름차순)의 추세/평균/변화량 (누적 통계와 같은 계산, 저장하지 않음)"""
+    stat = TrendStatistic(**{field: 0 for field in SUM_FIELDS})
+    for x, y in points:
+        _add_point(stat, None, x, y)
+    return summarize(stat)
+
+def _week_values(score_percentage, score_breakdown: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """주간 점수 한 행의 카테고리별 값"""
+    values = {OVERALL: float(score_percentage)}
+    for category, value in (score_breakdown or {}).items():
+        values[category] = float(value) if value else 0
+    return values
+
+def _add_point(stat: TrendStatistic, week: date, x: int, y: float):
+    stat.n += 1
+    stat.sum_x += x
+    stat.sum_y += y
+    stat.sum_xy += x * y
+    stat.sum_xx += x * x
+    if stat.n == 1:
+        stat.first_value = y
+        stat.ewma_prev = None
+        stat.ewma = y
+    else:
+        alpha = settings.trend_ewma_alpha
+        stat.ewma_prev = stat.ewma
+        stat.ewma = alpha * y + (1 - alpha) * stat.ewma
+    stat.last_week = week
+    stat.last_value = y
+
+def _replace_last(stat: TrendStatistic, x: int, y: float):
+    delta = y - stat.last_value
+    stat.sum_y += delta
+    stat.sum_xy += x * delta
+    stat.last_value = y
+    if stat.n == 1:
+        stat.first_value = y
+        stat.ewma = y
+    else:
+        alpha = settings.trend_ewma_alpha
+        stat.ewma = alpha * y + (1 - alpha) * stat.ewma_prev
+
+class TrendStatisticsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, senior_id: int, today: Optional[date] = None) -> Dict[str, Dict[str, Any]]:
+        """카테고리별 추이 요약 (overall 포함, 구간이 지났으면 먼저 다시 계산)"""
+        window_start = trend_window_start(today)
+        stats = await self._load(senior_id)
+
+        if not stats or stats[0].window_start != window_start:
+            await self.refresh([senior_id], today)
+            stats = await self._load(senior_id)
+
+        return {stat.category: summarize(stat) for stat in stats}
+
+    async def record_week(
+        self,
+        senior_id: int,
+        week_start: date,
+        score_percentage,
+        score_breakdown: Optional[Dict[str, Any]],
+        today: Optional[date] = None
+    ):
+        """주간 점수 한 행의 현재 값 반영 (커밋은 호출 측 트랜잭션에서)"""
+        window_start = trend_window_start(today)
+        if week_start < window_start:
+            return
+
+        # 같은 시니어의 동시 갱신 직렬화 (통계 행이 없는 첫 갱신도 잠기도록 시니어 행 기준)
+        await self._lock_seniors([senior_id])
+        stats = {stat.category: stat for stat in await self._load(senior_id)}
+        overall = stats.get(OVERALL)
+        if overall is None or overall.window_start != window_start or week_start < overall.last_week:
+            await self.refresh([senior_id], today)
+            return
+
+        x = (week_start - window_start).days // 7
+        for category, value in _week_values(score_percentage, score_breakdown).items():
+            stat = stats.get(category)
+            if stat is None:
+                stat = TrendStatistic(
+                    senior_id=senior_id, category=category, window_start=window_start,
+                    **{field: 0 for field in SUM_FIELDS}
+                )
+                self.db.add(stat)
+            if stat.last_week == week_start:
+                _replace_last(stat, x, value)
+            else:
+                _add_point(stat, week_start, x, value)
+
+    async def refresh(self, senior_ids: List[int], today: Optional[date] = None) -> int:
+        """구간 내 주간 점수로 통계 다시 계산 (커밋은 호출 측 트랜잭션에서), 생성한 통계 행 수 반환"""
+        window_start = trend_window_start(today)
+        await self._lock_seniors(senior_ids)
+        result = await self.db.execute(
+            select(
+                WeeklyChecklistScore.senior_id,
+                WeeklyChecklistScore.week_start_date,
+                WeeklyChecklistScore.score_percentage,
+                WeeklyChecklistScore.score_breakdown
+            ).where(
+                WeeklyChecklistScore.senior_id.in_(senior_ids),
+                WeeklyChecklistScore.week_start_date >= window_start
+            ).order_by(WeeklyChecklistScore.senior_id, WeeklyChecklistScore.week_start_date)
+        )
+
+        stats: Dict[tuple, TrendStatistic] = {}
+        for row in result:
+            x = (row.week_start_date - window_start).days // 7
+            for category, value in _week_values(row.score_percentage, row.score_breakdown).items():
+                key = (row.senior_id, category)
+                if key not in stats:
+                    stats[key] = TrendStatistic(**{field: 0 for field in SUM_FIELDS})
+                _add_point(stats[key], row.week_start_date, x, value)
+
+        await self.db.execute(delete(TrendStatistic).where(TrendStatistic.senior_id.in_(senior_ids)))
+        if stats:
+            await self.db.execute(self._upsert_statement(), [
+                {
+                    "senior_id": senior_id,
+                    "category": category,
+                    "window_start": window_start,
+                    **{column: getattr(stat, column) for column in self._value_columns()}
+                }
+                for (senior_id, category), stat in stats.items()
+            ])
+        return len(stats)
+
+    async def invalidate(self, senior_ids: Optional[List[int]] = None):
+        """통계 삭제 (다음 조회/갱신 때 다시 계산, 커밋은 호출 측 트랜잭션에서)"""
+        stmt = delete(TrendStatistic)
+        if senior_ids:
+            stmt = stmt.where(TrendStatistic.senior_id.in_(senior_ids))
+        await self.db.execute(stmt)
+
+    async def _lock_seniors(self, senior_ids: List[int]):
+        """시니어 행 잠금 (ID 순으로 잠가 교착 방지, 같은 트랜잭션에서 다시 잠가도 무방)"""
+        await self.db.execute(
+            select(Senior.id).where(Senior.id.in_(senior_ids)).order_by(Senior.id).with_for_update()
+        )
+
+    async def _load(self, senior_id: int) -> List[TrendStatistic]:
+        query = select(TrendStatistic).where(
+            TrendStatistic.senior_id == senior_id
+        ).order_by(TrendStatistic.id).execution_options(populate_existing=True)
+        result = await self.db.execute(query)
+        stats = result.scalars().all()
+        # overall 을 맨 앞으로
+        return sorted(stats, key=lambda stat: stat.category != OVERALL)
+
+    def _value_columns(self):
+        return SUM_FIELDS + ("first_value", "last_week", "last_value", "ewma", "ewma_prev")
+
+    def _upsert_statement(self):
+        """동시 재계산 시 (시니어, 카테고리) 충돌은 덮어쓰기"""
+        dialect_name = self.db.get_bind().dialect.name
+        if dialect_name not in ("postgresql", "sqlite"):
+            raise ValueError(f"추이 통계 upsert를 지원하지 않는 DB입니다: {dialect_name}")
+        insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+
+        stmt = insert(TrendStatistic.__table__)
+        return stmt.on_conflict_do_update(
+            index_elements=[TrendStatistic.senior_id, TrendStatistic.category],
+            set_={
+                column: stmt.excluded[column]
+                for column in ("window_start",) + self._value_columns()
+            }
+        )
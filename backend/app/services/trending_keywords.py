@@ -0,0 +1,148 @@
+"""
+인기 키워드 집계 서비스
+
+리포트 키워드가 저장/변경될 때 keyword_daily_counts 의 (일자, 요양원, 키워드) 카운터를 증감하고,
+인기 키워드 조회는 ai_reports.keywords JSON 전체를 훑지 않고 일자 범위 인덱스로 합산합니다.
+카운터 일자는 리포트가 속한 케어 세션의 시작일입니다.
+"""
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select, update, delete, func, bindparam
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import AIReport, CareSession, Senior, KeywordDailyCount
+
+# (케어 세션 ID, 이전 키워드, 새 키워드)
+KeywordChange = Tuple[int, Optional[Iterable[str]], Optional[Iterable[str]]]
+
+class TrendingKeywordService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record(
+        self,
+        care_session_id: int,
+        new_keywords: Optional[Iterable[str]],
+        old_keywords: Optional[Iterable[str]] = None
+    ):
+        """리포트 한 건의 키워드 변경 반영 (커밋은 호출 측 트랜잭션에서)"""
+        await self.record_many([(care_session_id, old_keywords, new_keywords)])
+
+    async def record_many(self, changes: List[KeywordChange]):
+        """여러 리포트의 키워드 변경을 (일자, 요양원, 키워드) 단위 증감으로 합쳐 반영"""
+        deltas = defaultdict(int)
+        buckets = await self._session_buckets([change[0] for change in changes])
+
+        for care_session_id, old_keywords, new_keywords in changes:
+            bucket = buckets.get(care_session_id)
+            if bucket is None:
+                continue
+            for keyword in set(new_keywords or []) - set(old_keywords or []):
+                deltas[bucket + (keyword,)] += 1
+            for keyword in set(old_keywords or []) - set(new_keywords or []):
+                deltas[bucket + (keyword,)] -= 1
+
+        await self._apply(deltas)
+
+    async def get_trending(
+        self,
+        days: int = 30,
+        limit: int = 10,
+        nursing_home_id: Optional[int] = None,
+        today: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """최근 days 일(오늘 포함) 키워드 사용 횟수 상위 limit 개"""
+        since = (today or date.today()) - timedelta(days=days - 1)
+        total = func.sum(KeywordDailyCount.count).label("count")
+
+        query = select(KeywordDailyCount.keyword, total).where(KeywordDailyCount.day >= since)
+        if nursing_home_id is not None:
+            query = query.where(KeywordDailyCount.nursing_home_id == nursing_home_id)
+
+        result = await self.db.execute(
+            query.group_by(KeywordDailyCount.keyword)
+            .having(total > 0)
+            .order_by(total.desc(), KeywordDailyCount.keyword)
+            .limit(limit)
+        )
+        return [{"keyword": row.keyword, "count": int(row.count)} for row in result]
+
+    async def rebuild(self, start_date: date, end_date: date) -> Dict[str, Any]:
+        """기간 내 카운터를 리포트 키워드로 다시 집계 (최초 적재/불일치 복구용)"""
+        await self.db.execute(delete(KeywordDailyCount).where(
+            KeywordDailyCount.day >= start_date,
+            KeywordDailyCount.day <= end_date
+        ))
+
+        result = await self.db.execute(
+            select(CareSession.start_time, Senior.nursing_home_id, AIReport.keywords)
+            .join(CareSession, AIReport.care_session_id == CareSession.id)
+            .join(Senior, CareSession.senior_id == Senior.id)
+            .where(
+                CareSession.start_time >= start_date,
+                CareSession.start_time < end_date + timedelta(days=1),
+                AIReport.keywords.isnot(None)
+            )
+        )
+        deltas = defaultdict(int)
+        reports = 0
+        for row in result:
+            for keyword in set(row.keywords or []):
+                deltas[(row.start_time.date(), row.nursing_home_id or 0, keyword)] += 1
+            reports += 1
+
+        await self._apply(deltas)
+        await self.db.commit()
+        return {"start_date": start_date, "end_date": end_date, "reports": reports}
+
+    async def _session_buckets(self, care_session_ids: List[int]) -> Dict[int, Tuple[date, int]]:
+        """케어 세션별 (세션 일자, 요양원 ID)"""
+        if not care_session_ids:
+            return {}
+        result = await self.db.execute(
+            select(CareSession.id, CareSession.start_time, Senior.nursing_home_id)
+            .join(Senior, CareSession.senior_id == Senior.id)
+            .where(CareSession.id.in_(set(care_session_ids)))
+        )
+        return {
+            row.id: (row.start_time.date(), row.nursing_home_id or 0)
+            for row in result
+        }
+
+    async def _apply(self, deltas: Dict[Tuple[date, int, str], int]):
+        """(일자, 요양원, 키워드)별 증감 반영 - 증가분은 upsert, 감소분은 UPDATE 를 각각 일괄 실행"""
+        increments = [
+            {"day": day, "nursing_home_id": home_id, "keyword": keyword, "count": delta}
+            for (day, home_id, keyword), delta in deltas.items() if delta > 0
+        ]
+        decrements = [
+            {"b_day": day, "b_home": home_id, "b_keyword": keyword, "b_delta": -delta}
+            for (day, home_id, keyword), delta in deltas.items() if delta < 0
+        ]
+
+        if increments:
+            await self.db.execute(self._increment_statement(), increments)
+        if decrements:
+            await self.db.execute(
+                update(KeywordDailyCount.__table__).where(
+                    KeywordDailyCount.day == bindparam("b_day"),
+                    KeywordDailyCount.nursing_home_id == bindparam("b_home"),
+                    KeywordDailyCount.keyword == bindparam("b_keyword")
+                ).values(count=KeywordDailyCount.count - bindparam("b_delta")),
+                decrements
+            )
+
+    def _increment_statement(self):
+        dialect_name = self.db.get_bind().dialect.name
+        if dialect_name not in ("postgresql", "sqlite"):
+            raise ValueError(f"키워드 카운터 upsert를 지원하지 않는 DB입니다: {dialect_name}")
+        insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+
+        stmt = insert(KeywordDailyCount.__table__)
+        return stmt.on_conflict_do_update(
+            index_elements=[KeywordDailyCount.day, KeywordDailyCount.nursing_home_id, KeywordDailyCount.keyword],
+            set_={"count": KeywordDailyCount.count + stmt.excluded["count"]}
+        )
@@ -0,0 +1,231 @@
+"""
+주간 체크리스트 점수 재집계 서비스
+
+checklist_responses ⋈ care_sessions 를 (시니어, 주) 단위 GROUP BY 한 번으로 집계하여
+weekly_checklist_scores 를 다시 만듭니다. 분석 누락/재실행/중간 실패로 누적값이
+어긋난 경우 세션을 하나씩 재분석하지 않고 기간 단위로 복구할 때 사용합니다.
+같은 기간이 걸친 달의 monthly_checklist_scores(장기 추이용 월간 사전 집계)도 함께 다시 만듭니다.
+
+점수 기준은 AIAnalysisTrigger._calculate_scores 와 동일합니다.
+    total_score = SUM(score_value), max_possible_score = 응답 수 × default_max_score
+"""
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select, delete, func, case, cast, Date, distinct
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import CareSession, ChecklistResponse, WeeklyChecklistScore, MonthlyChecklistScore
+from app.services.question_registry import question_registry
+from app.services.trend_statistics import TrendStatisticsService
+
+# 질문 카테고리 레지스트리가 반환하는 카테고리 (그 외/미분류는 general)
+SCORE_CATEGORIES = question_registry.categories
+
+def week_start_of(value: date) -> date:
+    """해당 날짜가 속한 주의 월요일"""
+    return value - timedelta(days=value.weekday())
+
+def month_start_of(value: date) -> date:
+    """해당 날짜가 속한 달의 1일"""
+    return value.replace(day=1)
+
+def next_month_start(value: date) -> date:
+    """다음 달 1일"""
+    return (value.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+def _period_start_expression(dialect_name: str, bucket: str):
+    """care_sessions.start_time 이 속한 일/주(월요일)/월(1일) 시작일 (DB 함수)"""
+    if dialect_name == "postgresql":
+        if bucket == "day":
+            return cast(CareSession.start_time, Date)
+        return cast(func.date_trunc(bucket, CareSession.start_time), Date)
+    if dialect_name == "sqlite":
+        if bucket == "day":
+            return func.date(CareSession.start_time)
+        if bucket == "week":
+            # 다음(또는 당일) 일요일로 이동 후 6일 전 = 월요일
+            return func.date(CareSession.start_time, "weekday 0", "-6 days")
+        return func.date(CareSession.start_time, "start of month")
+    raise ValueError(f"점수 집계를 지원하지 않는 DB입니다: {dialect_name}")
+
+def session_score_aggregate(
+    dialect_name: str,
+    bucket: str,
+    start: date,
+    end: date,
+    senior_ids: Optional[List[int]] = None
+):
+    """
+    [start, end) 세션의 응답 점수를 (시니어, 기간) 단위로 집계하는 쿼리
+
+    bucket: day, week, month (기간 시작일 컬럼명은 period_start)
+    care_sessions(senior_id, start_time) 인덱스 범위 스캔 한 번으로 계산됩니다.
+    """
+    period_start = _period_start_expression(dialect_name, bucket).label("period_start")
+    category = func.coalesce(ChecklistResponse.category, "general")
+
+    # 카테고리별 점수 합 (조건부 집계)
+    category_columns = [_category_sum(category, name) for name in SCORE_CATEGORIES]
+
+    query = select(
+        CareSession.senior_id,
+        period_start,
+        func.max(CareSession.caregiver_id).label("caregiver_id"),
+        func.sum(ChecklistResponse.score_value).label("total_score"),
+        func.count(ChecklistResponse.id).label("response_count"),
+        func.count(distinct(CareSession.id)).label("checklist_count"),
+        *category_columns
+    ).join(
+        CareSession, ChecklistResponse.care_session_id == CareSession.id
+    ).where(
+        ChecklistResponse.score_value.isnot(None),
+        CareSession.start_time >= start,
+        CareSession.start_time < end
+    )
+
+    if senior_ids:
+        query = query.where(CareSession.senior_id.in_(senior_ids))
+
+    return query.group_by(CareSession.senior_id, period_start).order_by(CareSession.senior_id, period_start)
+
+def _category_sum(category, name: str):
+    if name == "general":
+        matches = category.notin_(SCORE_CATEGORIES[:-1])
+    else:
+        matches = category == name
+    return func.sum(case((matches, ChecklistResponse.score_value), else_=0)).label(f"category_{name}")
+
+def aggregate_row_values(row) -> Dict[str, Any]:
+    """집계 행 → 기간 시작일, 점수 합/만점/점수율, 체크리스트 수, 카테고리별 점수"""
+    period_start = row.period_start
+    if isinstance(period_start, str):
+        period_start = date.fromisoformat(period_start)
+
+    total_score = int(row.total_score or 0)
+    max_possible = row.response_count * settings.default_max_score
+
+    return {
+        "period_start": period_start,
+        "total_score": total_score,
+        "max_possible_score": max_possible,
+        "score_percentage": round(total_score / max_possible * 100, 2) if max_possible > 0 else 0,
+        "checklist_count": row.checklist_count,
+        "score_breakdown": {
+            name: int(getattr(row, f"category_{name}") or 0)
+            for name in SCORE_CATEGORIES
+            if getattr(row, f"category_{name}")
+        }
+    }
+
+class WeeklyScoreRebuilder:
+    def __init__(self, db: AsyncSession, chunk_size: int = 1000):
+        self.db = db
+        self.chunk_size = chunk_size
+
+    async def rebuild(
+        self,
+        start_date: date,
+        end_date: date,
+        senior_ids: Optional[List[int]] = None,
+        commit: bool = True
+    ) -> Dict[str, Any]:
+        """
+        기간 내 주간 점수 재집계 (시작/종료일이 속한 주 전체 포함, 단일 트랜잭션)
+        시작/종료일이 속한 달 전체의 월간 점수도 함께 재집계합니다.
+        commit=False 면 호출 측 트랜잭션에서 다른 변경과 함께 커밋합니다.
+
+        Returns:
+            재집계 범위와 삭제/생성된 주간/월간 행 수
+        """
+        week_from = week_start_of(start_date)
+        week_to = week_start_of(end_date)
+
+        # 1. 범위 내 기존 주간 행 삭제 (응답이 없어진 주도 정리)
+        delete_stmt = delete(WeeklyChecklistScore).where(
+            WeeklyChecklistScore.week_start_date >= week_from,
+            WeeklyChecklistScore.week_start_date <= week_to
+        )
+        if senior_ids:
+            delete_stmt = delete_stmt.where(WeeklyChecklistScore.senior_id.in_(senior_ids))
+        deleted = (await self.db.execute(delete_stmt)).rowcount
+
+        # 2. (시니어, 주) 단위 집계를 청크로 스트리밍하며 일괄 INSERT
+        #    (재집계 시각을 기록해 합계가 같아도 추이 분석 워터마크가 바뀌도록)
+        created = 0
+        rebuilt_at = datetime.now()
+        result = await self.db.stream(self._aggregate_query("week", week_from, week_to + timedelta(days=7), senior_ids))
+        async for rows in result.partitions(self.chunk_size):
+            await self.db.execute(
+                WeeklyChecklistScore.__table__.insert(),
+                [self._to_weekly_row(row, rebuilt_at) for row in rows]
+            )
+            created += len(rows)
+
+        # 3. 같은 기간이 걸친 달의 월간 사전 집계
+        monthly = await self._rebuild_monthly(month_start_of(start_date), month_start_of(end_date), senior_ids)
+
+        # 추이 누적 통계는 다음 조회/갱신 때 다시 계산
+        await TrendStatisticsService(self.db).invalidate(senior_ids)
+        if commit:
+            await self.db.commit()
+
+        return {
+            "week_from": week_from,
+            "week_to": week_to,
+            "senior_ids": senior_ids,
+            "deleted": deleted,
+            "created": created,
+            **monthly
+        }
+
+    async def _rebuild_monthly(self, month_from: date, month_to: date, senior_ids: Optional[List[int]]) -> Dict[str, Any]:
+        delete_stmt = delete(MonthlyChecklistScore).where(
+            MonthlyChecklistScore.month_start >= month_from,
+            MonthlyChecklistScore.month_start <= month_to
+        )
+        if senior_ids:
+            delete_stmt = delete_stmt.where(MonthlyChecklistScore.senior_id.in_(senior_ids))
+        deleted = (await self.db.execute(delete_stmt)).rowcount
+
+        created = 0
+        result = await self.db.stream(self._aggregate_query("month", month_from, next_month_start(month_to), senior_ids))
+        async for rows in result.partitions(self.chunk_size):
+            await self.db.execute(
+                MonthlyChecklistScore.__table__.insert(),
+                [self._to_monthly_row(row) for row in rows]
+            )
+            created += len(rows)
+
+        return {
+            "month_from": month_from,
+            "month_to": month_to,
+            "monthly_deleted": deleted,
+            "monthly_created": created
+        }
+
+    def _aggregate_query(self, bucket: str, start: date, end: date, senior_ids: Optional[List[int]]):
+        return session_score_aggregate(self.db.get_bind().dialect.name, bucket, start, end, senior_ids)
+
+    def _to_weekly_row(self, row, rebuilt_at: datetime) -> Dict[str, Any]:
+        values = aggregate_row_values(row)
+        week_start = values.pop("period_start")
+
+        return {
+            "senior_id": row.senior_id,
+            "caregiver_id": row.caregiver_id,
+            "week_start_date": week_start,
+            "week_end_date": week_start + timedelta(days=6),
+            **values,
+            "trend_indicator": "stable",
+            "updated_at": rebuilt_at
+        }
+
+    def _to_monthly_row(self, row) -> Dict[str, Any]:
+        values = aggregate_row_values(row)
+
+        return {
+            "senior_id": row.senior_id,
+            "month_start": values.pop("period_start"),
+            **values
+        }
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+HTTP AI 제공자 벤치마크/동작 검증 (로컬 스텁 서버 사용)
+
+프로세스 내에서 ai_stub_server 스텁을 띄우고 HTTPAIProvider 로
+    1. 결과가 템플릿 분석과 동일한지
+    2. 동시 세션 분석 시 묶음 전송(batch) 유무에 따른 소요 시간/호출 수
+    3. 타임아웃 → 재시도 후 실패
+    4. 연속 실패 시 회로 차단(즉시 실패)
+를 확인합니다.
+
+사용법:
+    python benchmark_ai_provider.py --sessions 200 --latency-ms 100
+"""
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import uvicorn
+
+from ai_stub_server import create_stub_app
+from app.services.ai_provider import (
+    AIProviderError, AIProviderUnavailable, CircuitBreaker, HTTPAIProvider, TemplateAIProvider,
+    build_analysis_request
+)
+
+QUESTION_KEYS = ["meal_intake", "sleep_quality", "mood_state", "pain_discomfort", "social_interaction"]
+ANSWERS = [True, False, 2, 4, "잘 주무심", "보통"]
+NOTES = ["오늘 가족 이야기를 많이 하셨어요", "무릎이 아프다고 하심", "산책 후 기분 좋아하심", "특이사항 없음"]
+
+def make_requests(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    requests = []
+    for i in range(count):
+        responses = [
+            SimpleNamespace(question_key=key, answer=rng.choice(ANSWERS), notes=None, score_value=rng.randint(1, 5))
+            for key in QUESTION_KEYS
+        ]
+        notes = [SimpleNamespace(content=rng.choice(NOTES)) for _ in range(rng.randint(0, 3))]
+        total = sum(response.score_value for response in responses)
+        previous = [{"week_start": "2025-01-06", "score_percentage": rng.uniform(40, 90)}]
+        requests.append(build_analysis_request(
+            i + 1, SimpleNamespace(name=f"시니어{i}"), responses, notes, previous,
+            total, total / (len(responses) * 5) * 100
+        ))
+    return requests
+
+async def start_stub(port: int, **options):
+    server = uvicorn.Server(uvicorn.Config(
+        create_stub_app(**options), host="127.0.0.1", port=port, log_level="warning"
+    ))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return server, task
+
+async def run_concurrent(provider: HTTPAIProvider, requests):
+    started = time.perf_counter()
+    results = await asyncio.gather(*(provider.analyze(request) for request in requests))
+    return results, time.perf_counter() - started
+
+async def main():
+    parser = argparse.ArgumentParser(description="HTTP AI 제공자 벤치마크")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--latency-ms", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--port", type=int, default=18001)
+    args = parser.parse_args()
+
+    failures = []
+    requests = make_requests(args.sessions)
+    expected = await TemplateAIProvider().analyze_batch(requests)
+
+    healthy = await start_stub(args.port, latency_ms=args.latency_ms)
+    slow = await start_stub(args.port + 1, latency_ms=500)
+    broken = await start_stub(args.port + 2, fail_rate=1.0)
+    base = "http://127.0.0.1"
+
+    try:
+        # 1~2. 묶음 전송 vs 세션별 전송
+        for label, batch_size in (("batch", args.batch_size), ("no batch", 1)):
+            provider = HTTPAIProvider(
+                f"{base}:{args.port}", batch_size=batch_size, batch_window_ms=20, max_connections=20
+            )
+            results, elapsed = await run_concurrent(provider, requests)
+            print(f"{label:<9} 세션 {args.sessions}건: {elapsed:6.2f}초, HTTP 호출 {provider.calls}회")
+            if results != expected:
+                failures.append(f"{label} 결과가 템플릿 분석과 다름")
+            await provider.close()
+        print(f"직렬 호출 예상: {args.sessions * args.latency_ms / 1000:.2f}초 (세션당 {args.latency_ms}ms)")
+
+        # 3. 타임아웃 후 재시도
+        provider = HTTPAIProvider(f"{base}:{args.port + 1}", timeout=0.1, max_retries=2, retry_backoff=0.05)
+        try:
+            await provider.analyze_batch(requests[:1])
+            failures.append("타임아웃이 발생하지 않음")
+        except AIProviderError as e:
+            print(f"타임아웃: 호출 {provider.calls}회 후 실패 ({type(e).__name__})")
+            if provider.calls != 3:
+                failures.append(f"타임아웃 재시도 횟수 {provider.calls - 1} (기대값 2)")
+        await provider.close()
+
+        # 4. 회로 차단
+        provider = HTTPAIProvider(
+            f"{base}:{args.port + 2}", max_retries=0, circuit_breaker=CircuitBreaker(3, reset_timeout=60)
+        )
+        for _ in range(3):
+            try:
+                await provider.analyze_batch(requests[:1])
+            except AIProviderError:
+                pass
+        started = time.perf_counter()
+        try:
+            await provider.analyze_batch(requests[:1])
+            failures.append("회로 차단 후에도 호출됨")
+        except AIProviderUnavailable:
+            print(f"회로 차단: {provider.breaker.state}, 즉시 실패 {(time.perf_counter() - started) * 1000:.2f}ms, HTTP 호출 {provider.calls}회")
+            if provider.calls != 3:
+                failures.append(f"차단 후 HTTP 호출 발생 ({provider.calls}회)")
+        await provider.close()
+    finally:
+        # 처리 중인 스텁 요청이 끝난 뒤 종료
+        await asyncio.sleep(0.6)
+        for server, _ in (healthy, slow, broken):
+            server.should_exit = True
+        await asyncio.gather(*(task for _, task in (healthy, slow, broken)))
+
+    if failures:
+        print("❌ " + ", ".join(failures))
+        sys.exit(1)
+    print("✅ HTTP AI 제공자 동작이 기대와 일치합니다")
+
+if __name__ == "__main__":
+    asyncio.run(main())
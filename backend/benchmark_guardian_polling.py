@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+가디언 홈 폴링 부하 벤치마크 (동기 세션 vs 비동기 세션)
+
+동시에 여러 가디언이 /api/guardian/home 을 폴링할 때의 응답 지연(p50/p95/p99)을
+기존 동기 SessionLocal 경로(before)와 AsyncSession 경로(after)로 비교합니다.
+
+사용법:
+    python benchmark_guardian_polling.py --guardians 50 --concurrency 50 --requests 2000
+    python benchmark_guardian_polling.py --database-url postgresql://... --skip-seed
+
+시드 단계는 테이블을 지우고 다시 만들므로 기본은 임시 SQLite DB 에서 실행하며 내보낸 DATABASE_URL 은
+사용하지 않습니다. 데이터가 준비된 다른 DB 는 --database-url 과 --skip-seed 를 함께 지정할 때만 사용합니다.
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from datetime import datetime, timedelta
+
+# 앱 설정을 읽기 전에 대상 DB 결정 (실제 DB 를 drop_all 하지 않도록 기본은 임시 파일)
+_database_url_parser = argparse.ArgumentParser(add_help=False)
+_database_url_parser.add_argument("--database-url")
+DATABASE_URL = _database_url_parser.parse_known_args()[0].database_url
+TEMP_DB = None
+if DATABASE_URL is None:
+    _fd, TEMP_DB = tempfile.mkstemp(suffix=".db")
+    os.close(_fd)
+    DATABASE_URL = f"sqlite:///{TEMP_DB}"
+os.environ["DATABASE_URL"] = DATABASE_URL
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from fastapi import FastAPI, Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import Base, engine, SessionLocal, async_engine
+from app.models import (
+    User, Guardian, Caregiver, Senior, CareSession, AIReport, Notification
+)
+from app.routers import guardian
+from app.schemas import GuardianHomeResponse
+from app.services.auth import create_access_token, security
+
+def seed(guardian_count: int, reports_per_senior: int):
+    """벤치마크용 데이터 생성 (임시 DB 에서만 - 전체 테이블 삭제 후 재생성)"""
+    if TEMP_DB is None:
+        raise RuntimeError("벤치마크 시드는 임시 SQLite DB 에서만 실행합니다 (--database-url 은 --skip-seed 와 함께 사용)")
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        caregiver_user = User(user_code="BCG001", user_type="caregiver", password_hash="x")
+        db.add(caregiver_user)
+        db.flush()
+        caregiver = Caregiver(user_id=caregiver_user.id, name="벤치케어기버")
+        db.add(caregiver)
+        db.flush()
+
+        now = datetime.utcnow()
+        for i in range(guardian_count):
+            user = User(user_code=f"BGD{i:05d}", user_type="guardian", password_hash="x")
+            db.add(user)
+            db.flush()
+            profile = Guardian(user_id=user.id, name=f"가디언{i}")
+            db.add(profile)
+            db.flush()
+
+            senior = Senior(name=f"시니어{i}", caregiver_id=caregiver.id, guardian_id=profile.id)
+            db.add(senior)
+            db.flush()
+
+            for day in range(reports_per_senior):
+                session = CareSession(
+                    caregiver_id=caregiver.id,
+                    senior_id=senior.id,
+                    start_time=now - timedelta(days=day),
+                    status="completed"
+                )
+                db.add(session)
+                db.flush()
+                db.add(AIReport(care_session_id=session.id, content="리포트", keywords=["건강함"]))
+                db.add(Notification(
+                    sender_id=caregiver_user.id, receiver_id=user.id,
+                    type="report", title="새 리포트", content="리포트가 생성되었습니다"
+                ))
+        db.commit()
+    finally:
+        db.close()
+
+def get_sync_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def get_current_user_sync(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_sync_db)
+):
+    """변경 전 인증 경로 (동기 쿼리)"""
+    payload = jwt.decode(credentials.credentials, settings.secret_key, algorithms=[settings.algorithm])
+    user = db.query(User).filter(User.user_code == payload.get("sub")).first()
+    if user is None:
+        raise HTTPException(status_code=401)
+    return user
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(guardian.router, prefix="/api/guardian")
+
+    @app.get("/before/guardian/home", response_model=GuardianHomeResponse)
+    async def guardian_home_before(
+        current_user: User = Depends(get_current_user_sync),
+        db: Session = Depends(get_sync_db)
+    ):
+        """변경 전 가디언 홈 (async def 안에서 동기 세션 사용 → 이벤트 루프 블로킹)"""
+        guardian_id = current_user.guardian_profile.id
+        seniors = db.query(Senior).filter(Senior.guardian_id == guardian_id).all()
+        senior_ids = [senior.id for senior in seniors]
+        recent_reports = db.query(AIReport).join(CareSession).filter(
+            CareSession.senior_id.in_(senior_ids)
+        ).order_by(AIReport.created_at.desc()).limit(10).all()
+        unread_notifications = db.query(Notification).filter(
+            Notification.receiver_id == current_user.id,
+            Notification.is_read == False
+        ).order_by(Notification.created_at.desc()).limit(10).all()
+        return GuardianHomeResponse(
+            guardian_name=current_user.guardian_profile.name,
+            seniors=seniors,
+            recent_reports=recent_reports,
+            unread_notifications=unread_notifications
+        )
+
+    return app
+
+async def run_load(app: FastAPI, path: str, tokens, concurrency: int, total: int):
+    """동시 폴링 부하 실행 후 요청별 지연(ms) 목록 반환"""
+    latencies = []
+    errors = 0
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(tokens[i % len(tokens)])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            nonlocal errors
+            while not queue.empty():
+                token = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(path, headers={"Authorization": f"Bearer {token}"})
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return latencies, errors, elapsed
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def report(label: str, latencies, errors: int, elapsed: float):
+    print(
+        f"{label:<8} p50={percentile(latencies, 50):8.2f}ms "
+        f"p95={percentile(latencies, 95):8.2f}ms "
+        f"p99={percentile(latencies, 99):8.2f}ms "
+        f"mean={statistics.mean(latencies):8.2f}ms "
+        f"rps={len(latencies) / elapsed:8.1f} errors={errors}"
+    )
+
+async def main():
+    try:
+        parser = argparse.ArgumentParser(description="가디언 홈 폴링 p99 벤치마크")
+        parser.add_argument("--guardians", type=int, default=50)
+        parser.add_argument("--reports-per-senior", type=int, default=30)
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--skip-seed", action="store_true")
+        parser.add_argument("--database-url", help="데이터가 준비된 대상 DB (--skip-seed 필수, 기본: 임시 SQLite DB)")
+        args = parser.parse_args()
+        if args.database_url and not args.skip_seed:
+            parser.error("--database-url 은 --skip-seed 와 함께만 사용할 수 있습니다 (시드는 전체 테이블을 삭제합니다)")
+        if args.skip_seed and not args.database_url:
+            parser.error("--skip-seed 는 --database-url 로 데이터가 준비된 DB 를 지정할 때만 사용할 수 있습니다")
+
+        await run_benchmark(args)
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
+        if TEMP_DB is not None:
+            os.remove(TEMP_DB)
+
+async def run_benchmark(args):
+    if not args.skip_seed:
+        print("벤치마크 데이터 생성 중...")
+        seed(args.guardians, args.reports_per_senior)
+
+    tokens = [
+        create_access_token(data={"sub": f"BGD{i:05d}"}, expires_delta=timedelta(hours=1))
+        for i in range(args.guardians)
+    ]
+    app = build_app()
+
+    print(f"동시 접속 {args.concurrency}, 총 요청 {args.requests}")
+    before = await run_load(app, "/before/guardian/home", tokens, args.concurrency, args.requests)
+    report("before", *before)
+    after = await run_load(app, "/api/guardian/home", tokens, args.concurrency, args.requests)
+    report("after", *after)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+돌봄노트 어휘 매칭 벤치마크 (용어별 in 검사 vs Aho-Corasick 단일 순회)
+
+합성 돌봄노트 코퍼스에 대해
+    before: 키워드/코멘트/특이사항 생성이 각각 용어별로 노트를 다시 검사하던 방식
+    after:  care_note_matcher.scan 으로 노트당 한 번 순회
+의 처리량을 비교하고, 두 방식의 카테고리 판정이 일치하는지 검증합니다.
+
+사용법:
+    python benchmark_note_matcher.py --notes 1000000
+    python benchmark_note_matcher.py --notes 100000 --max-words 40 --seed 7
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.config import settings
+from app.services.note_matcher import AhoCorasickMatcher
+
+WORDS = [
+    "오늘", "어르신", "산책", "식사", "잘", "하셨습니다", "보심", "점심", "약", "복용", "낮잠",
+    "말씀", "하시며", "TV", "노래", "부르심", "창밖", "보시고", "조용히", "쉬셨습니다",
+    "가족", "자녀", "아프다고", "힘들어", "좋아하심", "기분", "이상한", "문제", "그리워",
+    "보고싶다고", "웃음", "기쁨", "행복", "즐거움"
+]
+
+def generate_notes(count: int, max_words: int, seed: int):
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(3, max_words))) for _ in range(count)]
+
+def legacy_scan(content: str, lexicon: dict) -> set:
+    """기존 방식: 분석 단계마다 카테고리별 용어를 in 으로 다시 검사"""
+    found = set()
+    for category, terms in lexicon.items():
+        content_lower = content.lower()
+        if any(term in content_lower for term in terms):
+            found.add(category)
+    return found
+
+def measure(label: str, func, notes):
+    started = time.perf_counter()
+    results = [func(note) for note in notes]
+    elapsed = time.perf_counter() - started
+    print(f"{label:<8} {elapsed:8.2f}초  {len(notes) / elapsed:12,.0f} 노트/초")
+    return results, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="돌봄노트 어휘 매칭 벤치마크")
+    parser.add_argument("--notes", type=int, default=1_000_000)
+    parser.add_argument("--max-words", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    lexicon = settings.care_note_lexicon
+    print(f"합성 노트 {args.notes:,}개 생성 중...")
+    notes = generate_notes(args.notes, args.max_words, args.seed)
+
+    started = time.perf_counter()
+    matcher = AhoCorasickMatcher(lexicon)
+    print(f"오토마톤 구성: {(time.perf_counter() - started) * 1000:.2f}ms, 카테고리 {len(lexicon)}개")
+
+    before, before_elapsed = measure("before", lambda note: legacy_scan(note, lexicon), notes)
+    after, after_elapsed = measure("after", matcher.scan, notes)
+    print(f"속도 향상: {before_elapsed / after_elapsed:.2f}x")
+
+    mismatches = sum(1 for legacy, scanned in zip(before, after) if legacy != scanned)
+    if mismatches:
+        print(f"❌ 카테고리 판정 불일치 {mismatches}건")
+        sys.exit(1)
+    print("✅ 모든 노트의 카테고리 판정이 일치합니다")
+
+if __name__ == "__main__":
+    main()
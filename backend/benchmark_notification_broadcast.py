@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+관리자 일괄 알림 전송 벤치마크 (사용자별 send_notification vs 청크 INSERT ... SELECT)
+
+대상 가디언 수만큼 사용자를 만든 뒤
+    before: 사용자마다 NotificationService.send_notification (사용자당 트랜잭션 1개)
+    after : NotificationBroadcaster (청크당 트랜잭션 1개, 백그라운드 실행)
+의 소요 시간/트랜잭션 수를 비교하고, 수신자별 알림이 정확히 한 건씩 생성되었는지 확인합니다.
+before 는 시간이 오래 걸리므로 --before-users 명만 측정합니다.
+테이블을 지우고 다시 만들므로 내보낸 DATABASE_URL 과 관계없이 임시 SQLite DB 에서만 실행합니다.
+
+사용법:
+    python benchmark_notification_broadcast.py --users 50000 --before-users 2000
+    python benchmark_notification_broadcast.py --users 50000 --chunk-size 10000
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+
+# 앱 설정을 읽기 전에 임시 DB 지정 (실제 DB 를 drop_all 하지 않도록)
+_fd, TEMP_DB = tempfile.mkstemp(suffix=".db")
+os.close(_fd)
+os.environ["DATABASE_URL"] = f"sqlite:///{TEMP_DB}"
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import delete, event, func, select
+
+from app.database import Base, engine, AsyncSessionLocal, async_engine
+from app.models import User, Notification, NotificationBroadcast
+from app.services.notification import NotificationService
+from app.services.notification_broadcast import NotificationBroadcaster, broadcast_progress
+
+def seed(user_count: int):
+    """관리자 1명 + 활성 가디언 사용자 생성"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(User.__table__.insert(), [
+            {"user_code": "BAD001", "user_type": "admin", "password_hash": "x", "is_active": True}
+        ] + [
+            {"user_code": f"BGD{i:06d}", "user_type": "guardian", "password_hash": "x", "is_active": True}
+            for i in range(user_count)
+        ])
+
+def count_commits():
+    """비동기 엔진의 커밋 횟수 카운터"""
+    commits = [0]
+
+    @event.listens_for(async_engine.sync_engine, "commit")
+    def on_commit(connection):
+        commits[0] += 1
+
+    return commits
+
+async def run_before(sender_id: int, limit: int):
+    """변경 전: 사용자마다 알림 1건 add + commit + refresh"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(User.id).where(
+            User.is_active == True, User.user_type == "guardian"
+        ).order_by(User.id).limit(limit))
+        service = NotificationService(db)
+        for receiver_id in result.scalars().all():
+            await service.send_notification(
+                sender_id=sender_id, receiver_id=receiver_id,
+                type="announcement", title="공지", content="벤치마크 공지입니다"
+            )
+
+async def run_after(sender_id: int, chunk_size: int):
+    """변경 후: 작업 등록 후 완료될 때까지 진행 상황 조회"""
+    broadcaster = NotificationBroadcaster(AsyncSessionLocal, chunk_size=chunk_size)
+    async with AsyncSessionLocal() as db:
+        broadcast = await broadcaster.submit(
+            db, sender_id=sender_id, type="announcement", title="공지",
+            content="벤치마크 공지입니다", user_type="guardian"
+        )
+        accepted = time.perf_counter()
+
+        while True:
+            await asyncio.sleep(0.05)
+            progress = broadcast_progress(await broadcaster.get(db, broadcast.id))
+            if progress["status"] in ("completed", "failed"):
+                break
+
+    return accepted, progress
+
+async def main():
+    parser = argparse.ArgumentParser(description="관리자 일괄 알림 전송 벤치마크")
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--before-users", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    try:
+        print(f"가디언 {args.users}명 생성 중...")
+        seed(args.users)
+        commits = count_commits()
+
+        async with AsyncSessionLocal() as db:
+            sender_id = await db.scalar(select(User.id).where(User.user_code == "BAD001"))
+
+        before_users = min(args.before_users, args.users)
+        commits[0] = 0
+        started = time.perf_counter()
+        await run_before(sender_id, before_users)
+        elapsed = time.perf_counter() - started
+        print(
+            f"before  {before_users}명 {elapsed:7.2f}초 커밋 {commits[0]}회 "
+            f"→ {args.users}명 환산 약 {elapsed / before_users * args.users:.0f}초"
+        )
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(Notification))
+            await db.commit()
+
+        commits[0] = 0
+        started = time.perf_counter()
+        accepted, progress = await run_after(sender_id, args.chunk_size)
+        elapsed = time.perf_counter() - started
+        print(
+            f"after   {progress['sent_count']}/{progress['total_count']}명 {elapsed:7.2f}초 "
+            f"(등록 응답 {(accepted - started) * 1000:.1f}ms) 커밋 {commits[0]}회 상태 {progress['status']}"
+        )
+
+        async with AsyncSessionLocal() as db:
+            received = await db.execute(select(
+                func.count(Notification.id), func.count(func.distinct(Notification.receiver_id))
+            ))
+            total, distinct = received.one()
+            broadcasts = await db.scalar(select(func.count(NotificationBroadcast.id)))
+        print(f"검증    알림 {total}건, 수신자 {distinct}명, 중복 {total - distinct}건, 작업 {broadcasts}건")
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
+        os.remove(TEMP_DB)
+
+if __name__ == "__main__":
+    asyncio.run(main())
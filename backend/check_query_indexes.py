@@ -0,0 +1,149 @@
+"""
+라우터 핫 경로 쿼리의 인덱스 사용 여부 검사 (EXPLAIN 기반)
+
+라우터/서비스에서 실행하는 쿼리와 같은 형태의 SELECT를 EXPLAIN 하여
+대상 테이블을 전체 스캔하는 쿼리가 있으면 실패(exit 1)합니다.
+
+사용법:
+    python check_query_indexes.py                      # 임시 SQLite DB (모델 인덱스 기준)
+    python check_query_indexes.py --database-url URL   # 마이그레이션이 적용된 DB 검사
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, date, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, select, func
+
+from app.database import Base
+from app.models import (
+    Senior, CareSession, ChecklistResponse, CareNote,
+    AIReport, Notification, WeeklyChecklistScore, MonthlyChecklistScore, SpecialNote, KeywordDailyCount,
+    TrendStatistic
+)
+
+def hot_path_queries():
+    """(이름, 쿼리) 목록 - 라우터/서비스의 실제 조회 조건과 동일"""
+    now = datetime.now()
+    four_weeks_ago = (now - timedelta(weeks=4)).date()
+    senior_ids = [1, 2, 3]
+
+    return [
+        ("caregiver.home 오늘 세션", select(CareSession).where(
+            CareSession.caregiver_id == 1,
+            CareSession.created_at >= date.today()
+        )),
+        ("caregiver.history 돌봄 이력", select(CareSession).where(
+            CareSession.caregiver_id == 1
+        ).order_by(CareSession.start_time.desc())),
+        ("caregiver/guardian 담당 시니어", select(Senior).where(Senior.guardian_id == 1)),
+        ("caregiver 담당 시니어", select(Senior).where(Senior.caregiver_id == 1)),
+        ("guardian.reports 리포트 목록", select(AIReport).join(CareSession).where(
+            CareSession.senior_id.in_(senior_ids)
+        ).order_by(AIReport.created_at.desc())),
+        ("읽지 않은 알림", select(Notification).where(
+            Notification.receiver_id == 1,
+            Notification.is_read == False
+        ).order_by(Notification.created_at.desc()).limit(10)),
+        ("알림 미읽음 수", select(func.count(Notification.id)).where(
+            Notification.receiver_id == 1,
+            Notification.is_read == False
+        )),
+        ("ai 세션 리포트 존재 확인", select(AIReport).where(AIReport.care_session_id == 1)),
+        ("ai 체크리스트 응답", select(ChecklistResponse).where(ChecklistResponse.care_session_id == 1)),
+        ("ai 돌봄노트", select(CareNote).where(CareNote.care_session_id == 1)),
+        ("주간 점수 4주 추이", select(WeeklyChecklistScore).where(
+            WeeklyChecklistScore.senior_id == 1,
+            WeeklyChecklistScore.week_start_date >= four_weeks_ago
+        ).order_by(WeeklyChecklistScore.week_start_date)),
+        ("주간 점수 upsert 조회", select(WeeklyChecklistScore).where(
+            WeeklyChecklistScore.senior_id == 1,
+            WeeklyChecklistScore.week_start_date == four_weeks_ago
+        )),
+        ("최근 특이사항", select(SpecialNote).where(
+            SpecialNote.senior_id == 1
+        ).order_by(SpecialNote.created_at.desc()).limit(5)),
+        ("인기 키워드 전체", select(KeywordDailyCount.keyword, func.sum(KeywordDailyCount.count)).where(
+            KeywordDailyCount.day >= four_weeks_ago
+        ).group_by(KeywordDailyCount.keyword)),
+        ("인기 키워드 요양원별", select(KeywordDailyCount.keyword, func.sum(KeywordDailyCount.count)).where(
+            KeywordDailyCount.nursing_home_id == 1,
+            KeywordDailyCount.day >= four_weeks_ago
+        ).group_by(KeywordDailyCount.keyword)),
+        ("추이 누적 통계", select(TrendStatistic).where(
+            TrendStatistic.senior_id == 1
+        ).order_by(TrendStatistic.id)),
+        ("월간 점수 1년 추이", select(MonthlyChecklistScore).where(
+            MonthlyChecklistScore.senior_id == 1,
+            MonthlyChecklistScore.month_start >= (now - timedelta(weeks=52)).date()
+        ).order_by(MonthlyChecklistScore.month_start)),
+    ]
+
+def explain(connection, statement):
+    """쿼리 실행 계획을 줄 단위 문자열 목록으로 반환"""
+    compiled = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").fetchall()
+        return [row[-1] for row in rows]
+    rows = connection.exec_driver_sql(f"EXPLAIN {compiled}").fetchall()
+    return [row[0] for row in rows]
+
+# 인덱스 없이 테이블 전체를 읽는 계획
+FULL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"^SCAN (\w+)(?!.*USING (COVERING )?INDEX)"),
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+}
+
+def find_full_scans(dialect_name: str, plan):
+    pattern = FULL_SCAN_PATTERNS[dialect_name]
+    return [line for line in plan if pattern.search(line.strip())]
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 경로 쿼리 인덱스 사용 검사")
+    parser.add_argument("--database-url", help="검사할 DB URL (기본: 모델로 생성한 임시 SQLite DB)")
+    parser.add_argument("--verbose", action="store_true", help="모든 실행 계획 출력")
+    args = parser.parse_args()
+
+    temp_path = None
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        fd, temp_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        engine = create_engine(f"sqlite:///{temp_path}")
+        Base.metadata.create_all(bind=engine)
+
+    failures = []
+    try:
+        with engine.connect() as connection:
+            if connection.dialect.name == "postgresql":
+                # 빈 테이블에서는 플래너가 순차 스캔을 선호하므로 인덱스 사용 가능 여부만 확인
+                connection.exec_driver_sql("SET enable_seqscan = off")
+
+            for name, statement in hot_path_queries():
+                plan = explain(connection, statement)
+                full_scans = find_full_scans(connection.dialect.name, plan)
+                mark = "FAIL" if full_scans else "OK  "
+                print(f"[{mark}] {name}")
+                if full_scans or args.verbose:
+                    for line in plan:
+                        print(f"         {line}")
+                if full_scans:
+                    failures.append(name)
+    finally:
+        engine.dispose()
+        if temp_path:
+            os.remove(temp_path)
+
+    print()
+    if failures:
+        print(f"❌ 인덱스를 사용하지 않는 쿼리 {len(failures)}개: {', '.join(failures)}")
+        sys.exit(1)
+    print("✅ 모든 핫 경로 쿼리가 인덱스를 사용합니다")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+관계 로딩 정책 검사 (strict_loading)
+
+app/loaders.py 의 정책을 적용한 엔드포인트를 raiseload 모드(enable_strict_loading)에서
+임시 SQLite DB 로 호출하여, 정책에 없는 관계를 지연 로딩하는 곳이 있으면 실패(exit 1)합니다.
+N+1 회귀를 CI 에서 잡기 위한 검사입니다.
+
+사용법:
+    python check_strict_loading.py
+"""
+import os
+import sys
+import asyncio
+import tempfile
+from datetime import datetime, timedelta
+
+_fd, TEMP_DB = tempfile.mkstemp(suffix=".db")
+os.close(_fd)
+os.environ["DATABASE_URL"] = f"sqlite:///{TEMP_DB}"
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from fastapi import FastAPI
+
+from app.database import Base, engine, SessionLocal, AsyncSessionLocal, async_engine
+from app.loaders import enable_strict_loading
+from app.models import User, Caregiver, Guardian, Senior, CareSession, AIReport, Notification
+from app.routers import caregiver, guardian
+from app.services.auth import authenticate_user, create_access_token, get_password_hash, invalidate_user_cache
+
+PASSWORD = "strict-check"
+
+def seed() -> int:
+    """케어기버/가디언/시니어 각 1명과 오늘 세션, 리포트, 알림 생성 (리포트 ID 반환)"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        caregiver_user = User(user_code="SCG001", user_type="caregiver", password_hash=get_password_hash(PASSWORD))
+        guardian_user = User(user_code="SGD001", user_type="guardian", password_hash="x")
+        db.add_all([caregiver_user, guardian_user])
+        db.flush()
+        caregiver_profile = Caregiver(user_id=caregiver_user.id, name="검사케어기버")
+        guardian_profile = Guardian(user_id=guardian_user.id, name="검사가디언")
+        db.add_all([caregiver_profile, guardian_profile])
+        db.flush()
+
+        senior = Senior(name="검사시니어", caregiver_id=caregiver_profile.id, guardian_id=guardian_profile.id)
+        db.add(senior)
+        db.flush()
+        session = CareSession(
+            caregiver_id=caregiver_profile.id,
+            senior_id=senior.id,
+            start_time=datetime.now(),
+            status="completed"
+        )
+        db.add(session)
+        db.flush()
+        report = AIReport(care_session_id=session.id, content="리포트", keywords=["건강함"])
+        db.add(report)
+        db.add(Notification(
+            sender_id=guardian_user.id, receiver_id=caregiver_user.id,
+            type="feedback", title="피드백", content="확인 부탁드립니다"
+        ))
+        db.commit()
+        return report.id
+    finally:
+        db.close()
+
+def headers(user_code: str) -> dict:
+    return {"Authorization": "Bearer " + create_access_token({"sub": user_code}, timedelta(minutes=5))}
+
+async def run_checks(report_id: int):
+    """(이름, 실패 사유 또는 None) 목록"""
+    app = FastAPI()
+    app.include_router(caregiver.router, prefix="/api/caregiver")
+    app.include_router(guardian.router, prefix="/api/guardian")
+
+    results = []
+    try:
+        user = await _authenticate()
+        results.append(("auth 로그인 (user_with_profiles)", None if user else "인증 실패"))
+
+        endpoints = [
+            ("caregiver.home (columns_only)", "SCG001", "/api/caregiver/home"),
+            ("guardian.reports 상세 (report_with_session)", "SGD001", f"/api/guardian/reports/{report_id}"),
+        ]
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+            for name, user_code, path in endpoints:
+                # 인증 캐시를 비워 매 요청이 프로필 로딩 정책까지 거치도록 함
+                invalidate_user_cache(user_code)
+                response = await client.get(path, headers=headers(user_code))
+                error = None if response.status_code == 200 else f"{response.status_code} {response.text[:300]}"
+                results.append((name, error))
+    finally:
+        await async_engine.dispose()
+    return results
+
+async def _authenticate():
+    async with AsyncSessionLocal() as db:
+        user = await authenticate_user(db, "SCG001", PASSWORD)
+        # 로그인 응답에서 사용하는 프로필 관계 접근
+        return user and user.caregiver_profile
+
+def main():
+    try:
+        report_id = seed()
+        enable_strict_loading()
+        results = asyncio.run(run_checks(report_id))
+    finally:
+        engine.dispose()
+        os.remove(TEMP_DB)
+
+    failures = []
+    for name, error in results:
+        print(f"[{'FAIL' if error else 'OK  '}] {name}")
+        if error:
+            print(f"         {error}")
+            failures.append(name)
+
+    print()
+    if failures:
+        print(f"❌ strict_loading 에서 실패한 엔드포인트 {len(failures)}개: {', '.join(failures)}")
+        sys.exit(1)
+    print("✅ 모든 로딩 정책 적용 엔드포인트가 추가 지연 로딩 없이 응답합니다")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+케어 세션 일괄 재분석 명령
+
+점수 규칙/키워드 로직 변경 후 기간 또는 시니어 단위로 과거 세션을 다시 분석합니다.
+점수 계산은 프로세스 풀에서 병렬 실행하고, 결과는 배치 트랜잭션으로 저장합니다.
+중단된 경우 같은 조건으로 --resume 을 주면 마지막 완료 배치 이후부터 이어서 실행합니다.
+
+사용법:
+    python reanalyze_sessions.py --start 2025-01-01 --end 2025-06-30
+    python reanalyze_sessions.py --senior-ids 1 2 3 --workers 4 --batch-size 1000
+    python reanalyze_sessions.py --start 2025-01-01 --end 2025-06-30 --resume
+"""
+import os
+import sys
+import asyncio
+import argparse
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.services.batch_reanalysis import BatchReanalyzer
+
+def print_progress(progress: dict):
+    eta = f"{progress['eta_seconds']:.0f}초" if progress["eta_seconds"] is not None else "-"
+    print(
+        f"[{progress['processed']}/{progress['total']}] {progress['percent']}% "
+        f"- {progress['sessions_per_second']} 세션/초, 남은 시간 {eta}",
+        flush=True
+    )
+
+async def main():
+    parser = argparse.ArgumentParser(description="케어 세션 일괄 재분석")
+    parser.add_argument("--start", type=date.fromisoformat, help="세션 시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="세션 종료일 (YYYY-MM-DD)")
+    parser.add_argument("--senior-ids", type=int, nargs="*", help="대상 시니어 ID (생략 시 전체)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="점수 계산 프로세스 수")
+    parser.add_argument("--batch-size", type=int, default=500, help="트랜잭션당 세션 수")
+    parser.add_argument("--chunk-size", type=int, default=50, help="프로세스 작업 단위 세션 수")
+    parser.add_argument("--checkpoint", default="reanalysis_checkpoint.json", help="체크포인트 파일 경로")
+    parser.add_argument("--resume", action="store_true", help="체크포인트 이후부터 이어서 실행")
+    parser.add_argument("--force", action="store_true", help="입력 지문이 같은 세션도 다시 분석")
+    args = parser.parse_args()
+
+    if args.start and args.end and args.start > args.end:
+        parser.error("--start 는 --end 보다 이전이어야 합니다")
+    if not (args.start or args.end or args.senior_ids):
+        parser.error("--start/--end 또는 --senior-ids 중 하나 이상을 지정해야 합니다")
+
+    reanalyzer = BatchReanalyzer(
+        AsyncSessionLocal,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        chunk_size=args.chunk_size,
+        checkpoint_path=args.checkpoint,
+        progress=print_progress,
+        force=args.force
+    )
+
+    try:
+        result = await reanalyzer.run(args.start, args.end, args.senior_ids, resume=args.resume)
+    finally:
+        await async_engine.dispose()
+
+    print(f"재분석 완료: 세션 {result['sessions']}개, 응답 {result['responses']}개")
+    if result["unchanged"]:
+        print(f"- 입력 변경이 없어 건너뛴 세션: {result['unchanged']}개")
+    if result["skipped_by_resume"]:
+        print("- 체크포인트 이후 세션만 처리했습니다")
+    if result["weekly_scores"]:
+        weekly = result["weekly_scores"]
+        print(f"- 주간 점수 재집계: {weekly['week_from']} ~ {weekly['week_to']} 주, {weekly['created']}행")
+    print(f"- 소요 시간: {result['elapsed_seconds']}초")
+    print(f"- 처리량: {result['sessions_per_second']} 세션/초, {result['responses_per_second']} 응답/초")
+
+if __name__ == "__main__":
+    asyncio.run(main())
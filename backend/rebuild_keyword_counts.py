@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+인기 키워드 일자별 카운터 재집계 명령
+
+ai_reports.keywords 를 케어 세션 일자/요양원 단위로 집계하여
+기간 내 keyword_daily_counts 를 다시 만듭니다. (테이블 최초 적재 또는 불일치 복구)
+
+사용법:
+    python rebuild_keyword_counts.py --start 2025-01-01 --end 2025-12-31
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.services.trending_keywords import TrendingKeywordService
+
+async def main():
+    parser = argparse.ArgumentParser(description="인기 키워드 카운터 재집계")
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, required=True, help="종료일 (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    if args.start > args.end:
+        parser.error("--start 는 --end 보다 이전이어야 합니다")
+
+    started = time.perf_counter()
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await TrendingKeywordService(db).rebuild(args.start, args.end)
+    finally:
+        await async_engine.dispose()
+
+    print(f"재집계 범위: {result['start_date']} ~ {result['end_date']}")
+    print(f"- 집계한 리포트: {result['reports']}")
+    print(f"- 소요 시간: {time.perf_counter() - started:.2f}초")
+
+if __name__ == "__main__":
+    asyncio.run(main())
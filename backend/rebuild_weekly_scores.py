@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+주간 체크리스트 점수 재집계 명령
+
+checklist_responses 를 (시니어, 주) 단위로 한 번에 집계하여
+기간 내 weekly_checklist_scores 와 해당 달의 monthly_checklist_scores 를 다시 만듭니다.
+(월간 사전 집계 테이블을 처음 만든 뒤 기존 데이터 채우기에도 사용)
+
+사용법:
+    python rebuild_weekly_scores.py --start 2025-01-01 --end 2025-12-31
+    python rebuild_weekly_scores.py --start 2025-06-01 --end 2025-06-30 --senior-ids 1 2 3
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.services.weekly_rebuild import WeeklyScoreRebuilder
+
+async def main():
+    parser = argparse.ArgumentParser(description="주간 체크리스트 점수 재집계")
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, required=True, help="종료일 (YYYY-MM-DD)")
+    parser.add_argument("--senior-ids", type=int, nargs="*", help="대상 시니어 ID (생략 시 전체)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="INSERT 청크 크기")
+    args = parser.parse_args()
+
+    if args.start > args.end:
+        parser.error("--start 는 --end 보다 이전이어야 합니다")
+
+    started = time.perf_counter()
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await WeeklyScoreRebuilder(db, chunk_size=args.chunk_size).rebuild(
+                args.start, args.end, args.senior_ids
+            )
+    finally:
+        await async_engine.dispose()
+
+    print(f"재집계 범위: {result['week_from']} ~ {result['week_to']} 주")
+    print(f"- 삭제된 주간 행: {result['deleted']}")
+    print(f"- 생성된 주간 행: {result['created']}")
+    print(f"월간 재집계 범위: {result['month_from']} ~ {result['month_to']}")
+    print(f"- 삭제된 월간 행: {result['monthly_deleted']}")
+    print(f"- 생성된 월간 행: {result['monthly_created']}")
+    print(f"- 소요 시간: {time.perf_counter() - started:.2f}초")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+주간 점수 upsert 동시성 스트레스 테스트
+
+같은 시니어/같은 주의 케어 세션 분석 결과를 여러 세션(커넥션)에서 동시에
+AIAnalysisTrigger._update_weekly_score 로 누적한 뒤,
+주간 행이 하나뿐이고 합계가 유실 없이 누적되었는지 검증합니다.
+
+사용법:
+    python stress_weekly_score_upsert.py --sessions 200 --concurrency 20
+    DATABASE_URL=postgresql://... python stress_weekly_score_upsert.py
+"""
+import os
+import sys
+import asyncio
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+# DATABASE_URL 을 지정하지 않으면 임시 SQLite 파일 사용 (작업 디렉터리에 DB 파일을 남기지 않음)
+TEMP_DB = None
+if "DATABASE_URL" not in os.environ:
+    _fd, TEMP_DB = tempfile.mkstemp(suffix=".db")
+    os.close(_fd)
+    os.environ["DATABASE_URL"] = f"sqlite:///{TEMP_DB}"
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import select, delete
+
+from app.database import Base, engine, SessionLocal, AsyncSessionLocal, async_engine
+from app.models import User, Caregiver, Senior, CareSession, WeeklyChecklistScore
+from app.services.ai_trigger import AIAnalysisTrigger
+
+BREAKDOWN = {"health": 4, "mental": 3, "daily": 5}
+
+def seed(session_count: int):
+    """같은 주에 속한 케어 세션 생성"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        user = User(user_code=f"SCG{datetime.now():%H%M%S}", user_type="caregiver", password_hash="x")
+        db.add(user)
+        db.flush()
+        caregiver = Caregiver(user_id=user.id, name="스트레스케어기버")
+        db.add(caregiver)
+        db.flush()
+        senior = Senior(name="스트레스시니어", caregiver_id=caregiver.id)
+        db.add(senior)
+        db.flush()
+
+        week_start = datetime.now() - timedelta(days=datetime.now().weekday())
+        sessions = [
+            CareSession(
+                caregiver_id=caregiver.id,
+                senior_id=senior.id,
+                start_time=week_start + timedelta(hours=i % 24),
+                status="completed"
+            )
+            for i in range(session_count)
+        ]
+        db.add_all(sessions)
+        db.commit()
+        return senior.id, [session.id for session in sessions]
+    finally:
+        db.close()
+
+async def run_upsert(care_session_id: int, semaphore: asyncio.Semaphore, errors: list):
+    async with semaphore:
+        async with AsyncSessionLocal() as db:
+            try:
+                care_session = await db.get(CareSession, care_session_id)
+                await AIAnalysisTrigger(db)._update_weekly_score(
+                    care_session, sum(BREAKDOWN.values()), BREAKDOWN, len(BREAKDOWN)
+                )
+                # 주간 점수 갱신은 호출 측 트랜잭션에서 커밋 (analyze_care_session 과 동일)
+                await db.commit()
+            except Exception as e:
+                errors.append(f"{care_session_id}: {e}")
+
+async def main():
+    parser = argparse.ArgumentParser(description="주간 점수 upsert 동시성 테스트")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    senior_id, session_ids = seed(args.sessions)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    errors = []
+
+    try:
+        await asyncio.gather(*(run_upsert(sid, semaphore, errors) for sid in session_ids))
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(WeeklyChecklistScore).where(
+                WeeklyChecklistScore.senior_id == senior_id
+            ))
+            rows = result.scalars().all()
+
+            # 정리
+            await db.execute(delete(WeeklyChecklistScore).where(WeeklyChecklistScore.senior_id == senior_id))
+            await db.commit()
+    finally:
+        await async_engine.dispose()
+        if TEMP_DB is not None:
+            engine.dispose()
+            os.remove(TEMP_DB)
+
+    expected_total = sum(BREAKDOWN.values()) * args.sessions
+    expected_breakdown = {key: value * args.sessions for key, value in BREAKDOWN.items()}
+
+    print(f"세션 {args.sessions}개, 동시 실행 {args.concurrency}, 오류 {len(errors)}건")
+    for error in errors[:5]:
+        print(f"  - {error}")
+
+    failures = []
+    if len(rows) != 1:
+        failures.append(f"주간 행 수 {len(rows)} (기대값 1)")
+    else:
+        row = rows[0]
+        print(f"total_score={row.total_score} checklist_count={row.checklist_count} breakdown={row.score_breakdown}")
+        if row.total_score != expected_total:
+            failures.append(f"total_score {row.total_score} (기대값 {expected_total})")
+        if row.checklist_count != args.sessions:
+            failures.append(f"checklist_count {row.checklist_count} (기대값 {args.sessions})")
+        if {key: int(value) for key, value in row.score_breakdown.items()} != expected_breakdown:
+            failures.append(f"score_breakdown {row.score_breakdown} (기대값 {expected_breakdown})")
+    if errors:
+        failures.append(f"upsert 오류 {len(errors)}건")
+
+    if failures:
+        print("❌ " + ", ".join(failures))
+        sys.exit(1)
+    print("✅ 동시 upsert 누적 결과가 일치합니다")
+
+if __name__ == "__main__":
+    asyncio.run(main())